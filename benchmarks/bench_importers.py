@@ -0,0 +1,153 @@
+"""
+导入器吞吐量基准测试
+benchmarks/bench_importers.py
+
+对 USCImporter、QiangZhiImporter、ExcelImporter、TextImporter 分别测量：
+1. 解析耗时（多次运行取中位数）
+2. 解析过程中的峰值内存（tracemalloc）
+3. 解析后新增的对象数量（gc 跟踪的对象 / 已分配内存块）
+
+语料由 scripts/generate_benchmark_corpus.py 按规模生成
+
+用法：
+    python benchmarks/bench_importers.py
+    python benchmarks/bench_importers.py --sizes 50 5000 --repeat 3 --output result.json
+"""
+
+import argparse
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import PROJECT_ROOT, summarize, write_results
+
+sys.path.insert(0, str(PROJECT_ROOT / "scripts"))
+
+from generate_benchmark_corpus import (
+    DEFAULT_SIZES, generate_blocks, generate_excel, generate_qiangzhi_html, generate_text
+)
+
+
+def _importer_factories():
+    """(名称, 构造函数, 语料类型) 列表，导入失败的导入器会被跳过"""
+    factories = []
+    try:
+        from src.importers.usc_importer import USCImporter
+        from src.importers.qiangzhi_importer import QiangZhiImporter
+        factories.append(("USCImporter", USCImporter, "html"))
+        factories.append(("QiangZhiImporter", QiangZhiImporter, "html"))
+    except ImportError as e:
+        print(f"跳过 HTML 导入器: {e}")
+    try:
+        from src.importers.excel_importer import ExcelImporter
+        factories.append(("ExcelImporter", ExcelImporter, "excel"))
+    except ImportError as e:
+        print(f"跳过 Excel 导入器: {e}")
+    from src.importers.text_importer import TextImporter
+    factories.append(("TextImporter", TextImporter, "text"))
+    return factories
+
+
+def measure_parse(factory, content, repeat: int) -> dict:
+    """
+    测量单个导入器解析一份语料的各项指标
+
+    每次运行都使用新的导入器实例，与 MainWindow 中的用法一致
+    """
+    # 1. 耗时
+    samples = []
+    result = None
+    for _ in range(repeat):
+        importer = factory()
+        begin = time.perf_counter()
+        result = importer.parse(content)
+        samples.append((time.perf_counter() - begin) * 1000)
+    bases, details = result
+    del result
+
+    # 2. 新增对象数（保留解析结果，统计存活对象）
+    gc.collect()
+    objects_before = len(gc.get_objects())
+    blocks_before = sys.getallocatedblocks()
+    kept = factory().parse(content)
+    gc.collect()
+    objects_created = len(gc.get_objects()) - objects_before
+    blocks_created = sys.getallocatedblocks() - blocks_before
+    del kept
+
+    # 3. 峰值内存
+    gc.collect()
+    tracemalloc.start()
+    factory().parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "parse": summarize(samples),
+        "peak_memory_kb": round(peak / 1024, 1),
+        "retained_gc_objects": objects_created,
+        "retained_memory_blocks": blocks_created,
+        "course_bases": len(bases),
+        "course_details": len(details),
+    }
+
+
+def run(sizes, repeat: int, seed: int) -> list:
+    factories = _importer_factories()
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            blocks = generate_blocks(size, seed)
+            html = generate_qiangzhi_html(blocks)
+            corpus = {
+                "html": html,
+                "text": generate_text(blocks),
+                "excel": str(generate_excel(blocks, Path(tmp) / f"excel_{size}.xlsx")),
+            }
+
+            for name, factory, kind in factories:
+                content = corpus[kind]
+                try:
+                    metrics = measure_parse(factory, content, repeat)
+                except Exception as e:
+                    print(f"  {name:<18} {size:>6} 个课程块: 解析失败 ({e})")
+                    results.append({"importer": name, "blocks": size, "error": str(e)})
+                    continue
+
+                metrics.update({"importer": name, "blocks": size, "input_kb": _input_kb(kind, content)})
+                results.append(metrics)
+                print(f"  {name:<18} {size:>6} 个课程块: "
+                      f"{metrics['parse']['median_ms']:>9.1f} ms, "
+                      f"峰值 {metrics['peak_memory_kb']:>9.1f} KB, "
+                      f"新增对象 {metrics['retained_gc_objects']}")
+    return results
+
+
+def _input_kb(kind: str, content: str) -> float:
+    if kind == "excel":
+        return round(Path(content).stat().st_size / 1024, 1)
+    return round(len(content.encode("utf-8")) / 1024, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WakeUp 课表导入器吞吐量基准测试")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="语料的课程块数量")
+    parser.add_argument("--repeat", type=int, default=5, help="每个导入器重复解析的次数")
+    parser.add_argument("--seed", type=int, default=42, help="语料随机种子")
+    parser.add_argument("--output", help="结果 JSON 路径（默认写入 benchmarks/results/）")
+    args = parser.parse_args()
+
+    print("测量导入器吞吐量...")
+    results = run(args.sizes, args.repeat, args.seed)
+    path = write_results("importers", results, args.output)
+    print(f"结果已写入: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+启动时间与渲染性能基准测试
+benchmarks/bench_startup.py
+
+在离屏 Qt (QT_QPA_PLATFORM=offscreen) 下测量：
+1. 冷启动 / 热启动：从进程启动到 MainWindow 首次绘制的耗时和峰值内存
+2. ScheduleView.update_courses 首次渲染耗时
+3. 切换周次 (set_week + update_courses) 的延迟
+
+用法：
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --sizes 10 1000 --runs 3 --output result.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from common import (
+    DEFAULT_SIZES, current_rss_mb, make_synthetic_courses,
+    summarize, write_results
+)
+
+CHILD_FLAG = "--child-startup"
+
+
+def _child_startup():
+    """
+    子进程：启动 MainWindow 并等待首次绘制，以 JSON 输出测量结果
+
+    工作目录由父进程设为临时目录，避免读写用户的配置和课表
+    """
+    t0 = time.perf_counter()
+    from PyQt6.QtWidgets import QApplication
+    from src.ui.main_window import MainWindow
+    t_import = time.perf_counter()
+
+    app = QApplication([])
+    window = MainWindow()
+    t_window = time.perf_counter()
+
+    window.show()
+    deadline = time.perf_counter() + 5
+    while not window._first_painted and time.perf_counter() < deadline:
+        app.processEvents()
+    if not window._first_painted:
+        window.repaint()
+    t_paint = time.perf_counter()
+
+    print(json.dumps({
+        "import_ms": (t_import - t0) * 1000,
+        "window_ms": (t_window - t_import) * 1000,
+        "first_paint_ms": (t_paint - t0) * 1000,
+        "peak_rss_mb": current_rss_mb(),
+    }))
+
+
+def _run_startup(pycache_prefix: str, workdir: str) -> dict:
+    """启动一个子进程并返回其测量结果（附加父进程测得的总耗时）"""
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+    cmd = [sys.executable, "-X", f"pycache_prefix={pycache_prefix}", __file__, CHILD_FLAG]
+    begin = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=workdir, env=env, capture_output=True, text=True, timeout=120)
+    wall_ms = (time.perf_counter() - begin) * 1000
+    if proc.returncode != 0:
+        raise RuntimeError(f"启动子进程失败:\n{proc.stderr}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["process_wall_ms"] = wall_ms
+    return result
+
+
+def bench_startup(runs: int) -> dict:
+    """
+    冷启动：每次使用全新的字节码缓存目录（需要重新编译所有模块）
+    热启动：复用第一次运行生成的字节码缓存
+    """
+    cold, warm = [], []
+    with tempfile.TemporaryDirectory() as workdir:
+        for _ in range(runs):
+            with tempfile.TemporaryDirectory() as prefix:
+                cold.append(_run_startup(prefix, workdir))
+
+        with tempfile.TemporaryDirectory() as prefix:
+            _run_startup(prefix, workdir)  # 预热缓存
+            for _ in range(runs):
+                warm.append(_run_startup(prefix, workdir))
+
+    def _collect(samples):
+        return {
+            "first_paint": summarize([s["first_paint_ms"] for s in samples]),
+            "imports": summarize([s["import_ms"] for s in samples]),
+            "window_construct": summarize([s["window_ms"] for s in samples]),
+            "process_wall": summarize([s["process_wall_ms"] for s in samples]),
+            "peak_rss_mb": max((s["peak_rss_mb"] or 0) for s in samples),
+        }
+
+    return {"cold": _collect(cold), "warm": _collect(warm)}
+
+
+def bench_render(sizes, weeks: int) -> list:
+    """测量不同规模课表的首次渲染和切换周次延迟"""
+    from PyQt6.QtWidgets import QApplication
+    from src.models.time_slot import TimeSlot
+    from src.ui.schedule_view import ScheduleView
+
+    app = QApplication.instance() or QApplication([])
+    results = []
+
+    for size in sizes:
+        courses = make_synthetic_courses(size)
+        view = ScheduleView(TimeSlot.generate_default_time_slots())
+        view.resize(1200, 800)
+        view.show()
+        app.processEvents()
+
+        begin = time.perf_counter()
+        view.set_week(1)
+        view.update_courses(courses)
+        app.processEvents()
+        first_render_ms = (time.perf_counter() - begin) * 1000
+
+        samples = []
+        for week in range(2, weeks + 1):
+            begin = time.perf_counter()
+            view.set_week(week)
+            view.update_courses(courses)
+            app.processEvents()
+            samples.append((time.perf_counter() - begin) * 1000)
+
+        results.append({
+            "details": size,
+            "first_render_ms": round(first_render_ms, 3),
+            "week_switch": summarize(samples),
+            "peak_rss_mb": current_rss_mb(),
+        })
+        print(f"  {size:>6} 个课程块: 首次渲染 {first_render_ms:.1f} ms, "
+              f"切换周次中位数 {results[-1]['week_switch']['median_ms']:.1f} ms")
+
+        view.close()
+        view.deleteLater()
+        app.processEvents()
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="WakeUp 课表启动与渲染基准测试")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="合成课表的课程块数量")
+    parser.add_argument("--runs", type=int, default=5, help="冷/热启动各运行的次数")
+    parser.add_argument("--weeks", type=int, default=20, help="切换周次测试覆盖的周数")
+    parser.add_argument("--skip-startup", action="store_true", help="跳过启动测试")
+    parser.add_argument("--output", help="结果 JSON 路径（默认写入 benchmarks/results/）")
+    args = parser.parse_args()
+
+    results = {}
+    if not args.skip_startup:
+        print("测量冷/热启动...")
+        results["startup"] = bench_startup(args.runs)
+        for mode in ("cold", "warm"):
+            stats = results["startup"][mode]
+            print(f"  {mode}: 首次绘制中位数 {stats['first_paint']['median_ms']:.1f} ms, "
+                  f"峰值内存 {stats['peak_rss_mb']} MB")
+
+    print("测量渲染与切换周次...")
+    results["render"] = bench_render(args.sizes, args.weeks)
+
+    path = write_results("startup", results, args.output)
+    print(f"结果已写入: {path}")
+
+
+if __name__ == "__main__":
+    if CHILD_FLAG in sys.argv:
+        _child_startup()
+    else:
+        main()
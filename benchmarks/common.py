@@ -0,0 +1,156 @@
+"""
+基准测试公共工具
+benchmarks/common.py
+
+合成课表数据、内存测量和 JSON 结果输出
+"""
+
+import json
+import os
+import platform
+import random
+import sys
+import statistics
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+for _path in (PROJECT_ROOT, PROJECT_ROOT / "src"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+from src import __version__
+from src.models.course_base import CourseBase
+from src.models.course_detail import CourseDetail
+from src.models.week_type import WeekType
+
+# 标准规模：从单人课表到整个学院合并后的课表
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+
+_PALETTE = ["#FF8A80", "#FFD180", "#CCFF90", "#A7FFEB", "#80D8FF", "#B388FF"]
+_WEEK_TYPES = [WeekType.EVERY_WEEK, WeekType.EVERY_WEEK, WeekType.ODD_WEEK, WeekType.EVEN_WEEK]
+
+
+def make_synthetic_courses(
+    detail_count: int,
+    sections_per_day: int = 12,
+    max_week: int = 20,
+    seed: int = 42
+) -> List[Tuple[CourseBase, CourseDetail]]:
+    """
+    生成指定规模的合成课表
+
+    每 4 个课程块共用一门课程，教师和教室从有限的集合中选取，
+    结果与 MainWindow.courses 的格式一致
+
+    Args:
+        detail_count: 课程块数量
+        sections_per_day: 每天节数
+        max_week: 最大周次
+        seed: 随机种子（保证结果可复现）
+
+    Returns:
+        (CourseBase, CourseDetail) 元组列表
+    """
+    rng = random.Random(seed)
+    base_count = max(1, detail_count // 4)
+    bases = [
+        CourseBase(course_id=f"course-{i}", name=f"课程{i}", color=_PALETTE[i % len(_PALETTE)])
+        for i in range(base_count)
+    ]
+
+    courses = []
+    for i in range(detail_count):
+        base = bases[i % base_count]
+        step = rng.choice([1, 2, 2, 3])
+        start_section = rng.randint(1, sections_per_day - step + 1)
+        start_week = rng.randint(1, max_week // 2)
+        end_week = rng.randint(start_week, max_week)
+        detail = CourseDetail(
+            course_id=base.course_id,
+            teacher=f"教师{rng.randrange(max(1, detail_count // 8))}",
+            location=f"教室{rng.randrange(max(1, detail_count // 6))}",
+            day_of_week=rng.randint(1, 7),
+            start_section=start_section,
+            step=step,
+            start_week=start_week,
+            end_week=end_week,
+            week_type=rng.choice(_WEEK_TYPES)
+        )
+        courses.append((base, detail))
+    return courses
+
+
+def current_rss_mb() -> Optional[float]:
+    """
+    获取当前进程的峰值常驻内存 (MB)
+
+    优先使用 psutil（Windows 可用），否则回退到 resource 模块
+    """
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return round(getattr(info, "peak_wset", info.rss) / (1024 * 1024), 2)
+    except ImportError:
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux 以 KB 为单位，macOS 以字节为单位
+        if sys.platform == "darwin":
+            return round(peak / (1024 * 1024), 2)
+        return round(peak / 1024, 2)
+    except ImportError:
+        return None
+
+
+def summarize(samples_ms: List[float]) -> Dict[str, float]:
+    """汇总一组耗时样本 (毫秒)"""
+    ordered = sorted(samples_ms)
+    p95_index = min(len(ordered) - 1, int(round(len(ordered) * 0.95)) - 1)
+    return {
+        "count": len(ordered),
+        "min_ms": round(ordered[0], 3),
+        "median_ms": round(statistics.median(ordered), 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p95_ms": round(ordered[max(0, p95_index)], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def environment_info() -> Dict[str, Any]:
+    """记录结果时附带的运行环境信息"""
+    return {
+        "app_version": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+def write_results(name: str, results: Dict[str, Any], output: Optional[str] = None) -> Path:
+    """
+    将结果写入 JSON 文件
+
+    默认路径为 benchmarks/results/<name>_<版本>_<时间>.json，
+    便于在不同版本之间对比
+
+    Returns:
+        结果文件路径
+    """
+    if output:
+        path = Path(output)
+    else:
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        path = RESULTS_DIR / f"{name}_{__version__}_{stamp}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    payload = {"benchmark": name, "environment": environment_info(), "results": results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    return path
@@ -28,7 +28,7 @@ if str(src_path) not in sys.path:
 # ========================================================
 # 2. 初始化日志系统
 # ========================================================
-from src.utils.logger import logger, log_exception
+from src.utils.logger import logger, log_exception, startup_timer
 
 # 设置全局异常处理
 sys.excepthook = log_exception
@@ -45,6 +45,7 @@ try:
     from PyQt6.QtGui import QFont
     from src.ui.main_window import MainWindow
     logger.info("模块导入成功")
+    startup_timer.mark("模块导入")
 except ImportError as e:
     logger.critical(f"模块导入失败: {e}")
     sys.exit(1)
@@ -56,6 +57,7 @@ def main():
         # 创建应用程序实例
         app = QApplication(sys.argv)
         logger.info("QApplication 创建成功")
+        startup_timer.mark("QApplication 创建")
 
         # 设置全局字体
         font = QFont("Microsoft YaHei, Segoe UI, sans-serif")
@@ -64,6 +66,7 @@ def main():
 
         # 初始化并显示主窗口
         window = MainWindow()
+        startup_timer.mark("主窗口构造")
         window.show()
         logger.info("主窗口已显示")
 
@@ -0,0 +1,81 @@
+"""
+WakeUp Schedule - 无界面提醒守护进程入口
+
+不加载 PyQt6，仅读取配置和本地课表，按当天日程定时提醒
+适合在低配置电脑上全天后台运行
+"""
+import sys
+import argparse
+from datetime import date
+from pathlib import Path
+
+# ========================================================
+# 1. 核心路径配置
+# ========================================================
+if getattr(sys, 'frozen', False):
+    project_root = Path(sys.executable).parent
+else:
+    project_root = Path(__file__).resolve().parent
+
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+src_path = project_root / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+# ========================================================
+# 2. 初始化日志系统
+# ========================================================
+from src.utils.logger import logger, log_exception, configure_logging
+
+sys.excepthook = log_exception
+
+from src.models.config import Config
+from src.models.schedule import Schedule
+from src.models.time_slot import TimeSlot
+from src.core.storage_manager import StorageManager
+from src.core.schedule_manager import ScheduleManager
+from src.core.reminder_daemon import ReminderDaemon
+from src.utils.time_utils import parse_semester_start_date
+
+
+def main():
+    """守护进程主函数"""
+    parser = argparse.ArgumentParser(description="WakeUp 课表无界面提醒守护进程")
+    parser.add_argument("--list", action="store_true", help="打印今天的日程后退出")
+    args = parser.parse_args()
+
+    config = Config.load()
+    configure_logging(config.log_level, config.log_levels, config.log_json_events)
+    bases, details, _ = StorageManager().load()
+    schedule = Schedule(
+        course_bases=bases,
+        course_details=details,
+        semester_start_date=parse_semester_start_date(config.semester_start_date)
+    )
+
+    daemon = ReminderDaemon(
+        ScheduleManager(schedule),
+        TimeSlot.generate_from_config(config),
+        remind_minutes=config.remind_minutes
+    )
+
+    if args.list:
+        for item in daemon.build_agenda(date.today()):
+            print(f"{item.start_at.strftime('%H:%M')} {item.base.name} @{item.detail.location}")
+        return
+
+    if not config.enable_notification:
+        logger.info("通知已在设置中关闭，守护进程退出")
+        return
+
+    logger.info(f"提醒守护进程启动，共 {len(details)} 个课程块")
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        logger.info("提醒守护进程已退出")
+
+
+if __name__ == "__main__":
+    main()
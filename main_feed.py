@@ -0,0 +1,83 @@
+"""
+WakeUp Schedule - 日历订阅源服务入口
+
+不加载 PyQt6，在本机提供 .ics 订阅地址，手机/电脑日历订阅后自动同步课表
+课表或配置文件有变化时才重新生成日历内容
+"""
+import os
+import sys
+import argparse
+from pathlib import Path
+
+# ========================================================
+# 1. 核心路径配置
+# ========================================================
+if getattr(sys, 'frozen', False):
+    project_root = Path(sys.executable).parent
+else:
+    project_root = Path(__file__).resolve().parent
+
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+src_path = project_root / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
+
+# ========================================================
+# 2. 初始化日志系统
+# ========================================================
+from src.utils.logger import logger, log_exception, configure_logging
+
+sys.excepthook = log_exception
+
+from src.models.config import Config, CONFIG_PATH
+from src.models.schedule import Schedule
+from src.models.time_slot import TimeSlot
+from src.core.storage_manager import StorageManager
+from src.core.ics_feed import ICSFeed, DEFAULT_FEED_PATH, run_feed_server
+from src.utils.time_utils import parse_semester_start_date
+
+
+def _config_token():
+    try:
+        stat = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def main():
+    """订阅源服务主函数"""
+    config = Config.load()
+    configure_logging(config.log_level, config.log_levels, config.log_json_events)
+    parser = argparse.ArgumentParser(description="WakeUp 课表日历订阅源服务")
+    parser.add_argument("--host", default=config.ics_feed_host, help="监听地址")
+    parser.add_argument("--port", type=int, default=config.ics_feed_port, help="监听端口")
+    parser.add_argument("--path", default=DEFAULT_FEED_PATH, help="订阅路径")
+    args = parser.parse_args()
+
+    storage = StorageManager()
+
+    def load():
+        # 开学日期和作息时间来自配置，一并重新读取
+        current = Config.load()
+        bases, details, _ = storage.load()
+        schedule = Schedule(
+            course_bases=bases,
+            course_details=details,
+            semester_start_date=parse_semester_start_date(current.semester_start_date)
+        )
+        return schedule, TimeSlot.generate_from_config(current)
+
+    feed = ICSFeed(load, lambda: (storage.change_token(), _config_token()))
+
+    logger.info(f"日历订阅源启动: http://{args.host}:{args.port}{args.path}")
+    try:
+        run_feed_server(feed, args.host, args.port, args.path)
+    except KeyboardInterrupt:
+        logger.info("日历订阅源已退出")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,14 +9,15 @@ from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
 from pathlib import Path
 
 
-def create_template():
-    """创建标准 Excel 课表模板"""
-    
-    # 创建工作簿
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "课表"
-    
+def fill_schedule_sheet(ws, entries, sections: int = 12):
+    """
+    填充课表工作表：表头、节次列、课程单元格及样式
+
+    Args:
+        ws: openpyxl 工作表
+        entries: (行, 列, 内容) 列表，行列均从 1 开始
+        sections: 节次数量
+    """
     # 设置列宽
     ws.column_dimensions['A'].width = 8
     for col in ['B', 'C', 'D', 'E', 'F', 'G', 'H']:
@@ -24,7 +25,7 @@ def create_template():
     
     # 设置行高
     ws.row_dimensions[1].height = 25
-    for row in range(2, 14):
+    for row in range(2, sections + 2):
         ws.row_dimensions[row].height = 60
     
     # 定义样式
@@ -56,7 +57,7 @@ def create_template():
         cell.border = border
     
     # 填充节次列
-    for row_idx in range(2, 14):
+    for row_idx in range(2, sections + 2):
         section = row_idx - 1
         cell = ws.cell(row=row_idx, column=1, value=section)
         cell.font = section_font
@@ -64,23 +65,15 @@ def create_template():
         cell.alignment = section_alignment
         cell.border = border
     
-    # 填充示例数据
-    examples = [
-        (2, 2, "高等数学\n{第1-16周\n张老师\nA101"),
-        (2, 4, "线性代数\n{第1-16周(单)\n李老师\nB202"),
-        (3, 3, "大学物理\n{第1-16周\n王老师\nC303"),
-        (4, 2, "英语\n{第1-16周\n赵老师\nD404"),
-        (5, 5, "计算机基础\n{第1-16周(双)\n刘老师\nE505"),
-    ]
-    
-    for row, col, value in examples:
+    # 填充课程数据
+    for row, col, value in entries:
         cell = ws.cell(row=row, column=col, value=value)
         cell.font = cell_font
         cell.alignment = cell_alignment
         cell.border = border
     
     # 填充空单元格（添加边框）
-    for row in range(2, 14):
+    for row in range(2, sections + 2):
         for col in range(2, 9):
             cell = ws.cell(row=row, column=col)
             if cell.value is None:
@@ -88,6 +81,25 @@ def create_template():
             cell.font = cell_font
             cell.alignment = cell_alignment
             cell.border = border
+
+
+def create_template():
+    """创建标准 Excel 课表模板"""
+    
+    # 创建工作簿
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "课表"
+    
+    # 示例数据
+    examples = [
+        (2, 2, "高等数学\n{第1-16周\n张老师\nA101"),
+        (2, 4, "线性代数\n{第1-16周(单)\n李老师\nB202"),
+        (3, 3, "大学物理\n{第1-16周\n王老师\nC303"),
+        (4, 2, "英语\n{第1-16周\n赵老师\nD404"),
+        (5, 5, "计算机基础\n{第1-16周(双)\n刘老师\nE505"),
+    ]
+    fill_schedule_sheet(ws, examples)
     
     # 创建说明工作表
     ws_info = wb.create_sheet("使用说明")
@@ -0,0 +1,180 @@
+"""
+生成导入器基准测试语料
+
+按指定规模生成强智 HTML、Excel 和文本格式的合成课表，
+Excel 部分复用 create_excel_template.py 的表格样式
+
+运行此脚本会在 benchmarks/corpus/ 目录下生成语料文件：
+    python scripts/generate_benchmark_corpus.py --sizes 50 500 5000
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import List, NamedTuple
+
+import openpyxl
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from create_excel_template import fill_schedule_sheet
+
+DEFAULT_SIZES = [50, 500, 5000]
+DEFAULT_OUTPUT_DIR = Path(__file__).parent.parent / "benchmarks" / "corpus"
+
+DAY_NAMES = ["一", "二", "三", "四", "五", "六", "日"]
+# 每天 6 个大节（1-2, 3-4, ..., 11-12）
+SECTION_PAIRS = [(1, 2), (3, 4), (5, 6), (7, 8), (9, 10), (11, 12)]
+
+
+class Block(NamedTuple):
+    """一个合成课程块"""
+    name: str
+    teacher: str
+    location: str
+    day: int
+    start_section: int
+    end_section: int
+    start_week: int
+    end_week: int
+    week_type: str  # "", "单", "双"
+
+
+def generate_blocks(size: int, seed: int = 42) -> List[Block]:
+    """
+    生成指定数量的课程块
+
+    课程块依次填入 7 天 × 6 个大节的格子，格子填满后在同一格内叠加，
+    与强智系统中一个格子包含多门课程的情况一致
+
+    Args:
+        size: 课程块数量
+        seed: 随机种子
+
+    Returns:
+        课程块列表
+    """
+    rng = random.Random(seed)
+    name_count = max(1, size // 4)
+    blocks = []
+    for i in range(size):
+        cell = i % (7 * len(SECTION_PAIRS))
+        day = cell // len(SECTION_PAIRS) + 1
+        start_section, end_section = SECTION_PAIRS[cell % len(SECTION_PAIRS)]
+        start_week = rng.randint(1, 8)
+        blocks.append(Block(
+            name=f"课程{i % name_count}",
+            teacher=f"教师{rng.randrange(max(1, size // 8))}",
+            location=f"教室{rng.randrange(max(1, size // 6))}",
+            day=day,
+            start_section=start_section,
+            end_section=end_section,
+            start_week=start_week,
+            end_week=rng.randint(start_week, 20),
+            week_type=rng.choice(["", "", "单", "双"]),
+        ))
+    return blocks
+
+
+def generate_qiangzhi_html(blocks: List[Block]) -> str:
+    """生成强智系统格式的 HTML 课表（kbtable + kbcontent + font 字段）"""
+    cells = {}
+    for b in blocks:
+        week_suffix = f"({b.week_type}周)" if b.week_type else ""
+        segment = (
+            f'{b.name}<br/>'
+            f'<font title="老师">{b.teacher}</font><br/>'
+            f'<font title="周次(节次)">{b.start_week}-{b.end_week}(周){week_suffix}'
+            f'[{b.start_section:02d}-{b.end_section:02d}节]</font><br/>'
+            f'<font title="教室">{b.location}</font><br/>'
+        )
+        cells.setdefault((b.start_section, b.day), []).append(segment)
+
+    lines = [
+        '<!DOCTYPE html>',
+        '<html><head><meta charset="UTF-8"><title>学期理论课表</title></head><body>',
+        '<table id="kbtable" border="1">',
+        '<tr><th>节次</th>' + ''.join(f'<th>星期{d}</th>' for d in DAY_NAMES) + '</tr>',
+    ]
+    for start, end in SECTION_PAIRS:
+        row = [f'<tr><td>第{start}-{end}节</td>']
+        for day in range(1, 8):
+            segments = cells.get((start, day))
+            if segments:
+                content = '---------------------<br/>'.join(segments)
+                row.append(f'<td><div class="kbcontent">{content}</div></td>')
+            else:
+                row.append('<td><div class="kbcontent">&nbsp;</div></td>')
+        row.append('</tr>')
+        lines.append(''.join(row))
+    lines.append('</table></body></html>')
+    return '\n'.join(lines)
+
+
+def generate_text(blocks: List[Block]) -> str:
+    """生成文本格式课表（周一 1-2节 高等数学 张三 A101 1-16周(单)）"""
+    lines = []
+    for b in blocks:
+        week_suffix = f"({b.week_type})" if b.week_type else ""
+        lines.append(
+            f"周{DAY_NAMES[b.day - 1]} {b.start_section}-{b.end_section}节 "
+            f"{b.name} {b.teacher} {b.location} {b.start_week}-{b.end_week}周{week_suffix}"
+        )
+    return '\n'.join(lines)
+
+
+def generate_excel(blocks: List[Block], output_file: Path) -> Path:
+    """
+    生成强智 Excel 格式课表
+
+    每个单元格中的课程一行一门："高等数学 {第1-16周(单) 张老师 A101"
+    """
+    cells = {}
+    for b in blocks:
+        week_suffix = f"({b.week_type})" if b.week_type else ""
+        line = f"{b.name} {{第{b.start_week}-{b.end_week}周{week_suffix} {b.teacher} {b.location}"
+        cells.setdefault((b.start_section + 1, b.day + 1), []).append(line)
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "课表"
+    fill_schedule_sheet(ws, [(row, col, '\n'.join(lines)) for (row, col), lines in cells.items()])
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    wb.save(output_file)
+    return output_file
+
+
+def generate_corpus(sizes: List[int], output_dir: Path, seed: int = 42) -> List[Path]:
+    """生成所有格式、所有规模的语料文件"""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    files = []
+    for size in sizes:
+        blocks = generate_blocks(size, seed)
+
+        html_file = output_dir / f"qiangzhi_{size}.html"
+        html_file.write_text(generate_qiangzhi_html(blocks), encoding="utf-8")
+        files.append(html_file)
+
+        text_file = output_dir / f"text_{size}.txt"
+        text_file.write_text(generate_text(blocks), encoding="utf-8")
+        files.append(text_file)
+
+        files.append(generate_excel(blocks, output_dir / f"excel_{size}.xlsx"))
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成导入器基准测试语料")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="每个文件的课程块数量")
+    parser.add_argument("--output-dir", type=Path, default=DEFAULT_OUTPUT_DIR, help="输出目录")
+    parser.add_argument("--seed", type=int, default=42, help="随机种子")
+    args = parser.parse_args()
+
+    for path in generate_corpus(args.sizes, args.output_dir, args.seed):
+        print(f"✓ {path} ({path.stat().st_size / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
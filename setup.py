@@ -44,6 +44,8 @@ setup(
     entry_points={
         "console_scripts": [
             "wakeup-schedule=main:main",
+            "wakeup-schedule-daemon=main_daemon:main",
+            "wakeup-schedule-feed=main_feed:main",
         ],
     },
 )
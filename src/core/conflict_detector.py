@@ -9,9 +9,13 @@ from typing import List, Tuple
 try:
     from ..models.course_base import CourseBase
     from ..models.course_detail import CourseDetail
+    from ..utils.profiler import timed
+    from .detail_table import DetailTableCache
 except ImportError:
     from models.course_base import CourseBase
     from models.course_detail import CourseDetail
+    from utils.profiler import timed
+    from core.detail_table import DetailTableCache
 
 
 class ConflictDetector:
@@ -29,7 +33,9 @@ class ConflictDetector:
             schedule: Schedule 对象（可选）
         """
         self.schedule = schedule
+        self._table_cache = DetailTableCache()
     
+    @timed()
     def detect_conflicts(self, course_detail: CourseDetail, exclude_course_id: str = None) -> List[CourseDetail]:
         """
         检测课程详细信息与现有课程是否有冲突
@@ -44,22 +50,14 @@ class ConflictDetector:
         if not self.schedule:
             return []
         
-        conflicts = []
+        # 用列式详情表的位图一次筛出同一天、节次重叠且有共同上课周的课程
+        table = self._table_cache.get(self.schedule.course_details, self.schedule.version)
+        candidates = table.conflict_rows(course_detail)
+        if exclude_course_id:
+            candidates &= ~table.rows_for_course(exclude_course_id)
         
-        for existing in self.schedule.course_details:
-            # 跳过要排除的课程
-            if exclude_course_id and existing.course_id == exclude_course_id:
-                continue
-            
-            # 跳过自己
-            if existing == course_detail:
-                continue
-            
-            # 检查是否有任何周次存在冲突
-            if self._has_any_week_overlap(course_detail, existing):
-                conflicts.append(existing)
-        
-        return conflicts
+        # 跳过自己
+        return [existing for existing in table.select(candidates) if existing != course_detail]
     
     def get_conflict_description(self, detail1: CourseDetail, detail2: CourseDetail) -> str:
         """
@@ -93,6 +91,7 @@ class ConflictDetector:
         return f"{day_name} 第{detail1.start_section}-{detail1.end_section}节 ({weeks_str}) 时间冲突"
     
     @staticmethod
+    @timed("ConflictDetector.check_conflict")
     def check_conflict(
         course_detail: CourseDetail,
         existing_details: List[CourseDetail]
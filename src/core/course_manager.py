@@ -5,7 +5,8 @@
 """
 
 import random
-from typing import List, Optional, Tuple
+from dataclasses import replace
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar
 
 try:
     from ..models.course_base import CourseBase
@@ -38,6 +39,28 @@ except ImportError:
     )
     from utils.color_manager import ColorManager
 
+T = TypeVar("T")
+
+
+def remove_all(items: Sequence[T], targets: Iterable, key: Optional[Callable[[T], object]] = None) -> List[T]:
+    """
+    一次遍历移除多个元素，返回新列表
+
+    CourseDetail 可哈希，先把目标建成集合再过滤，删除 m 个元素为 O(n + m)，
+    避免逐个 list.remove 的平方复杂度
+
+    Args:
+        items: 原列表（不修改）
+        targets: 要移除的元素
+        key: 从元素中取出与 targets 比较的对象，如从 (CourseBase, CourseDetail) 中取 CourseDetail
+    """
+    targets = set(targets)
+    if not targets:
+        return list(items)
+    if key is None:
+        return [item for item in items if item not in targets]
+    return [item for item in items if key(item) not in targets]
+
 
 class CourseManager:
     """
@@ -86,6 +109,7 @@ class CourseManager:
         
         # 添加到课表
         self.schedule.course_bases.append(course_base)
+        self.schedule.touch()
         return True, ""
     
     def add_course_detail(self, course_detail: CourseDetail) -> Tuple[bool, str]:
@@ -136,6 +160,7 @@ class CourseManager:
         
         # 添加到课表
         self.schedule.course_details.append(course_detail)
+        self.schedule.touch()
         return True, ""
     
     def update_course_base(self, course_id: str, course_base: CourseBase) -> Tuple[bool, str]:
@@ -165,11 +190,13 @@ class CourseManager:
                 if not valid:
                     return False, msg
                 
-                # 保持ID不变
-                course_base.id = course_id
+                # 保持ID不变（course_id 不可修改，ID 不同时生成新对象）
+                if course_base.course_id != course_id:
+                    course_base = replace(course_base, course_id=course_id)
                 
                 # 更新
                 self.schedule.course_bases[i] = course_base
+                self.schedule.touch()
                 return True, ""
         
         return False, f"课程ID {course_id} 不存在"
@@ -200,7 +227,7 @@ class CourseManager:
             cd for cd in self.schedule.course_details
             if cd.course_id != course_id
         ]
-        
+        self.schedule.touch()
         return True, ""
     
     def delete_course_detail(self, course_detail: CourseDetail) -> Tuple[bool, str]:
@@ -213,11 +240,29 @@ class CourseManager:
         Returns:
             (是否成功, 错误消息)
         """
-        try:
-            self.schedule.course_details.remove(course_detail)
-            return True, ""
-        except ValueError:
+        if not self.delete_course_details([course_detail]):
             return False, "课程详细信息不存在"
+        return True, ""
+
+    def delete_course_details(self, course_details: Iterable[CourseDetail]) -> int:
+        """
+        批量删除课程详细信息
+
+        CourseDetail 可哈希，由 remove_all 一次遍历过滤，避免逐个 list.remove 的平方复杂度
+
+        Args:
+            course_details: 要删除的课程详细信息
+
+        Returns:
+            实际删除的数量
+        """
+        before = len(self.schedule.course_details)
+        remaining = remove_all(self.schedule.course_details, course_details)
+        removed = before - len(remaining)
+        if removed:
+            self.schedule.course_details = remaining
+            self.schedule.touch()
+        return removed
     
     def get_course_base(self, course_id: str) -> Optional[CourseBase]:
         """
@@ -341,7 +386,7 @@ class CourseManager:
         """
         为所有课程重新分配随机颜色
         
-        从 ColorManager.COLOR_POOL 中随机选择颜色分配给每个课程
+        用随机串打乱 ColorManager.PALETTE 中的取色位置，并尽量让课表中相邻的课程颜色不同
         
         Returns:
             (是否成功, 消息)
@@ -349,12 +394,11 @@ class CourseManager:
         if not self.schedule.course_bases:
             return False, "没有课程需要重新分配颜色"
         
-        # 获取颜色池
-        color_pool = ColorManager.COLOR_POOL.copy()
-        
-        # 为每个课程随机分配颜色
-        for course_base in self.schedule.course_bases:
-            # 随机选择一个颜色
-            course_base.color = random.choice(color_pool)
+        ColorManager.apply_colors(
+            self.schedule.course_bases,
+            self.schedule.course_details,
+            salt=str(random.getrandbits(32)),
+        )
+        self.schedule.touch()
         
         return True, f"已为 {len(self.schedule.course_bases)} 个课程重新分配颜色"
@@ -0,0 +1,360 @@
+"""
+列式课程详情表
+
+把 schedule.course_details 转成按列存储的结构，用于分析类查询：
+- day / start_section / step / start_week / end_week / week_mask 存在并行的 array 中
+- teacher / location / course_id 做字典编码，列中只存整数编码
+- 每个列值额外维护一个“行位图”（Python 大整数，第 i 位表示第 i 行），
+  过滤就是若干位图的按位与，计数就是 bit_count，不需要逐行循环
+"""
+
+from array import array
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    from ..models.course_detail import CourseDetail
+    from ..models.schedule import Schedule
+except ImportError:
+    from models.course_detail import CourseDetail
+    from models.schedule import Schedule
+
+# week_mask 列使用 64 位无符号整数，第 w 位表示第 w 周
+MAX_WEEK = 63
+
+
+# 位图中 1 的个数少于该值时逐位取最低位，否则按字节扫描
+_SPARSE_LIMIT = 64
+
+
+def iter_rows(mask: int) -> Iterator[int]:
+    """按从小到大的顺序遍历位图中的行号"""
+    if mask.bit_count() < _SPARSE_LIMIT:
+        while mask:
+            low = mask & -mask
+            yield low.bit_length() - 1
+            mask ^= low
+        return
+
+    for index, byte in enumerate(mask.to_bytes((mask.bit_length() + 7) // 8, "little")):
+        if byte:
+            base = index << 3
+            for bit in range(8):
+                if byte >> bit & 1:
+                    yield base + bit
+
+
+_ALL_WEEKS = (1 << (MAX_WEEK + 1)) - 2  # 第 1-63 周
+# 按 WeekType.value 取周类型对应的位图
+_WEEK_TYPE_MASKS = {
+    "every": _ALL_WEEKS,
+    "odd": sum(1 << w for w in range(1, MAX_WEEK + 1, 2)),
+    "even": sum(1 << w for w in range(2, MAX_WEEK + 1, 2)),
+}
+
+
+def week_mask_of(detail: CourseDetail) -> int:
+    """课程上课周次的位图（第 w 位为 1 表示第 w 周上课）"""
+    start = max(detail.start_week, 1)
+    end = min(detail.end_week, MAX_WEEK)
+    if start > end:
+        return 0
+    week_range = ((1 << (end + 1)) - 1) ^ ((1 << start) - 1)
+    return week_range & _WEEK_TYPE_MASKS.get(detail.week_type.value, _ALL_WEEKS)
+
+
+def rows_to_mask(rows: Sequence[int], size: int) -> int:
+    """把行号列表转成位图，先写入 bytearray 再一次性转成整数，避免反复扩展大整数"""
+    buf = bytearray((size + 7) // 8)
+    for row in rows:
+        buf[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(buf, "little")
+
+
+class _Dictionary:
+    """
+    字典编码列：值 <-> 整数编码
+
+    教师/教室/课程的取值很多，每个编码只保存行号列表（array），
+    查询时再转成位图，避免为上万个取值各保存一个整表宽度的位图
+    """
+
+    def __init__(self):
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+        self.rows: List[array] = []
+
+    def encode(self, value: str, row: int) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+            self.rows.append(array('I'))
+        self.rows[code].append(row)
+        return code
+
+    def rows_of(self, value: str, size: int) -> int:
+        code = self.codes.get(value)
+        return rows_to_mask(self.rows[code], size) if code is not None else 0
+
+
+class DetailTable:
+    """
+    列式课程详情表
+
+    构建一次后只读；课表变化后需要重新构建（见 DetailTableCache）
+    过滤方法返回行位图，可继续按位组合，再用 select/count/group_count 取结果
+    """
+
+    def __init__(self, details: Sequence[CourseDetail]):
+        self.details: List[CourseDetail] = list(details)
+        n = len(self.details)
+        self.all_rows = (1 << n) - 1
+
+        # 数值列
+        self.day = array('b')
+        self.start_section = array('b')
+        self.step = array('b')
+        self.start_week = array('h')
+        self.end_week = array('h')
+        self.week_mask = array('Q')
+
+        # 字典编码列
+        self._teachers = _Dictionary()
+        self._locations = _Dictionary()
+        self._courses = _Dictionary()
+        self.teacher = array('I')
+        self.location = array('I')
+        self.course = array('I')
+
+        # 行位图索引（构建时先收集行号）
+        day_rows: Dict[int, List[int]] = {}
+        section_rows: Dict[int, List[int]] = {}  # 节次 -> 覆盖该节次的行
+        week_rows: Dict[int, List[int]] = {}     # 周次 -> 该周上课的行
+        step_rows: Dict[int, List[int]] = {}     # 持续节数 -> 行
+
+        for row, d in enumerate(self.details):
+            mask = week_mask_of(d)
+
+            self.day.append(d.day_of_week)
+            self.start_section.append(d.start_section)
+            self.step.append(d.step)
+            self.start_week.append(d.start_week)
+            self.end_week.append(d.end_week)
+            self.week_mask.append(mask)
+            self.teacher.append(self._teachers.encode(d.teacher, row))
+            self.location.append(self._locations.encode(d.location, row))
+            self.course.append(self._courses.encode(d.course_id, row))
+
+            day_rows.setdefault(d.day_of_week, []).append(row)
+            for section in range(d.start_section, d.start_section + d.step):
+                section_rows.setdefault(section, []).append(row)
+            for week in iter_rows(mask):
+                week_rows.setdefault(week, []).append(row)
+            step_rows.setdefault(d.step, []).append(row)
+
+        self._day_rows = [rows_to_mask(day_rows.get(day, ()), n) for day in range(8)]
+        self._section_rows = {k: rows_to_mask(v, n) for k, v in section_rows.items()}
+        self._week_rows = {k: rows_to_mask(v, n) for k, v in week_rows.items()}
+        self._step_rows = {k: rows_to_mask(v, n) for k, v in step_rows.items()}
+
+    @classmethod
+    def from_schedule(cls, schedule: Schedule) -> 'DetailTable':
+        return cls(schedule.course_details)
+
+    def __len__(self) -> int:
+        return len(self.details)
+
+    # ---------- 过滤：返回行位图 ----------
+
+    def rows_for_day(self, day: int) -> int:
+        return self._day_rows[day] if 1 <= day <= 7 else 0
+
+    def rows_for_week(self, week: int) -> int:
+        return self._week_rows.get(week, 0)
+
+    def rows_for_weeks(self, week_mask: int) -> int:
+        """在 week_mask 中任意一周上课的行"""
+        result = 0
+        for week in iter_rows(week_mask):
+            result |= self._week_rows.get(week, 0)
+        return result
+
+    def rows_for_sections(self, start_section: int, end_section: int) -> int:
+        """与 [start_section, end_section] 有重叠的行"""
+        result = 0
+        for section in range(start_section, end_section + 1):
+            result |= self._section_rows.get(section, 0)
+        return result
+
+    def rows_for_teacher(self, teacher: str) -> int:
+        return self._teachers.rows_of(teacher, len(self.details))
+
+    def rows_for_location(self, location: str) -> int:
+        return self._locations.rows_of(location, len(self.details))
+
+    def rows_for_course(self, course_id: str) -> int:
+        return self._courses.rows_of(course_id, len(self.details))
+
+    def filter(
+        self,
+        day: Optional[int] = None,
+        week: Optional[int] = None,
+        sections: Optional[Tuple[int, int]] = None,
+        teacher: Optional[str] = None,
+        location: Optional[str] = None,
+        course_id: Optional[str] = None,
+    ) -> int:
+        """
+        组合过滤，所有条件取交集
+
+        Args:
+            day: 星期几（1-7）
+            week: 周次
+            sections: (开始节次, 结束节次)，返回与之重叠的行
+            teacher: 教师
+            location: 上课地点
+            course_id: 课程ID
+
+        Returns:
+            行位图
+        """
+        mask = self.all_rows
+        if day is not None:
+            mask &= self.rows_for_day(day)
+        if week is not None:
+            mask &= self.rows_for_week(week)
+        if sections is not None:
+            mask &= self.rows_for_sections(*sections)
+        if teacher is not None:
+            mask &= self.rows_for_teacher(teacher)
+        if location is not None:
+            mask &= self.rows_for_location(location)
+        if course_id is not None:
+            mask &= self.rows_for_course(course_id)
+        return mask
+
+    def conflict_rows(self, detail: CourseDetail) -> int:
+        """与 detail 在同一天、节次重叠且至少有一周同时上课的行"""
+        return (
+            self.rows_for_day(detail.day_of_week)
+            & self.rows_for_sections(detail.start_section, detail.end_section)
+            & self.rows_for_weeks(week_mask_of(detail))
+        )
+
+    # ---------- 结果 ----------
+
+    def select(self, mask: int) -> List[CourseDetail]:
+        """按原顺序取出位图中的课程详情"""
+        details = self.details
+        return [details[row] for row in iter_rows(mask)]
+
+    @staticmethod
+    def count(mask: int) -> int:
+        return mask.bit_count()
+
+    def group_count(self, by: str, mask: Optional[int] = None) -> Dict[str, int]:
+        """
+        分组计数
+
+        Args:
+            by: "teacher" / "location" / "course_id" / "day_of_week"
+            mask: 只统计位图中的行，默认全部
+
+        Returns:
+            {分组值: 课程块数量}，不含数量为 0 的分组
+        """
+        if mask is None:
+            mask = self.all_rows
+
+        if by == "day_of_week":
+            counts = ((day, (self._day_rows[day] & mask).bit_count()) for day in range(1, 8))
+            return {day: n for day, n in counts if n}
+
+        dictionary, codes = self._dictionary_column(by)
+        totals = [0] * len(dictionary.values)
+        for row in iter_rows(mask):
+            totals[codes[row]] += 1
+        return {value: n for value, n in zip(dictionary.values, totals) if n}
+
+    def teaching_load(self, mask: Optional[int] = None) -> Dict[str, int]:
+        """
+        每位教师整个学期的总课时：各课程块的持续节数 × 上课周数之和
+
+        Args:
+            mask: 只统计位图中的行，默认全部
+
+        Returns:
+            {教师: 总节数}
+        """
+        if mask is None:
+            mask = self.all_rows
+        totals = [0] * len(self._teachers.values)
+        teacher, step, week_mask = self.teacher, self.step, self.week_mask
+        for row in iter_rows(mask):
+            totals[teacher[row]] += step[row] * week_mask[row].bit_count()
+        return {
+            name: total
+            for name, total in zip(self._teachers.values, totals)
+            if total
+        }
+
+    def distinct(self, by: str) -> List[str]:
+        """
+        字典编码列的所有取值，下标即 teacher/location/course 列中的编码
+
+        Args:
+            by: "teacher" / "location" / "course_id"
+        """
+        return self._dictionary_column(by)[0].values
+
+    def _dictionary_column(self, by: str):
+        if by == "teacher":
+            return self._teachers, self.teacher
+        if by == "location":
+            return self._locations, self.location
+        if by == "course_id":
+            return self._courses, self.course
+        raise ValueError(f"不支持的分组字段: {by}")
+
+
+class VersionedCache:
+    """
+    按需构建并缓存由列表派生的结构
+
+    以列表对象和数据版本号作为快照：列表被整体替换或版本号变化时重建。
+    版本号由数据的持有者维护（如 Schedule.version，每次增删改都递增），
+    不能只看列表长度——删一条再加一条后长度不变，内容却已不同
+    """
+
+    def __init__(self, factory: Callable):
+        """
+        Args:
+            factory: 由列表构建缓存对象的函数
+        """
+        self._factory = factory
+        self._value = None
+        self._source: Optional[list] = None
+        self._version = None
+
+    def get(self, source: list, version):
+        """
+        Args:
+            source: 数据列表
+            version: 数据版本号，与上次不同即重建
+        """
+        if self._value is None or source is not self._source or version != self._version:
+            self._value = self._factory(source)
+            self._source = source
+            self._version = version
+        return self._value
+
+    def invalidate(self):
+        self._value = None
+        self._source = None
+
+
+class DetailTableCache(VersionedCache):
+    """按需构建并缓存 course_details 的 DetailTable"""
+
+    def __init__(self):
+        super().__init__(DetailTable)
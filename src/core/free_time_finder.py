@@ -0,0 +1,138 @@
+"""
+多课表共同空闲时间查找
+
+把每个人的课表转成一个占用位图（Python 大整数），
+第 (周次 - start_week) * 7 * 节数 + (星期 - 1) * 节数 + (节次 - 1) 位为 1 表示该格子有课
+所有人的位图按位或得到“有人有课”的格子，取反即为所有人都空闲的格子
+
+课表来源可以是 Schedule、ScheduleManager，或 StorageManager.load() /
+导入器 parse() 得到的 CourseDetail 列表
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from operator import or_
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    from ..models.course_detail import CourseDetail
+    from ..models.schedule import Schedule
+    from .detail_table import iter_rows, week_mask_of
+except ImportError:
+    from models.course_detail import CourseDetail
+    from models.schedule import Schedule
+    from core.detail_table import iter_rows, week_mask_of
+
+# 课表数量达到该值且指定了 max_workers 时才使用线程池
+PARALLEL_THRESHOLD = 64
+
+ScheduleSource = Union[Schedule, "ScheduleManager", Iterable[CourseDetail]]
+
+
+class FreeTimeFinder:
+    """
+    共同空闲时间查找器
+
+    每门课程的占用位图 = 一周内的格子位图 × 周次“展开”位图：
+    后者在每个上课周的起始位置放一个 1，两者相乘即把同一周内的格子复制到所有上课周，
+    因为格子位图小于一周的宽度，乘法不会产生进位
+    """
+
+    def __init__(self, start_week: int = 1, end_week: int = 20, sections_per_day: int = 12):
+        """
+        Args:
+            start_week: 起始周次
+            end_week: 结束周次
+            sections_per_day: 每天节数
+        """
+        self.start_week = start_week
+        self.end_week = end_week
+        self.sections_per_day = sections_per_day
+        self.week_width = 7 * sections_per_day
+        self.all_cells = (1 << ((end_week - start_week + 1) * self.week_width)) - 1
+        self._spread_cache: Dict[int, int] = {}
+
+    def _spread(self, week_mask: int) -> int:
+        """把周次位图展开成每个上课周起始位置为 1 的位图"""
+        spread = self._spread_cache.get(week_mask)
+        if spread is None:
+            spread = 0
+            for week in iter_rows(week_mask):
+                if self.start_week <= week <= self.end_week:
+                    spread |= 1 << ((week - self.start_week) * self.week_width)
+            self._spread_cache[week_mask] = spread
+        return spread
+
+    def busy_bitmap(self, details: Iterable[CourseDetail]) -> int:
+        """一个人的占用位图"""
+        busy = 0
+        sections = self.sections_per_day
+        for d in details:
+            if not 1 <= d.day_of_week <= 7 or d.start_section < 1:
+                continue
+            # 超出每天节数的部分截掉，避免溢出到下一天
+            step = min(d.step, sections - d.start_section + 1)
+            if step <= 0:
+                continue
+            cells = ((1 << step) - 1) << ((d.day_of_week - 1) * sections + d.start_section - 1)
+            busy |= cells * self._spread(week_mask_of(d))
+        return busy
+
+    def busy_bitmap_of(self, source: ScheduleSource) -> int:
+        """任意课表来源的占用位图"""
+        return self.busy_bitmap(_details_of(source))
+
+    def combined_busy(self, sources: Iterable[ScheduleSource], max_workers: Optional[int] = None) -> int:
+        """
+        所有课表的占用位图按位或
+
+        Args:
+            sources: 课表来源
+            max_workers: 线程池大小，课表数量达到 PARALLEL_THRESHOLD 时生效
+        """
+        sources = list(sources)
+        if max_workers and len(sources) >= PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                bitmaps = list(pool.map(self.busy_bitmap_of, sources))
+        else:
+            bitmaps = [self.busy_bitmap_of(source) for source in sources]
+        return reduce(or_, bitmaps, 0)
+
+    def common_free(self, sources: Iterable[ScheduleSource], max_workers: Optional[int] = None) -> int:
+        """所有课表都空闲的格子位图"""
+        return self.all_cells & ~self.combined_busy(sources, max_workers)
+
+    def cells(self, bitmap: int) -> List[Tuple[int, int, int]]:
+        """把位图解码为 (周次, 星期, 节次) 列表，按时间先后排序"""
+        result = []
+        for bit in iter_rows(bitmap):
+            week_offset, cell = divmod(bit, self.week_width)
+            day_offset, section_offset = divmod(cell, self.sections_per_day)
+            result.append((self.start_week + week_offset, day_offset + 1, section_offset + 1))
+        return result
+
+    def find_common_free_cells(
+        self,
+        sources: Iterable[ScheduleSource],
+        max_workers: Optional[int] = None,
+    ) -> List[Tuple[int, int, int]]:
+        """
+        所有课表共同空闲的 (周次, 星期, 节次)
+
+        Args:
+            sources: 课表来源
+            max_workers: 线程池大小，课表数量达到 PARALLEL_THRESHOLD 时生效
+
+        Returns:
+            (周次, 星期, 节次) 列表
+        """
+        return self.cells(self.common_free(sources, max_workers))
+
+
+def _details_of(source: ScheduleSource) -> Iterable[CourseDetail]:
+    if isinstance(source, Schedule):
+        return source.course_details
+    schedule = getattr(source, "schedule", None)  # ScheduleManager
+    if isinstance(schedule, Schedule):
+        return schedule.course_details
+    return source
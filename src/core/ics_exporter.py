@@ -0,0 +1,174 @@
+"""
+iCalendar (.ics) 导出
+
+每个课程块只输出一个 VEVENT，用 RRULE 描述重复（每周，单双周为 INTERVAL=2），
+同一课程拆成多段周次（如 1-8 周、10-16 周）时合并为一个事件，中间缺的周用 EXDATE 排除，
+不逐次展开，整学期课表导出只有几 KB
+时间使用浮动时间（不带时区），日历应用按设备所在时区显示
+"""
+
+import hashlib
+from datetime import date, datetime, time, timezone
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+try:
+    from ..models.course_base import CourseBase
+    from ..models.schedule import Schedule
+    from ..models.time_slot import TimeSlot
+    from .detail_table import iter_rows, week_mask_of
+    from .week_calculator import WeekCalculator
+except ImportError:
+    from models.course_base import CourseBase
+    from models.schedule import Schedule
+    from models.time_slot import TimeSlot
+    from core.detail_table import iter_rows, week_mask_of
+    from core.week_calculator import WeekCalculator
+
+PRODID = "-//WakeUp Schedule//Course Calendar//ZH"
+# RFC 5545：每行最多 75 个字节，超出部分折行
+MAX_LINE_OCTETS = 75
+
+
+def escape_text(value: str) -> str:
+    """TEXT 类型的转义"""
+    return (value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+            .replace("\r\n", "\\n").replace("\n", "\\n"))
+
+
+def fold_line(line: str) -> str:
+    """按 UTF-8 字节数折行，不拆开多字节字符"""
+    if len(line.encode("utf-8")) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts, current, size = [], [], 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        # 续行以一个空格开头，占一个字节
+        limit = MAX_LINE_OCTETS if not parts else MAX_LINE_OCTETS - 1
+        if size + width > limit:
+            parts.append("".join(current))
+            current, size = [], 0
+        current.append(char)
+        size += width
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _format_datetime(day: date, at: time) -> str:
+    return f"{day:%Y%m%d}T{at:%H%M%S}"
+
+
+class ICSExporter:
+    """
+    课表日历导出器
+
+    Example:
+        with open("schedule.ics", "w", encoding="utf-8", newline="") as f:
+            ICSExporter(schedule, time_slots).write(f)
+    """
+
+    def __init__(
+        self,
+        schedule: Schedule,
+        time_slots: Sequence[TimeSlot],
+        calendar_name: str = "课表",
+        dtstamp: Optional[datetime] = None,
+    ):
+        """
+        Args:
+            schedule: 课表（课程、学期开始日期）
+            time_slots: 作息时间，决定每节课的起止时间
+            calendar_name: 日历名称 (X-WR-CALNAME)
+            dtstamp: 生成时间，默认为当前时间（测试时可固定）
+        """
+        self.schedule = schedule
+        self.slots: Dict[int, TimeSlot] = {slot.section_number: slot for slot in time_slots}
+        self.calendar_name = calendar_name
+        self.dtstamp = (dtstamp or datetime.now(timezone.utc)).strftime("%Y%m%dT%H%M%SZ")
+        self.week_calculator = WeekCalculator(schedule.semester_start_date)
+        self.skipped = 0  # 作息时间中没有对应节次而未导出的课程块数
+
+    def _event_groups(self) -> Iterator[Tuple[Tuple, int]]:
+        """按 (课程, 时间, 地点, 教师) 合并课程块，返回 (分组键, 上课周位图)"""
+        groups: Dict[Tuple, int] = {}
+        for detail in self.schedule.course_details:
+            key = (detail.course_id, detail.day_of_week, detail.start_section, detail.step,
+                   detail.location, detail.teacher)
+            groups[key] = groups.get(key, 0) | week_mask_of(detail)
+        return iter(groups.items())
+
+    def _event_lines(self, base: Optional[CourseBase], key: Tuple, mask: int) -> List[str]:
+        course_id, day, start_section, step, location, teacher = key
+        weeks = list(iter_rows(mask))
+        first, last = weeks[0], weeks[-1]
+        # 所有上课周奇偶相同（单周或双周课程）时隔周重复
+        interval = 2 if len(weeks) > 1 and all((w - first) % 2 == 0 for w in weeks) else 1
+        excluded = [w for w in range(first, last + 1, interval) if not mask >> w & 1]
+        count = (last - first) // interval + 1
+
+        start_slot, end_slot = self.slots[start_section], self.slots[start_section + step - 1]
+        first_day = self.week_calculator.date_of(first, day)
+        name = base.name if base else course_id
+        uid = hashlib.sha1(
+            f"{self.schedule.semester_start_date}|{'|'.join(map(str, key))}".encode("utf-8")
+        ).hexdigest()
+
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{uid}@wakeup-schedule",
+            f"DTSTAMP:{self.dtstamp}",
+            f"DTSTART:{_format_datetime(first_day, start_slot.start_time)}",
+            f"DTEND:{_format_datetime(first_day, end_slot.end_time)}",
+            f"RRULE:FREQ=WEEKLY;INTERVAL={interval};COUNT={count}",
+        ]
+        if excluded:
+            lines.append("EXDATE:" + ",".join(
+                _format_datetime(self.week_calculator.date_of(w, day), start_slot.start_time)
+                for w in excluded
+            ))
+        lines.append(f"SUMMARY:{escape_text(name)}")
+        if location:
+            lines.append(f"LOCATION:{escape_text(location)}")
+        description = f"第{start_section}-{start_section + step - 1}节"
+        if teacher:
+            description = f"教师: {teacher}\n{description}"
+        lines.append(f"DESCRIPTION:{escape_text(description)}")
+        lines.append("END:VEVENT")
+        return lines
+
+    def write(self, fp: TextIO) -> int:
+        """
+        把日历逐个事件写入文本文件对象（以 newline="" 打开，保留 CRLF）
+
+        Returns:
+            写入的事件数
+        """
+        bases = {base.course_id: base for base in self.schedule.course_bases}
+        write = fp.write
+        for line in ("BEGIN:VCALENDAR", "VERSION:2.0", f"PRODID:{PRODID}", "CALSCALE:GREGORIAN",
+                     "METHOD:PUBLISH", f"X-WR-CALNAME:{escape_text(self.calendar_name)}"):
+            write(fold_line(line))
+
+        events = 0
+        self.skipped = 0
+        for key, mask in self._event_groups():
+            start_section, step = key[2], key[3]
+            if not mask or start_section not in self.slots or start_section + step - 1 not in self.slots:
+                self.skipped += 1
+                continue
+            for line in self._event_lines(bases.get(key[0]), key, mask):
+                write(fold_line(line))
+            events += 1
+
+        write("END:VCALENDAR\r\n")
+        return events
+
+    def export(self, path) -> int:
+        """导出到文件，返回事件数"""
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            return self.write(f)
+
+    def to_string(self) -> str:
+        import io
+        buffer = io.StringIO(newline="")
+        self.write(buffer)
+        return buffer.getvalue()
@@ -0,0 +1,271 @@
+"""
+iCalendar 订阅源服务
+
+在本机启动一个 asyncio HTTP 服务，把课表以 .ics 订阅源提供给手机/电脑日历。
+日历应用每隔几分钟轮询一次：响应带 ETag / Last-Modified，客户端带上
+If-None-Match / If-Modified-Since 且课表未变时直接返回 304；
+只有存储层报告数据变化（change_token 改变）时才重新生成日历内容。
+不依赖 PyQt6，可由 main_feed.py 单独运行
+"""
+
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Callable, Hashable, List, Optional, Tuple
+
+try:
+    from ..models.schedule import Schedule
+    from ..models.time_slot import TimeSlot
+    from .ics_exporter import ICSExporter
+except ImportError:
+    from models.schedule import Schedule
+    from models.time_slot import TimeSlot
+    from core.ics_exporter import ICSExporter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEED_PATH = "/schedule.ics"
+# 请求头的最大字节数，超出则断开连接
+MAX_HEADER_BYTES = 16 * 1024
+# 空闲的保持连接等待下一个请求的秒数
+KEEP_ALIVE_TIMEOUT = 15
+
+_REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found",
+            405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+@dataclass(frozen=True)
+class FeedSnapshot:
+    """一次生成的日历内容"""
+    body: bytes
+    etag: str           # 带引号的强校验值
+    last_modified: int  # 内容最后变化的时刻（整秒，Unix 时间戳），同时用作 DTSTAMP
+    token: Hashable     # 生成时的存储变化标记
+
+    @property
+    def last_modified_http(self) -> str:
+        return formatdate(self.last_modified, usegmt=True)
+
+    def not_modified(self, if_none_match: Optional[str], if_modified_since: Optional[str]) -> bool:
+        """
+        按条件请求头判断客户端缓存是否仍然有效
+
+        同时带两个头时以 If-None-Match 为准（RFC 9110）
+        """
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            # 弱比较：W/"x" 与 "x" 视为相同
+            return "*" in tags or any(tag.removeprefix("W/") == self.etag for tag in tags)
+        if if_modified_since is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return self.last_modified <= since
+        return False
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def _etag(body: bytes) -> str:
+    return '"%s"' % hashlib.sha1(body).hexdigest()
+
+
+class ICSFeed:
+    """
+    按需重建的日历订阅源
+
+    Args:
+        load: 读取课表，返回 (Schedule, 作息时间列表)
+        change_token: 返回存储层的变化标记（如数据文件的修改时间和大小），
+            与上次生成时相同就复用缓存的内容
+        calendar_name: 日历名称
+    """
+
+    def __init__(
+        self,
+        load: Callable[[], Tuple[Schedule, List[TimeSlot]]],
+        change_token: Callable[[], Hashable],
+        calendar_name: str = "课表",
+    ):
+        self._load = load
+        self._change_token = change_token
+        self.calendar_name = calendar_name
+        self._snapshot: Optional[FeedSnapshot] = None
+        self._lock = asyncio.Lock()
+        self.builds = 0  # 生成次数
+
+    def build(self, token: Hashable, previous: Optional[FeedSnapshot] = None) -> FeedSnapshot:
+        """
+        读取课表并生成日历内容（同步，可能读文件）
+
+        DTSTAMP 先沿用上一次的生成时刻：课表内容没变时正文逐字节相同，
+        ETag 和 Last-Modified 都保持不变，客户端继续得到 304；
+        内容有变化时再以当前时刻重新生成
+        """
+        schedule, time_slots = self._load()
+        self.builds += 1
+        if previous is not None:
+            stamp = datetime.fromtimestamp(previous.last_modified, timezone.utc)
+            body = self._render(schedule, time_slots, stamp)
+            if _etag(body) == previous.etag:
+                return replace(previous, token=token)
+        stamp = _now()
+        body = self._render(schedule, time_slots, stamp)
+        return FeedSnapshot(body=body, etag=_etag(body), last_modified=int(stamp.timestamp()), token=token)
+
+    def _render(self, schedule: Schedule, time_slots: List[TimeSlot], dtstamp: datetime) -> bytes:
+        return ICSExporter(schedule, time_slots, self.calendar_name, dtstamp).to_string().encode("utf-8")
+
+    async def current(self) -> FeedSnapshot:
+        """当前的日历内容；存储有变化时在线程池中重建，同时到达的请求只重建一次"""
+        token = self._change_token()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.token == token:
+            return snapshot
+        async with self._lock:
+            snapshot = self._snapshot
+            if snapshot is None or snapshot.token != token:
+                # 内容没变（如只是保存了一次）时 ETag 和 Last-Modified 保持不变
+                snapshot = await asyncio.get_running_loop().run_in_executor(
+                    None, self.build, token, self._snapshot)
+                self._snapshot = snapshot
+                logger.info(f"日历订阅源已重建 ({len(snapshot.body)} 字节)")
+        return snapshot
+
+
+class ICSFeedServer:
+    """
+    日历订阅源 HTTP 服务（HTTP/1.1，支持 GET / HEAD 和保持连接）
+
+    Example:
+        server = ICSFeedServer(feed, "127.0.0.1", 8765)
+        await server.start()
+        await server.serve_forever()
+    """
+
+    def __init__(self, feed: ICSFeed, host: str = "127.0.0.1", port: int = 8765,
+                 path: str = DEFAULT_FEED_PATH):
+        self.feed = feed
+        self.host = host
+        self.port = port
+        self.path = path
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}{self.path}"
+
+    async def start(self):
+        """开始监听；port 为 0 时绑定后更新为实际端口"""
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, limit=MAX_HEADER_BYTES
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"日历订阅地址: {self.url}")
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, target, version, headers = request
+                keep_alive = self._keep_alive(version, headers)
+                await self._respond(writer, method, target, headers, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.TimeoutError, asyncio.LimitOverrunError, ValueError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _read_request(reader: asyncio.StreamReader):
+        """
+        读取请求行和请求头；客户端在两个请求之间关闭连接（保持连接的正常结束）时返回 None
+
+        Raises:
+            ValueError: 请求头不完整（读到一半连接被关闭）或格式错误
+        """
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEP_ALIVE_TIMEOUT)
+        except asyncio.IncompleteReadError as e:
+            if not e.partial:
+                return None
+            raise ValueError("请求头不完整") from e
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, version = lines[0].split(" ", 2)
+        headers = {}
+        for line in lines[1:]:
+            if line:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+        return method.upper(), target, version.strip().upper(), headers
+
+    @staticmethod
+    def _keep_alive(version: str, headers: dict) -> bool:
+        connection = headers.get("connection", "").lower()
+        if version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+    async def _respond(self, writer, method: str, target: str, headers: dict, keep_alive: bool):
+        path = target.split("?", 1)[0]
+        if path != self.path:
+            return await self._send(writer, 404, keep_alive)
+        if method not in ("GET", "HEAD"):
+            return await self._send(writer, 405, keep_alive, extra={"Allow": "GET, HEAD"})
+
+        try:
+            snapshot = await self.feed.current()
+        except Exception as e:
+            logger.error(f"生成日历订阅源失败: {e}")
+            return await self._send(writer, 500, keep_alive)
+
+        validators = {"ETag": snapshot.etag, "Last-Modified": snapshot.last_modified_http,
+                      "Cache-Control": "no-cache"}
+        if snapshot.not_modified(headers.get("if-none-match"), headers.get("if-modified-since")):
+            return await self._send(writer, 304, keep_alive, extra=validators)
+        validators["Content-Type"] = "text/calendar; charset=utf-8"
+        await self._send(writer, 200, keep_alive, body=snapshot.body, extra=validators,
+                         include_body=method == "GET")
+
+    @staticmethod
+    async def _send(writer, status: int, keep_alive: bool, body: bytes = b"",
+                    extra: Optional[dict] = None, include_body: bool = True):
+        lines = [f"HTTP/1.1 {status} {_REASONS[status]}", f"Date: {formatdate(usegmt=True)}"]
+        lines += [f"{name}: {value}" for name, value in (extra or {}).items()]
+        if status != 304:
+            lines.append(f"Content-Length: {len(body)}")
+        lines.append("Connection: keep-alive" if keep_alive else "Connection: close")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if include_body and status != 304:
+            writer.write(body)
+        await writer.drain()
+
+
+def run_feed_server(feed: ICSFeed, host: str = "127.0.0.1", port: int = 8765,
+                    path: str = DEFAULT_FEED_PATH):
+    """阻塞运行订阅源服务，直到 Ctrl+C"""
+    asyncio.run(ICSFeedServer(feed, host, port, path).serve_forever())
@@ -0,0 +1,150 @@
+"""
+导入合并引擎
+
+把新导入的课表与当前课表按课程块指纹比对，只应用变化的部分：
+- 指纹（课程名、星期、节次、上课周位图、地点、教师）相同：未变，保留原课程块（颜色、ID 不变）
+- 课程名、星期、节次相同但周次/地点/教师不同：变更，原位替换
+- 其余新课程块：新增；当前课表中没有被匹配到的课程块：移除
+
+两边各建一次哈希索引，比对为 O(n)，重复导入同一份课表不会产生重复课程块
+"""
+
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Collection, Dict, Hashable, List, Optional, Sequence, Tuple
+
+try:
+    from ..models.course_base import CourseBase
+    from ..models.course_detail import CourseDetail
+    from .detail_table import week_mask_of
+except ImportError:
+    from models.course_base import CourseBase
+    from models.course_detail import CourseDetail
+    from core.detail_table import week_mask_of
+
+Course = Tuple[CourseBase, CourseDetail]
+
+
+def fingerprint(course: Course) -> Tuple:
+    """课程块的规范指纹，与课程ID、颜色无关，周次按实际上课周的位图比较"""
+    base, detail = course
+    return (base.name, detail.day_of_week, detail.start_section, detail.step,
+            week_mask_of(detail), detail.location, detail.teacher)
+
+
+def slot_key(course: Course) -> Tuple:
+    """同一课程块的时间位置，用于识别周次、地点、教师发生变化的课程块"""
+    base, detail = course
+    return (base.name, detail.day_of_week, detail.start_section, detail.step)
+
+
+def pair_courses(bases: Sequence[CourseBase], details: Sequence[CourseDetail]) -> List[Course]:
+    """把导入器返回的 CourseBase / CourseDetail 按课程ID配成 (base, detail) 列表"""
+    base_map = {b.course_id: b for b in bases}
+    return [(base_map[d.course_id], d) for d in details if d.course_id in base_map]
+
+
+def _index(keys: Sequence[Hashable], usable: Optional[Sequence[bool]] = None) -> Dict[Hashable, deque]:
+    """key -> 下标队列（保持原顺序，重复的课程块按出现次数逐个 popleft 匹配）"""
+    index: Dict[Hashable, deque] = {}
+    for i, key in enumerate(keys):
+        if usable is None or usable[i]:
+            index.setdefault(key, deque()).append(i)
+    return index
+
+
+@dataclass
+class MergeResult:
+    """一次合并的比对结果"""
+    unchanged: List[Course] = field(default_factory=list)
+    added: List[Course] = field(default_factory=list)
+    changed: List[Tuple[Course, Course]] = field(default_factory=list)  # (原课程块, 新课程块)
+    removed: List[Course] = field(default_factory=list)  # 导入中没有的原课程块
+    merged: List[Course] = field(default_factory=list)  # 应用后的课程列表
+    remove_missing: bool = False  # removed 是否已从 merged 中移除
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or (self.removed and self.remove_missing))
+
+    def summary(self) -> str:
+        parts = [f"新增 {len(self.added)}", f"更新 {len(self.changed)}", f"未变 {len(self.unchanged)}"]
+        if self.removed:
+            parts.append(f"移除 {len(self.removed)}" if self.remove_missing
+                         else f"未出现在导入中 {len(self.removed)}")
+        return "，".join(parts)
+
+
+def merge_courses(
+    existing: Sequence[Course],
+    incoming: Sequence[Course],
+    remove_missing: bool = False,
+    removable: Optional[Collection[Tuple]] = None,
+) -> MergeResult:
+    """
+    把导入结果合并进当前课表
+
+    Args:
+        existing: 当前课表 (CourseBase, CourseDetail) 列表
+        incoming: 新导入的 (CourseBase, CourseDetail) 列表
+        remove_missing: 是否移除新导入中不存在的课程块（整学期重新同步时为 True，
+            手动导入默认只增不删，避免误删手动添加的课程）
+        removable: 只有指纹在其中的课程块（如上次同步带来的课程块）可被更新或移除，
+            其余课程块（手动添加、其他来源导入）即使时间位置相同或不在新导入中也保持原样；
+            None 表示都可更新、移除
+
+    Returns:
+        MergeResult，merged 为新的课程列表（不修改 existing，调用方整体替换即可让缓存失效）
+    """
+    result = MergeResult(remove_missing=remove_missing)
+    existing_fps = [fingerprint(course) for course in existing]
+    owned = [removable is None or fp in removable for fp in existing_fps]
+    by_fingerprint = _index(existing_fps)
+    # 同名课程沿用已有的 CourseBase，保持颜色和课程ID
+    bases_by_name = {}
+    for base, _ in existing:
+        bases_by_name.setdefault(base.name, base)
+
+    # 第一轮：指纹完全相同的课程块
+    matched = [False] * len(existing)
+    pending = []
+    for course in incoming:
+        candidates = by_fingerprint.get(fingerprint(course))
+        if candidates:
+            i = candidates.popleft()
+            matched[i] = True
+            result.unchanged.append(existing[i])
+        else:
+            pending.append(course)
+
+    # 第二轮：时间位置相同的课程块视为变更，其余为新增；只在未匹配且可更新的课程块中查找
+    updatable = [owned[i] and not matched[i] for i in range(len(existing))]
+    by_slot = _index([slot_key(course) for course in existing], updatable)
+    replacements: Dict[int, Course] = {}
+    for course in pending:
+        base, detail = course
+        candidates = by_slot.get(slot_key(course))
+        if candidates:
+            i = candidates.popleft()
+            matched[i] = True
+            old_base = existing[i][0]
+            new_course = (old_base, replace(detail, course_id=old_base.course_id))
+            replacements[i] = new_course
+            result.changed.append((existing[i], new_course))
+        else:
+            known = bases_by_name.get(base.name)
+            if known is None:
+                known = bases_by_name[base.name] = base
+            new_course = (known, replace(detail, course_id=known.course_id) if known is not base else detail)
+            result.added.append(new_course)
+
+    for i, course in enumerate(existing):
+        protected = remove_missing and not owned[i]
+        if i in replacements:
+            result.merged.append(replacements[i])
+        elif matched[i] or not remove_missing or protected:
+            result.merged.append(course)
+        if not matched[i] and not protected:
+            result.removed.append(course)
+    result.merged.extend(result.added)
+    return result
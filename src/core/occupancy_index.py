@@ -0,0 +1,250 @@
+"""
+教室 / 教师占用索引
+
+按教室和教师分别记录占用情况：每个资源一个 array('Q')，
+下标为 (星期, 节次) 格子，值为该格子被占用的周次位图（第 w 位表示第 w 周）
+查询空闲教室、共同空闲时间时只需对这些位图做按位或/与
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    from .detail_table import DetailTable, MAX_WEEK
+except ImportError:
+    from core.detail_table import DetailTable, MAX_WEEK
+
+# 资源类型 -> DetailTable 中的字典编码列
+RESOURCE_COLUMNS = {
+    "room": "location",
+    "teacher": "teacher",
+}
+
+
+def week_range_mask(start_week: int, end_week: int) -> int:
+    """第 start_week 到 end_week 周的位图"""
+    start = max(start_week, 1)
+    end = min(end_week, MAX_WEEK)
+    if start > end:
+        return 0
+    return ((1 << (end + 1)) - 1) ^ ((1 << start) - 1)
+
+
+class OccupancyIndex:
+    """
+    教室 / 教师占用索引
+
+    由 DetailTable 构建，构建后只读；空字符串的教室或教师不参与索引
+    """
+
+    def __init__(self, table: DetailTable, sections_per_day: int = 12):
+        """
+        Args:
+            table: 列式课程详情表
+            sections_per_day: 每天节数，课程超出时自动扩展
+        """
+        last_section = max(
+            (start + step - 1 for start, step in zip(table.start_section, table.step)),
+            default=0
+        )
+        self.sections_per_day = max(sections_per_day, last_section)
+        self._occupancy: Dict[str, Dict[str, array]] = {
+            kind: self._build(table, column) for kind, column in RESOURCE_COLUMNS.items()
+        }
+
+    def _build(self, table: DetailTable, column: str) -> Dict[str, array]:
+        names = table.distinct(column)
+        codes = getattr(table, column)
+        cells = 7 * self.sections_per_day
+        slots: List[Optional[array]] = [None] * len(names)
+
+        day, start_section, step, week_mask = table.day, table.start_section, table.step, table.week_mask
+        for row in range(len(table)):
+            if not 1 <= day[row] <= 7 or start_section[row] < 1:
+                continue
+            code = codes[row]
+            occupied = slots[code]
+            if occupied is None:
+                occupied = slots[code] = array('Q', bytes(8 * cells))
+            base = self._cell(day[row], start_section[row])
+            for cell in range(base, base + step[row]):
+                occupied[cell] |= week_mask[row]
+
+        return {
+            name: occupied
+            for name, occupied in zip(names, slots)
+            if name and occupied is not None
+        }
+
+    def _cell(self, day: int, section: int) -> int:
+        return (day - 1) * self.sections_per_day + section - 1
+
+    def _cells(self, day: int, start_section: int, end_section: int) -> range:
+        """
+        某天某几节对应的格子下标
+
+        Raises:
+            ValueError: 星期或节次超出范围（否则会读到下一天的格子）
+        """
+        if not 1 <= day <= 7:
+            raise ValueError(f"无效的星期: {day}")
+        if not 1 <= start_section <= end_section <= self.sections_per_day:
+            raise ValueError(
+                f"无效的节次范围: {start_section}-{end_section}（每天 {self.sections_per_day} 节）"
+            )
+        base = self._cell(day, start_section)
+        return range(base, base + end_section - start_section + 1)
+
+    @staticmethod
+    def _week_bit(week: int) -> int:
+        """第 week 周在占用位图中的位"""
+        if week < 1:
+            raise ValueError(f"无效的周次: {week}")
+        return 1 << week
+
+    def _resources(self, kind: str) -> Dict[str, array]:
+        try:
+            return self._occupancy[kind]
+        except KeyError:
+            raise ValueError(f"不支持的资源类型: {kind}") from None
+
+    def names(self, kind: str) -> List[str]:
+        """索引中的所有教室或教师"""
+        return list(self._resources(kind))
+
+    def busy_weeks(self, kind: str, name: str, day: int, start_section: int, end_section: int) -> int:
+        """
+        资源在某天某几节被占用的周次位图
+
+        Args:
+            kind: "room" / "teacher"
+            name: 教室或教师名
+            day: 星期几（1-7）
+            start_section: 开始节次
+            end_section: 结束节次
+
+        Raises:
+            ValueError: 星期或节次超出范围
+        """
+        cells = self._cells(day, start_section, end_section)
+        occupied = self._resources(kind).get(name)
+        if occupied is None:
+            return 0
+        mask = 0
+        for cell in cells:
+            mask |= occupied[cell]
+        return mask
+
+    def is_free(self, kind: str, name: str, day: int, start_section: int, end_section: int, week: int) -> bool:
+        """资源在第 week 周的某天某几节是否空闲"""
+        bit = self._week_bit(week)
+        return not self.busy_weeks(kind, name, day, start_section, end_section) & bit
+
+    def free_resources(
+        self,
+        kind: str,
+        day: int,
+        start_section: int,
+        end_section: int,
+        week: int,
+        candidates: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """
+        在第 week 周某天某几节空闲的教室或教师
+
+        Args:
+            kind: "room" / "teacher"
+            day: 星期几（1-7）
+            start_section: 开始节次
+            end_section: 结束节次
+            week: 周次
+            candidates: 只在这些名称中查找，默认为索引中的全部资源
+
+        Returns:
+            空闲资源名称列表（按名称排序）
+
+        Raises:
+            ValueError: 星期、节次或周次超出范围
+        """
+        resources = self._resources(kind)
+        cells = self._cells(day, start_section, end_section)
+        bit = self._week_bit(week)
+        if candidates is None:
+            candidates = resources.keys()
+
+        free = []
+        for name in candidates:
+            occupied = resources.get(name)
+            if occupied is None or not any(occupied[cell] & bit for cell in cells):
+                free.append(name)
+        free.sort()
+        return free
+
+    def free_rooms(self, day: int, start_section: int, end_section: int, week: int) -> List[str]:
+        """第 week 周某天某几节的空闲教室，如 free_rooms(3, 3, 4, 7) 即第 7 周周三 3-4 节"""
+        return self.free_resources("room", day, start_section, end_section, week)
+
+    def free_teachers(self, day: int, start_section: int, end_section: int, week: int) -> List[str]:
+        """第 week 周某天某几节没有课的教师"""
+        return self.free_resources("teacher", day, start_section, end_section, week)
+
+    def earliest_common_free_slot(
+        self,
+        names: Iterable[str],
+        step: int = 2,
+        kind: str = "teacher",
+        start_week: int = 1,
+        end_week: int = 20,
+        days: Iterable[int] = range(1, 8),
+    ) -> Optional[Tuple[int, int, int]]:
+        """
+        一组教师（或教室）最早的共同空闲时间
+
+        先把所有人的占用位图按格子求或，再对每个 (星期, 开始节次) 取连续 step 节的并集，
+        取反后最低位就是该时段最早的空闲周
+
+        Args:
+            names: 教师或教室名称
+            step: 需要连续空闲的节数
+            kind: "teacher" / "room"
+            start_week: 从第几周开始找
+            end_week: 找到第几周为止
+            days: 允许的星期
+
+        Returns:
+            (周次, 星期, 开始节次)，找不到时返回 None
+
+        Raises:
+            ValueError: 星期超出范围或 step 小于 1
+        """
+        resources = self._resources(kind)
+        if step < 1:
+            raise ValueError(f"无效的连续节数: {step}")
+        days = list(days)
+        for day in days:
+            if not 1 <= day <= 7:
+                raise ValueError(f"无效的星期: {day}")
+        cells = 7 * self.sections_per_day
+        busy = [0] * cells
+        for name in names:
+            occupied = resources.get(name)
+            if occupied is None:
+                continue
+            for cell in range(cells):
+                busy[cell] |= occupied[cell]
+
+        weeks = week_range_mask(start_week, end_week)
+        best = None
+        for day in days:
+            for start in range(1, self.sections_per_day - step + 2):
+                base = self._cell(day, start)
+                taken = 0
+                for cell in range(base, base + step):
+                    taken |= busy[cell]
+                free = weeks & ~taken
+                if not free:
+                    continue
+                candidate = ((free & -free).bit_length() - 1, day, start)
+                if best is None or candidate < best:
+                    best = candidate
+        return best
@@ -0,0 +1,187 @@
+"""
+无界面提醒守护进程
+
+不依赖 PyQt6，只加载一次课表，预先计算当天的提醒日程，
+然后休眠到下一个事件发生的时刻
+"""
+
+import time
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional
+
+try:
+    from ..models.course_base import CourseBase
+    from ..models.course_detail import CourseDetail
+    from ..models.time_slot import TimeSlot
+    from .schedule_manager import ScheduleManager
+except ImportError:
+    from models.course_base import CourseBase
+    from models.course_detail import CourseDetail
+    from models.time_slot import TimeSlot
+    from core.schedule_manager import ScheduleManager
+
+logger = logging.getLogger(__name__)
+
+# 单次休眠的最长秒数，防止系统休眠或调整时钟后错过提醒
+MAX_SLEEP_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class AgendaItem:
+    """
+    日程条目
+    包含：提醒时刻、上课时刻、课程基础信息、课程详情
+    """
+    remind_at: datetime
+    start_at: datetime
+    base: CourseBase
+    detail: CourseDetail
+
+    @property
+    def title(self) -> str:
+        return f"课程提醒: {self.base.name}"
+
+    def message(self, remind_minutes: int) -> str:
+        return f"还有 {remind_minutes} 分钟上课\n地点: {self.detail.location}"
+
+
+def build_daily_agenda(
+    schedule_manager: ScheduleManager,
+    time_slots: List[TimeSlot],
+    remind_minutes: int,
+    target_date: Optional[date] = None
+) -> List[AgendaItem]:
+    """
+    预先计算指定日期的提醒日程
+
+    Args:
+        schedule_manager: 课表管理器
+        time_slots: 时间段列表
+        remind_minutes: 提前提醒的分钟数
+        target_date: 目标日期，默认为今天
+
+    Returns:
+        按提醒时刻排序的日程条目列表
+    """
+    if target_date is None:
+        courses = schedule_manager.get_today_courses()
+        target_date = date.today()
+    else:
+        courses = schedule_manager.get_courses_for_date(target_date)
+
+    slot_map = {ts.section_number: ts for ts in time_slots}
+    agenda = []
+
+    for base, detail in courses:
+        slot = slot_map.get(detail.start_section)
+        if slot is None:
+            continue
+        start_at = datetime.combine(target_date, slot.start_time)
+        remind_at = start_at - timedelta(minutes=remind_minutes)
+        agenda.append(AgendaItem(remind_at, start_at, base, detail))
+
+    agenda.sort(key=lambda item: item.remind_at)
+    return agenda
+
+
+class ReminderDaemon:
+    """
+    提醒守护进程
+
+    每天零点重新计算一次日程，其余时间休眠到下一条提醒
+    """
+
+    def __init__(
+        self,
+        schedule_manager: ScheduleManager,
+        time_slots: List[TimeSlot],
+        remind_minutes: int = 15,
+        notifier: Optional[Callable[[str, str], None]] = None,
+        now_func: Callable[[], datetime] = datetime.now,
+        sleep_func: Callable[[float], None] = time.sleep
+    ):
+        """
+        初始化提醒守护进程
+
+        Args:
+            schedule_manager: 课表管理器
+            time_slots: 时间段列表
+            remind_minutes: 提前提醒的分钟数
+            notifier: 通知回调 (title, message)，默认写入日志
+            now_func: 获取当前时间的函数（便于测试）
+            sleep_func: 休眠函数（便于测试）
+        """
+        self.schedule_manager = schedule_manager
+        self.time_slots = time_slots
+        self.remind_minutes = remind_minutes
+        self.notifier = notifier or self._log_notification
+        self._now = now_func
+        self._sleep = sleep_func
+        self._running = False
+
+    def build_agenda(self, target_date: date) -> List[AgendaItem]:
+        """计算指定日期的日程"""
+        return build_daily_agenda(
+            self.schedule_manager, self.time_slots, self.remind_minutes, target_date
+        )
+
+    def pending_items(self, now: datetime) -> List[AgendaItem]:
+        """
+        获取今天尚未提醒的日程
+
+        提醒时刻已过但课程尚未开始的条目仍然保留，
+        这样在课前启动守护进程也能立即收到提醒
+        """
+        return [item for item in self.build_agenda(now.date()) if item.start_at > now]
+
+    def run(self, max_days: Optional[int] = None):
+        """
+        进入主循环
+
+        Args:
+            max_days: 最多运行的天数，None 表示一直运行
+        """
+        self._running = True
+        days = 0
+        while self._running:
+            now = self._now()
+            agenda = self.pending_items(now)
+            logger.info(f"今日日程已生成，共 {len(agenda)} 条提醒")
+
+            for item in agenda:
+                if not self._sleep_until(item.remind_at):
+                    return
+                self.notifier(item.title, item.message(self.remind_minutes))
+
+            days += 1
+            if max_days is not None and days >= max_days:
+                break
+
+            tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+            if not self._sleep_until(tomorrow):
+                return
+        self._running = False
+
+    def stop(self):
+        """请求退出主循环（在下一次醒来时生效）"""
+        self._running = False
+
+    def _sleep_until(self, target: datetime) -> bool:
+        """
+        休眠到指定时刻
+
+        Returns:
+            是否仍在运行
+        """
+        while self._running:
+            remaining = (target - self._now()).total_seconds()
+            if remaining <= 0:
+                return True
+            self._sleep(min(remaining, MAX_SLEEP_SECONDS))
+        return False
+
+    @staticmethod
+    def _log_notification(title: str, message: str):
+        logger.info(f"{title} | {message.replace(chr(10), ' ')}")
@@ -4,7 +4,7 @@
 负责课表的查询、过滤等高级操作
 """
 
-from typing import List, Tuple
+from typing import Iterable, List, Optional, Tuple
 from datetime import date
 
 try:
@@ -12,11 +12,19 @@ try:
     from ..models.course_detail import CourseDetail
     from ..models.schedule import Schedule
     from .week_calculator import WeekCalculator
+    from .detail_table import DetailTable, DetailTableCache
+    from .occupancy_index import OccupancyIndex
+    from .free_time_finder import FreeTimeFinder
+    from .semester_grid import SemesterGrid
 except ImportError:
     from models.course_base import CourseBase
     from models.course_detail import CourseDetail
     from models.schedule import Schedule
     from core.week_calculator import WeekCalculator
+    from core.detail_table import DetailTable, DetailTableCache
+    from core.occupancy_index import OccupancyIndex
+    from core.free_time_finder import FreeTimeFinder
+    from core.semester_grid import SemesterGrid
 
 
 class ScheduleManager:
@@ -35,6 +43,78 @@ class ScheduleManager:
         """
         self.schedule = schedule
         self.week_calculator = WeekCalculator(schedule.semester_start_date)
+        self._table_cache = DetailTableCache()
+        self._occupancy_index = None
+        self._occupancy_table = None
+        self._semester_grid = None
+        self._grid_table = None
+    
+    def get_detail_table(self) -> DetailTable:
+        """
+        获取当前课表的列式详情表（课程增删后自动重建）
+        
+        Returns:
+            DetailTable
+        """
+        return self._table_cache.get(self.schedule.course_details, self.schedule.version)
+    
+    def get_occupancy_index(self) -> OccupancyIndex:
+        """
+        获取教室 / 教师占用索引（随详情表一起重建）
+        
+        Returns:
+            OccupancyIndex
+        """
+        table = self.get_detail_table()
+        if self._occupancy_table is not table:
+            self._occupancy_index = OccupancyIndex(table)
+            self._occupancy_table = table
+        return self._occupancy_index
+    
+    def get_semester_grid(self) -> SemesterGrid:
+        """
+        获取学期课表物化视图（随详情表一起重建），供提醒、导出等按周查询
+        
+        Returns:
+            SemesterGrid
+        """
+        table = self.get_detail_table()
+        if self._grid_table is not table:
+            self._semester_grid = SemesterGrid(self._with_bases(table.details))
+            self._grid_table = table
+        return self._semester_grid
+    
+    def find_common_free_time(
+        self,
+        others: Iterable,
+        start_week: int = 1,
+        end_week: int = 20,
+        sections_per_day: int = 12,
+        max_workers: Optional[int] = None,
+    ) -> List[Tuple[int, int, int]]:
+        """
+        查找本课表与其他课表共同空闲的时间
+        
+        Args:
+            others: 其他课表（Schedule、ScheduleManager 或 CourseDetail 列表）
+            start_week: 起始周次
+            end_week: 结束周次
+            sections_per_day: 每天节数
+            max_workers: 课表较多时使用的线程池大小
+            
+        Returns:
+            (周次, 星期, 节次) 列表，按时间先后排序
+        """
+        finder = FreeTimeFinder(start_week, end_week, sections_per_day)
+        return finder.find_common_free_cells([self.schedule, *others], max_workers)
+    
+    def invalidate_cache(self) -> None:
+        """
+        绕过 CourseManager 直接修改 course_details 后调用
+
+        递增课表版本号，本管理器和共用同一课表的 ConflictDetector 等都会重建缓存
+        """
+        self.schedule.touch()
     
     def get_courses_for_week(self, week: int) -> List[Tuple[CourseBase, CourseDetail]]:
         """
@@ -48,17 +128,8 @@ class ScheduleManager:
         Returns:
             (CourseBase, CourseDetail) 元组列表
         """
-        result = []
-        
-        for detail in self.schedule.course_details:
-            # 检查该课程是否在指定周次上课
-            if detail.is_in_week(week):
-                # 查找对应的课程基础信息
-                course_base = self._get_course_base_by_id(detail.course_id)
-                if course_base:
-                    result.append((course_base, detail))
-        
-        return result
+        table = self.get_detail_table()
+        return self._with_bases(table.select(table.rows_for_week(week)))
     
     def get_courses_for_day(self, week: int, day: int) -> List[Tuple[CourseBase, CourseDetail]]:
         """
@@ -71,14 +142,8 @@ class ScheduleManager:
         Returns:
             (CourseBase, CourseDetail) 元组列表，按节次排序
         """
-        # 先获取该周的所有课程
-        week_courses = self.get_courses_for_week(week)
-        
-        # 过滤出指定星期的课程
-        day_courses = [
-            (base, detail) for base, detail in week_courses
-            if detail.day_of_week == day
-        ]
+        table = self.get_detail_table()
+        day_courses = self._with_bases(table.select(table.filter(day=day, week=week)))
         
         # 按开始节次排序
         day_courses.sort(key=lambda x: x[1].start_section)
@@ -102,12 +167,23 @@ class ScheduleManager:
         Returns:
             (CourseBase, CourseDetail) 元组列表，按节次排序
         """
-        current_week = self.week_calculator.get_current_week()
-        today = date.today()
+        return self.get_courses_for_date(date.today())
+    
+    def get_courses_for_date(self, target_date: date) -> List[Tuple[CourseBase, CourseDetail]]:
+        """
+        获取指定日期的所有课程
+        
+        Args:
+            target_date: 目标日期
+            
+        Returns:
+            (CourseBase, CourseDetail) 元组列表，按节次排序
+        """
+        week = self.week_calculator.calculate_week(target_date)
         # weekday() 返回 0-6（0=周一），我们需要 1-7
-        day_of_week = today.weekday() + 1
+        day_of_week = target_date.weekday() + 1
         
-        return self.get_courses_for_day(current_week, day_of_week)
+        return self.get_courses_for_day(week, day_of_week)
     
     def set_semester_start_date(self, semester_start_date: date) -> None:
         """
@@ -152,3 +228,21 @@ class ScheduleManager:
             if base.id == course_id:
                 return base
         return None
+    
+    def _with_bases(self, details: List[CourseDetail]) -> List[Tuple[CourseBase, CourseDetail]]:
+        """
+        为课程详细信息配上课程基础信息（内部方法）
+        
+        Args:
+            details: 课程详细信息列表
+            
+        Returns:
+            (CourseBase, CourseDetail) 元组列表，找不到基础信息的详情会被跳过
+        """
+        bases = {base.id: base for base in self.schedule.course_bases}
+        result = []
+        for detail in details:
+            course_base = bases.get(detail.course_id)
+            if course_base:
+                result.append((course_base, detail))
+        return result
@@ -0,0 +1,118 @@
+"""
+学期课表物化视图
+
+课表加载或编辑后一次性算出整个学期每一周的占用网格（周 × 7 天 × 节数），
+课表视图切换周次、提醒检查、冲突查询都直接查表，不再逐门课程判断周次
+网格用 array('i') 存课程下标，大小只与周数和节数有关（20 周 × 7 × 12 节约 6.7 KB）
+"""
+
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    from ..models.course_base import CourseBase
+    from ..models.course_detail import CourseDetail
+    from .detail_table import VersionedCache, MAX_WEEK, iter_rows, week_mask_of
+except ImportError:
+    from models.course_base import CourseBase
+    from models.course_detail import CourseDetail
+    from core.detail_table import VersionedCache, MAX_WEEK, iter_rows, week_mask_of
+
+Course = Tuple[CourseBase, CourseDetail]
+
+# 网格中表示空闲的值
+EMPTY = -1
+
+
+class SemesterGrid:
+    """
+    学期课表物化视图
+
+    cell = ((周次 - 1) * 7 + 星期 - 1) * 节数 + 节次 - 1，值为占用该格子的课程下标
+    多门课程重叠时保留列表中靠前的一门，与课表视图的显示规则一致
+    """
+
+    def __init__(self, courses: Sequence[Course], sections_per_day: int = 12):
+        """
+        Args:
+            courses: (CourseBase, CourseDetail) 列表，与 MainWindow.courses 相同
+            sections_per_day: 每天节数，课程超出时自动扩展
+        """
+        self.courses: List[Course] = list(courses)
+        details = [detail for _, detail in self.courses]
+
+        self.weeks = min(max((d.end_week for d in details), default=0), MAX_WEEK)
+        self.sections_per_day = max(
+            [sections_per_day] + [d.start_section + d.step - 1 for d in details]
+        )
+        self.cells = array('i', [EMPTY]) * (self.weeks * 7 * self.sections_per_day)
+        # 每周上课的课程下标（保持原顺序）
+        self._week_courses = [array('i') for _ in range(self.weeks)]
+
+        for index, d in enumerate(details):
+            if not 1 <= d.day_of_week <= 7 or d.start_section < 1:
+                continue
+            for week in iter_rows(week_mask_of(d)):
+                if week > self.weeks:
+                    break
+                self._week_courses[week - 1].append(index)
+                start = self._cell(week, d.day_of_week, d.start_section)
+                for cell in range(start, start + d.step):
+                    if self.cells[cell] == EMPTY:
+                        self.cells[cell] = index
+
+    def _cell(self, week: int, day: int, section: int) -> int:
+        return ((week - 1) * 7 + day - 1) * self.sections_per_day + section - 1
+
+    def _in_range(self, week: int, day: int, section: int) -> bool:
+        return 1 <= week <= self.weeks and 1 <= day <= 7 and 1 <= section <= self.sections_per_day
+
+    def occupant(self, week: int, day: int, section: int) -> Optional[Course]:
+        """占用某个格子的课程，空闲时返回 None"""
+        if not self._in_range(week, day, section):
+            return None
+        index = self.cells[self._cell(week, day, section)]
+        return self.courses[index] if index != EMPTY else None
+
+    def is_free(self, week: int, day: int, start_section: int, end_section: int) -> bool:
+        """某周某天的若干节是否都没有课"""
+        return all(
+            self.occupant(week, day, section) is None
+            for section in range(start_section, end_section + 1)
+        )
+
+    def courses_for_week(self, week: int) -> List[Course]:
+        """指定周次上课的所有课程（保持原顺序）"""
+        if not 1 <= week <= self.weeks:
+            return []
+        courses = self.courses
+        return [courses[index] for index in self._week_courses[week - 1]]
+
+    def courses_for_day(self, week: int, day: int) -> List[Course]:
+        """指定周次和星期的课程，按开始节次排序"""
+        result = [c for c in self.courses_for_week(week) if c[1].day_of_week == day]
+        result.sort(key=lambda c: c[1].start_section)
+        return result
+
+    def placements(self, week: int) -> List[Course]:
+        """
+        课表视图在指定周次需要绘制的课程块
+
+        课程的开始格子被自己占用时才绘制，被前面的课程占用（冲突）时跳过
+        """
+        if not 1 <= week <= self.weeks:
+            return []
+        cells, courses = self.cells, self.courses
+        result = []
+        for index in self._week_courses[week - 1]:
+            detail = courses[index][1]
+            if cells[self._cell(week, detail.day_of_week, detail.start_section)] == index:
+                result.append(courses[index])
+        return result
+
+
+class SemesterGridCache(VersionedCache):
+    """按需构建并缓存课程列表的 SemesterGrid"""
+
+    def __init__(self, sections_per_day: int = 12):
+        super().__init__(lambda courses: SemesterGrid(courses, sections_per_day))
@@ -9,10 +9,11 @@ from datetime import date
 try:
     from src.models.course_base import CourseBase
     from src.models.course_detail import CourseDetail
-    from src.models.week_type import WeekType
 except ImportError:
     pass
 
+from src.utils.profiler import timed
+
 
 class StorageManager:
     """负责课表数据的持久化存储 (JSON)"""
@@ -23,6 +24,7 @@ class StorageManager:
         os.makedirs(self.data_dir, exist_ok=True)
         self.filepath = os.path.join(self.data_dir, filename)
 
+    @timed()
     def save(self, bases: List, details: List, current_week: int):
         """保存数据"""
         data = {
@@ -31,27 +33,8 @@ class StorageManager:
                 "update_time": str(date.today()),
                 "current_week": current_week
             },
-            "bases": [
-                {
-                    "name": b.name,
-                    "course_id": b.course_id,
-                    "color": b.color,
-                    "note": getattr(b, "note", "")
-                } for b in bases
-            ],
-            "details": [
-                {
-                    "course_id": d.course_id,
-                    "day_of_week": d.day_of_week,
-                    "start_section": d.start_section,
-                    "step": d.step,
-                    "start_week": d.start_week,
-                    "end_week": d.end_week,
-                    "week_type": d.week_type.value,  # 存枚举值
-                    "teacher": d.teacher,
-                    "location": d.location
-                } for d in details
-            ]
+            "bases": [b.to_dict() for b in bases],
+            "details": [d.to_dict() for d in details]
         }
 
         try:
@@ -62,6 +45,19 @@ class StorageManager:
             print(f"保存失败: {e}")
             return False
 
+    def change_token(self):
+        """
+        数据文件的变化标记 (修改时间, 大小)，文件不存在时为 None
+
+        只做一次 stat，供订阅源等轮询方判断是否需要重新加载
+        """
+        try:
+            stat = os.stat(self.filepath)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    @timed()
     def load(self) -> Tuple[List, List, int]:
         """加载数据，返回 (bases, details, current_week)"""
         if not os.path.exists(self.filepath):
@@ -73,36 +69,9 @@ class StorageManager:
 
             current_week = data.get("meta", {}).get("current_week", 1)
 
-            # 重建 CourseBase 对象
-            bases = []
-            for b in data.get("bases", []):
-                bases.append(CourseBase(
-                    name=b["name"],
-                    course_id=b["course_id"],
-                    color=b["color"],
-                    note=b.get("note", "")
-                ))
-
-            # 重建 CourseDetail 对象
-            details = []
-            for d in data.get("details", []):
-                # 恢复 WeekType 枚举
-                try:
-                    w_type = WeekType(d["week_type"])
-                except:
-                    w_type = WeekType.EVERY_WEEK
-
-                details.append(CourseDetail(
-                    course_id=d["course_id"],
-                    day_of_week=d["day_of_week"],
-                    start_section=d["start_section"],
-                    step=d["step"],
-                    start_week=d["start_week"],
-                    end_week=d["end_week"],
-                    week_type=w_type,
-                    teacher=d.get("teacher", ""),
-                    location=d.get("location", "")
-                ))
+            # 重建 CourseBase / CourseDetail 对象（构造时会驻留重复字符串）
+            bases = [CourseBase.from_dict(b) for b in data.get("bases", [])]
+            details = [CourseDetail.from_dict(d) for d in data.get("details", [])]
 
             return bases, details, current_week
         except Exception as e:
@@ -4,12 +4,12 @@
 负责计算当前周次、判断单双周等时间相关的业务逻辑
 """
 
-from datetime import date
+from datetime import date, timedelta
 
 try:
-    from ..utils.time_utils import calculate_week_number, is_odd_week, is_even_week
+    from ..utils.time_utils import calculate_week_number, is_odd_week, is_even_week, get_week_start_date
 except ImportError:
-    from utils.time_utils import calculate_week_number, is_odd_week, is_even_week
+    from utils.time_utils import calculate_week_number, is_odd_week, is_even_week, get_week_start_date
 
 
 class WeekCalculator:
@@ -49,6 +49,22 @@ class WeekCalculator:
         """
         return calculate_week_number(self.semester_start_date, target_date)
     
+    def date_of(self, week: int, day_of_week: int) -> date:
+        """
+        指定周次中星期几对应的日期
+        
+        学期开始日期不一定是周一，第 week 周为从 get_week_start_date 起的 7 天
+        
+        Args:
+            week: 周次（从1开始）
+            day_of_week: 星期几（1-7，周一到周日）
+            
+        Returns:
+            日期
+        """
+        week_start = get_week_start_date(self.semester_start_date, week)
+        return week_start + timedelta(days=(day_of_week - week_start.isoweekday()) % 7)
+    
     def is_odd_week(self, week: int) -> bool:
         """
         判断是否为单周（奇数周）
@@ -0,0 +1,167 @@
+"""
+周课表布局
+
+根据学期网格 (SemesterGrid) 算出某一周每个课程卡片在表格中的行、列和跨行数，
+以及各周表头的日期文字，不依赖 PyQt6。离屏渲染、表格模型等只需按这里的结果绘制，
+不必逐个创建控件
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List, Sequence, Tuple
+
+try:
+    from ..models.course_base import CourseBase
+    from ..models.course_detail import CourseDetail
+    from ..models.time_slot import TimeSlot
+    from .semester_grid import SemesterGrid
+    from .detail_table import MAX_WEEK
+    from .week_calculator import WeekCalculator
+except ImportError:
+    from models.course_base import CourseBase
+    from models.course_detail import CourseDetail
+    from models.time_slot import TimeSlot
+    from core.semester_grid import SemesterGrid
+    from core.detail_table import MAX_WEEK
+    from core.week_calculator import WeekCalculator
+
+
+@dataclass(frozen=True)
+class CourseCard:
+    """
+    一个课程卡片
+    row 为作息时间中的行号（从0开始），column 为星期几（1-7，第0列是时间列）
+    """
+    row: int
+    column: int
+    row_span: int
+    base: CourseBase
+    detail: CourseDetail
+
+
+def section_rows(time_slots: Sequence[TimeSlot]) -> Dict[int, int]:
+    """节次编号 -> 行号"""
+    return {slot.section_number: row for row, slot in enumerate(time_slots)}
+
+
+def week_cards(grid: SemesterGrid, week: int, rows: Dict[int, int]) -> List[CourseCard]:
+    """
+    指定周次要绘制的课程卡片
+
+    Args:
+        grid: 学期网格
+        week: 周次
+        rows: section_rows 的结果；开始节次不在作息时间中的课程不显示
+
+    跨行数截断到表格底部
+    """
+    row_count = len(rows)
+    cards = []
+    for base, detail in grid.placements(week):
+        row = rows.get(detail.start_section)
+        if row is None:
+            continue
+        cards.append(CourseCard(row, detail.day_of_week, max(min(detail.step, row_count - row), 1),
+                                base, detail))
+    return cards
+
+
+class WeekLayout:
+    """
+    学期中各周的卡片布局，按周缓存
+
+    网格或作息时间变化时重新创建即可（网格本身由 SemesterGridCache 缓存）
+    """
+
+    def __init__(self, grid: SemesterGrid, time_slots: Sequence[TimeSlot]):
+        self.grid = grid
+        self.time_slots = list(time_slots)
+        self.rows = section_rows(self.time_slots)
+        self._weeks: Dict[int, List[CourseCard]] = {}
+
+    @property
+    def row_count(self) -> int:
+        return len(self.time_slots)
+
+    def cards(self, week: int) -> List[CourseCard]:
+        cards = self._weeks.get(week)
+        if cards is None:
+            cards = self._weeks[week] = week_cards(self.grid, week, self.rows)
+        return cards
+
+    def occupancy(self, week: int) -> Dict[tuple, CourseCard]:
+        """(行, 列) -> 覆盖该格子的卡片，包括被跨行覆盖的格子"""
+        cells = {}
+        for card in self.cards(week):
+            for row in range(card.row, card.row + card.row_span):
+                cells[(row, card.column)] = card
+        return cells
+
+
+def visible_weeks(offset: int, viewport_height: int, block_height: int, weeks: int, gap: int = 0) -> range:
+    """
+    纵向依次排列的各周中，与可见区域相交的周次
+
+    Args:
+        offset: 滚动偏移（像素）
+        viewport_height: 可见区域高度
+        block_height: 每周的高度
+        weeks: 总周数
+        gap: 相邻两周之间的间距
+    """
+    stride = block_height + gap
+    if weeks <= 0 or stride <= 0 or viewport_height <= 0:
+        return range(0)
+    first = max(offset, 0) // stride + 1
+    # 可见区域顶部落在间距里时，上一周已经不可见
+    if max(offset, 0) % stride >= block_height:
+        first += 1
+    last = (max(offset, 0) + viewport_height - 1) // stride + 1
+    return range(first, min(last, weeks) + 1)
+
+
+WEEK_NAMES = ('周一', '周二', '周三', '周四', '周五', '周六', '周日')
+
+
+class WeekHeaderLabels:
+    """
+    学期各周表头（第1-7列）的日期和文字，创建时整学期一次算好
+
+    第 i 列为星期 i，日期取 WeekCalculator.date_of(周次, i)：学期开始日期不是周一时，
+    周一列仍显示该周中的周一。课表视图、图片/PDF 导出和 iCalendar 导出使用同一映射
+    """
+
+    def __init__(self, semester_start_date: date, weeks: int = MAX_WEEK):
+        self.semester_start_date = semester_start_date
+        self._calculator = WeekCalculator(semester_start_date)
+        self._dates: List[Tuple[date, ...]] = []
+        self._texts: List[Tuple[str, ...]] = []
+        # 渲染线程可能同时补算超出范围的周次
+        self._lock = threading.Lock()
+        self._extend(weeks)
+
+    def _extend(self, weeks: int):
+        for week in range(len(self._dates) + 1, weeks + 1):
+            dates = tuple(self._calculator.date_of(week, day) for day in range(1, 8))
+            self._dates.append(dates)
+            self._texts.append(tuple(f"{WEEK_NAMES[i]}\n{d:%m/%d}" for i, d in enumerate(dates)))
+
+    def _ensure(self, week: int):
+        """超出预先计算范围的周次（手动翻到很后面）按需补上"""
+        if week > len(self._dates):
+            with self._lock:
+                self._extend(week)
+
+    def dates(self, week: int) -> Tuple[date, ...]:
+        self._ensure(week)
+        return self._dates[max(week, 1) - 1]
+
+    def texts(self, week: int) -> Tuple[str, ...]:
+        self._ensure(week)
+        return self._texts[max(week, 1) - 1]
+
+    def today_column(self, week: int, today: date) -> int:
+        """今天所在的列（1-7），不在该周时为 -1"""
+        dates = self.dates(week)
+        return dates.index(today) + 1 if today in dates else -1
@@ -2,18 +2,40 @@
 导入器模块
 
 支持从多种格式导入课表数据
+
+各导入器依赖 bs4 / openpyxl 等较重的第三方库，
+因此在首次访问时才导入对应模块
 """
 
-from .base_importer import BaseImporter
-from .html_importer import HTMLImporter
-from .excel_importer import ExcelImporter
-from .text_importer import TextImporter
-from .usc_importer import USCImporter
+import importlib
+
+from .base_importer import BaseImporter, ImportCancelled
+
+_LAZY_IMPORTERS = {
+    'HTMLImporter': '.html_importer',
+    'ExcelImporter': '.excel_importer',
+    'TextImporter': '.text_importer',
+    'USCImporter': '.usc_importer',
+    'ImportJob': '.import_pipeline',
+    'SyncJob': '.portal_sync',
+}
 
 __all__ = [
     'BaseImporter',
+    'ImportCancelled',
+    'ImportJob',
+    'SyncJob',
     'HTMLImporter',
     'ExcelImporter',
     'TextImporter',
     'USCImporter',
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTERS:
+        module = importlib.import_module(_LAZY_IMPORTERS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
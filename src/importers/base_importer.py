@@ -5,7 +5,7 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple
 
 try:
     from ..models.course_base import CourseBase
@@ -15,6 +15,11 @@ except ImportError:
     from models.course_detail import CourseDetail
 
 
+class ImportCancelled(Exception):
+    """导入被用户取消"""
+    pass
+
+
 class BaseImporter(ABC):
     """
     导入器基类
@@ -22,6 +27,26 @@ class BaseImporter(ABC):
     所有导入器都应该继承此类并实现抽象方法
     """
     
+    # 进度回调 (已完成, 总数, 阶段说明)，返回 False 表示请求取消
+    # 由导入流水线在后台线程中设置，直接调用 parse 时为 None
+    progress_callback: Optional[Callable[[int, int, str], bool]] = None
+    
+    def report_progress(self, done: int, total: int, stage: str = "") -> None:
+        """
+        报告解析进度，在逐表格/逐行/逐工作表的循环中调用
+        
+        Args:
+            done: 已完成数量
+            total: 总数量
+            stage: 阶段说明
+            
+        Raises:
+            ImportCancelled: 进度回调请求取消时抛出
+        """
+        callback = self.progress_callback
+        if callback is not None and callback(done, total, stage) is False:
+            raise ImportCancelled("导入已取消")
+    
     @abstractmethod
     def parse(self, content: str) -> Tuple[List[CourseBase], List[CourseDetail]]:
         """
@@ -15,19 +15,21 @@ import openpyxl
 from openpyxl.worksheet.worksheet import Worksheet
 
 try:
-    from .base_importer import BaseImporter
+    from .base_importer import BaseImporter, ImportCancelled
     from .qiangzhi_importer import QiangZhiImporter
     from ..models.course_base import CourseBase
     from ..models.course_detail import CourseDetail
     from ..models.week_type import WeekType
     from ..utils.color_manager import ColorManager
+    from ..utils.profiler import timed
 except ImportError:
-    from importers.base_importer import BaseImporter
+    from importers.base_importer import BaseImporter, ImportCancelled
     from importers.qiangzhi_importer import QiangZhiImporter
     from models.course_base import CourseBase
     from models.course_detail import CourseDetail
     from models.week_type import WeekType
     from utils.color_manager import ColorManager
+    from utils.profiler import timed
 
 
 class ExcelImporter(BaseImporter):
@@ -96,6 +98,7 @@ class ExcelImporter(BaseImporter):
         except Exception as e:
             return False, f"无法打开 Excel 文件: {str(e)}"
     
+    @timed()
     def parse(self, file_path: str) -> Tuple[List[CourseBase], List[CourseDetail]]:
         """
         解析 Excel 文件
@@ -116,6 +119,7 @@ class ExcelImporter(BaseImporter):
         
         # 打开 Excel 文件
         try:
+            self.report_progress(0, 1, "读取工作表")
             workbook = openpyxl.load_workbook(file_path)
             sheet = workbook.active
             
@@ -133,6 +137,8 @@ class ExcelImporter(BaseImporter):
             
             workbook.close()
             return course_bases, course_details
+        except ImportCancelled:
+            raise
         except Exception as e:
             raise ValueError(f"解析 Excel 文件失败: {str(e)}")
     
@@ -184,6 +190,7 @@ class ExcelImporter(BaseImporter):
         
         # 遍历数据行
         for row_idx in range(header_row_idx + 1, len(rows)):
+            self.report_progress(row_idx, len(rows), "解析工作表行")
             row = rows[row_idx]
             
             # 提取节次信息
@@ -377,6 +384,7 @@ class ExcelImporter(BaseImporter):
         
         # 遍历数据行
         for row_idx in range(header_row_idx + 1, len(rows)):
+            self.report_progress(row_idx, len(rows), "解析工作表行")
             row = rows[row_idx]
             
             # 当前节次
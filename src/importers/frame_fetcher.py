@@ -0,0 +1,275 @@
+"""
+教务系统框架页面抓取流水线
+
+强智等教务系统常把课表放在多层 frameset / iframe 里，外层页面解析时会抛出
+FrameDetectedError，调用方只能一层层手动重新加载。本模块用 asyncio 逐层并发
+抓取页面中的所有框架地址，直到找到能被导入器识别的课表页面，直接交给导入器：
+- 同一层的框架并发抓取（信号量限制并发数），命中课表的页面按框架顺序优先
+- PortalSession 按主机复用 keep-alive 连接，并在整个抓取链中保存服务器下发的 Cookie；
+  配置中的登录 Cookie 只发给配置的教务系统主机，不会带到链中的第三方主机
+- 网络请求在线程中执行（asyncio.to_thread），只依赖标准库
+"""
+
+import asyncio
+import http.client
+import http.cookiejar
+import re
+import threading
+import urllib.request
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+# 请求超时（秒）
+FETCH_TIMEOUT = 15
+# 最多穿透的框架层数
+MAX_FRAME_DEPTH = 4
+# 同时进行的请求数（也是每个主机保留的空闲连接数）
+MAX_CONCURRENCY = 4
+# 最多跟随的重定向次数
+MAX_REDIRECTS = 5
+
+_META_CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+_FRAME_TAG = re.compile(r'<i?frame\b', re.IGNORECASE)
+
+
+def decode_html(body: bytes, content_type: str = "") -> str:
+    """按 Content-Type 或页面 meta 中声明的编码解码，教务系统常用 GBK"""
+    match = re.search(r'charset=([\w-]+)', content_type or "", re.IGNORECASE)
+    if not match:
+        match = _META_CHARSET.search(body[:2048])
+    charset = match.group(1) if match else "utf-8"
+    if isinstance(charset, bytes):
+        charset = charset.decode("ascii")
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def has_frames(content: str) -> bool:
+    """快速判断页面是否含有 iframe / frame，不含时不必查找框架地址"""
+    return _FRAME_TAG.search(content) is not None
+
+
+class PortalResponse:
+    """一次请求的结果"""
+
+    def __init__(self, url: str, status: int, headers, text: str):
+        self.url = url          # 跟随重定向后的最终地址
+        self.status = status
+        self.headers = headers
+        self.text = text
+
+
+class PortalSession:
+    """
+    复用连接并保存 Cookie 的 HTTP 会话
+
+    线程安全，可在 asyncio.to_thread 中并发调用
+    """
+
+    def __init__(self, cookie: str = "", timeout: float = FETCH_TIMEOUT,
+                 max_idle: int = MAX_CONCURRENCY, cookie_host: str = ""):
+        """
+        Args:
+            cookie: 初始 Cookie（如配置中保存的登录会话），与服务器下发的 Cookie 一起发送
+            timeout: 单次请求超时（秒）
+            max_idle: 每个主机保留的空闲连接数
+            cookie_host: cookie 只发送给这个主机（urlsplit 的 netloc，如 "jw.example.edu.cn:8080"），
+                重定向或框架指向的其他主机只收到各自通过 Set-Cookie 下发的 Cookie；为空时不发送 cookie
+        """
+        self.cookie = cookie
+        self.cookie_host = cookie_host.lower()
+        self.cookies = http.cookiejar.CookieJar()
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _acquire(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def _release(self, scheme: str, netloc: str, conn: http.client.HTTPConnection):
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _cookie_header(self, request: urllib.request.Request, netloc: str) -> str:
+        self.cookies.add_cookie_header(request)
+        configured = self.cookie if self.cookie_host and netloc.lower() == self.cookie_host else ""
+        return "; ".join(filter(None, [configured, request.get_header("Cookie")]))
+
+    def _request_once(self, url: str, headers: Dict[str, str]):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"不支持的地址: {url}")
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        request = urllib.request.Request(url)
+        send_headers = dict(headers)
+        cookie = self._cookie_header(request, parts.netloc)
+        if cookie:
+            send_headers["Cookie"] = cookie
+
+        # 复用的空闲连接可能已被服务器关闭，失败时换新连接重试一次
+        for attempt in range(2):
+            conn = self._acquire(parts.scheme, parts.netloc)
+            try:
+                conn.request("GET", path, headers=send_headers)
+                response = conn.getresponse()
+                body = response.read()
+            except (http.client.HTTPException, ConnectionError) as e:
+                conn.close()
+                if attempt:
+                    raise ValueError(f"请求失败: {url} ({e})") from e
+                continue
+            except OSError as e:
+                conn.close()
+                raise ValueError(f"请求失败: {url} ({e})") from e
+            break
+
+        self.cookies.extract_cookies(response, request)
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(parts.scheme, parts.netloc, conn)
+        return response, body
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> PortalResponse:
+        """
+        GET 请求，跟随重定向
+
+        Raises:
+            ValueError: 网络错误、重定向过多或 4xx/5xx（304 正常返回）
+        """
+        headers = dict(headers or {})
+        for _ in range(MAX_REDIRECTS + 1):
+            response, body = self._request_once(url, headers)
+            location = response.getheader("Location")
+            if response.status in (301, 302, 303, 307, 308) and location:
+                url = urljoin(url, location)
+                # 条件请求头只对原地址有效
+                headers.pop("If-None-Match", None)
+                headers.pop("If-Modified-Since", None)
+                continue
+            if response.status >= 400:
+                raise ValueError(f"请求失败: {url} (HTTP {response.status})")
+            text = decode_html(body, response.getheader("Content-Type", ""))
+            return PortalResponse(url, response.status, response.msg, text)
+        raise ValueError(f"重定向次数过多: {url}")
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+def inspect_page(content: str) -> Tuple[bool, List[str]]:
+    """
+    默认的页面检查：能被 HTMLImporter 识别则为课表页面，否则返回其中的框架地址
+    """
+    try:
+        from .html_importer import HTMLImporter
+        from .qiangzhi_importer import QiangZhiImporter
+    except ImportError:
+        from importers.html_importer import HTMLImporter
+        from importers.qiangzhi_importer import QiangZhiImporter
+
+    valid, _ = HTMLImporter().validate(content)
+    if valid or not has_frames(content):
+        return valid, []
+    return False, QiangZhiImporter().frame_sources(content)
+
+
+async def resolve_timetable(
+    session: PortalSession,
+    pages: List[PortalResponse],
+    inspect: Callable[[str], Tuple[bool, List[str]]] = inspect_page,
+    max_depth: int = MAX_FRAME_DEPTH,
+    concurrency: int = MAX_CONCURRENCY,
+) -> PortalResponse:
+    """
+    从已获取的页面开始逐层并发抓取框架，返回第一个课表页面
+
+    Args:
+        session: 共享的 HTTP 会话
+        pages: 起始页面（通常只有入口页面一个）
+        inspect: 页面检查函数，返回 (是否为课表页面, 框架地址列表)
+        max_depth: 最多穿透的层数
+        concurrency: 同时进行的请求数
+
+    Raises:
+        ValueError: 超过层数仍未找到课表页面
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    visited = {page.url for page in pages}
+
+    async def fetch(url: str) -> Optional[PortalResponse]:
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(session.get, url)
+            except ValueError:
+                # 导航栏等无关框架加载失败不影响其他框架
+                return None
+
+    for depth in range(max_depth + 1):
+        next_urls = []
+        for page in pages:
+            is_timetable, frames = await asyncio.to_thread(inspect, page.text)
+            if is_timetable:
+                return page
+            for src in frames:
+                url = urljoin(page.url, src)
+                if url not in visited:
+                    visited.add(url)
+                    next_urls.append(url)
+        if not next_urls or depth == max_depth:
+            break
+        results = await asyncio.gather(*(fetch(url) for url in next_urls))
+        pages = [page for page in results if page is not None]
+
+    raise ValueError("未找到课表页面，请确认地址指向课表或已登录")
+
+
+def fetch_timetable(
+    url: str,
+    session: Optional[PortalSession] = None,
+    first_page: Optional[PortalResponse] = None,
+    inspect: Callable[[str], Tuple[bool, List[str]]] = inspect_page,
+) -> PortalResponse:
+    """
+    同步入口：获取 url 并穿透框架，返回课表页面
+
+    在后台线程中调用（内部运行独立的事件循环）
+
+    Args:
+        url: 入口地址
+        session: 复用的会话，None 时新建并在结束后关闭
+        first_page: 已经获取的入口页面，避免重复请求
+        inspect: 页面检查函数
+    """
+    own_session = session is None
+    session = session or PortalSession()
+
+    async def run():
+        page = first_page or await asyncio.to_thread(session.get, url)
+        return await resolve_timetable(session, [page], inspect)
+
+    try:
+        return asyncio.run(run())
+    finally:
+        if own_session:
+            session.close()
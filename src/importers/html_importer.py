@@ -5,23 +5,23 @@ HTML 导入器 - 智能路由分发中心
 不再包含具体的解析细节，而是作为一个"分发中心"
 """
 
-import re
-from typing import List, Tuple
-
-from bs4 import BeautifulSoup
+import copy
+from typing import List, Optional, Tuple
 
 try:
     from .base_importer import BaseImporter
-    from .qiangzhi_importer import QiangZhiImporter
+    from .registry import registry
     from ..models.course_base import CourseBase
     from ..models.course_detail import CourseDetail
     from ..utils.color_manager import ColorManager
+    from ..utils.profiler import timed
 except ImportError:
     from importers.base_importer import BaseImporter
-    from importers.qiangzhi_importer import QiangZhiImporter
+    from importers.registry import registry
     from models.course_base import CourseBase
     from models.course_detail import CourseDetail
     from utils.color_manager import ColorManager
+    from utils.profiler import timed
 
 
 class HTMLImporter(BaseImporter):
@@ -29,35 +29,24 @@ class HTMLImporter(BaseImporter):
     智能 HTML 导入器
     
     负责检测 HTML 特征并路由到最合适的解析器
-    优先尝试特定的学校插件，最后回退到通用解析
+    先按注册表中各学校声明的页面特征筛选候选，再依次完整验证，最后回退到通用解析
     """
     
     def __init__(self):
         """初始化 HTML 导入器 - 智能路由分发中心"""
         self.color_manager = ColorManager()
-        
-        # 预加载已知解析器列表，优先级从高到低
-        self.specialized_importers = [
-            None,  # USCImporter 将在首次使用时初始化
-            None   # QiangZhiImporter 将在首次使用时初始化
-        ]
     
     def get_supported_formats(self) -> List[str]:
         """获取支持的文件格式"""
         return ['.html', '.htm']
     
-    def _init_importers(self):
-        """延迟初始化导入器列表"""
-        if self.specialized_importers[0] is None:
-            try:
-                from .usc_importer import USCImporter
-                self.specialized_importers[0] = USCImporter()
-            except ImportError:
-                from importers.usc_importer import USCImporter
-                self.specialized_importers[0] = USCImporter()
-        
-        if self.specialized_importers[1] is None:
-            self.specialized_importers[1] = QiangZhiImporter(school_name="通用强智系统")
+    def _find_importer(self, content: str) -> Optional[BaseImporter]:
+        """候选导入器中第一个验证通过的"""
+        for importer in registry.candidates(content):
+            valid, _ = importer.validate(content)
+            if valid:
+                return importer
+        return None
     
     def validate(self, content: str) -> Tuple[bool, str]:
         """
@@ -73,20 +62,13 @@ class HTMLImporter(BaseImporter):
             return False, "内容为空"
         
         try:
-            # 延迟初始化导入器
-            self._init_importers()
-            
-            # 只要有一个导入器能验证通过即可
-            for importer in self.specialized_importers:
-                if importer:
-                    valid, _ = importer.validate(content)
-                    if valid:
-                        return True, ""
-            
+            if self._find_importer(content):
+                return True, ""
             return False, "无法识别的课表格式"
         except Exception as e:
             return False, f"HTML 解析失败: {str(e)}"
     
+    @timed()
     def parse(self, content: str) -> Tuple[List[CourseBase], List[CourseDetail]]:
         """
         解析 HTML 内容 - 智能路由到最合适的解析器
@@ -100,20 +82,19 @@ class HTMLImporter(BaseImporter):
         Raises:
             ValueError: 解析失败时抛出
         """
-        # 验证内容
-        valid, msg = self.validate(content)
-        if not valid:
-            raise ValueError(msg)
-        
-        # 延迟初始化导入器
-        self._init_importers()
+        if not content or not content.strip():
+            raise ValueError("内容为空")
         
-        # 1. 自动分发：查找最匹配的专用解析器
-        for importer in self.specialized_importers:
-            if importer:
-                valid, _ = importer.validate(content)
-                if valid:
-                    return importer.parse(content)
+        # 自动分发：候选中第一个验证通过的专用解析器（验证与解析之间不再重复整体验证）
+        try:
+            importer = self._find_importer(content)
+        except Exception as e:
+            raise ValueError(f"HTML 解析失败: {str(e)}") from e
+        if importer is None:
+            raise ValueError("无法识别的课表格式")
         
-        # 2. 如果没有任何匹配，抛出异常
-        raise ValueError("未找到适配的解析引擎")
+        if self.progress_callback is not None:
+            # 注册表中的导入器实例是共享的，进度回调只设置在本次解析用的浅拷贝上
+            importer = copy.copy(importer)
+            importer.progress_callback = self.progress_callback
+        return importer.parse(content)
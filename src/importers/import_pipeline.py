@@ -0,0 +1,129 @@
+"""
+导入流水线
+
+在后台线程中读取文件并调用导入器解析，支持进度回调和取消
+本模块不依赖 PyQt6，界面层通过 src/ui/import_worker.py 在 QThreadPool 中运行 ImportJob
+"""
+
+import importlib
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+
+try:
+    from .base_importer import BaseImporter, ImportCancelled
+    from ..models.course_base import CourseBase
+    from ..models.course_detail import CourseDetail
+    from ..utils.color_manager import ColorManager
+except ImportError:
+    from importers.base_importer import BaseImporter, ImportCancelled
+    from models.course_base import CourseBase
+    from models.course_detail import CourseDetail
+    from utils.color_manager import ColorManager
+
+# 文件类型 -> (导入器所在模块, 类名, 是否直接传入文件路径)
+IMPORTER_TYPES = {
+    "HTML": ("html_importer", "HTMLImporter", False),
+    "Excel": ("excel_importer", "ExcelImporter", True),
+    "Text": ("text_importer", "TextImporter", False),
+}
+
+# 两次进度通知的最小间隔（秒），避免逐行通知刷爆界面事件队列
+PROGRESS_INTERVAL = 0.05
+
+
+def create_importer(file_type: str) -> Tuple[BaseImporter, bool]:
+    """
+    按文件类型创建导入器
+
+    Returns:
+        (导入器, 是否直接传入文件路径)
+    """
+    if file_type not in IMPORTER_TYPES:
+        raise ValueError(f"不支持的导入类型: {file_type}")
+    module_name, class_name, takes_path = IMPORTER_TYPES[file_type]
+    module = importlib.import_module(f".{module_name}", __package__)
+    return getattr(module, class_name)(), takes_path
+
+
+class ImportJob:
+    """
+    一次导入任务
+
+    run() 可以在任意线程中执行；cancel() 可以在其他线程中调用，
+    导入器下一次报告进度时会抛出 ImportCancelled
+    """
+
+    def __init__(
+        self,
+        file_type: str,
+        file_path: Optional[str] = None,
+        content: Optional[str] = None,
+        progress: Optional[Callable[[int, int, str], None]] = None,
+        avoid_adjacent_colors: bool = False,
+    ):
+        """
+        Args:
+            file_type: "HTML" / "Excel" / "Text"
+            file_path: 文件路径（与 content 二选一）
+            content: 已读取的内容，如 WebView 中提取的 HTML
+            progress: 进度通知 (已完成, 总数, 阶段说明)，按 PROGRESS_INTERVAL 节流
+            avoid_adjacent_colors: 解析后按课表位置重新批量分配颜色，尽量避免相邻课程同色
+        """
+        if file_path is None and content is None:
+            raise ValueError("需要提供文件路径或内容")
+        self.file_type = file_type
+        self.file_path = file_path
+        self.content = content
+        self.progress = progress
+        self.avoid_adjacent_colors = avoid_adjacent_colors
+        self._cancel_event = threading.Event()
+        self._last_notify = 0.0
+
+    def cancel(self):
+        """请求取消导入"""
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def _on_progress(self, done: int, total: int, stage: str) -> bool:
+        if self._cancel_event.is_set():
+            return False
+        if self.progress is not None:
+            now = time.monotonic()
+            if done >= total or now - self._last_notify >= PROGRESS_INTERVAL:
+                self._last_notify = now
+                self.progress(done, total, stage)
+        return True
+
+    def run(self) -> Tuple[List[CourseBase], List[CourseDetail]]:
+        """
+        读取并解析
+
+        Returns:
+            (CourseBase列表, CourseDetail列表)
+
+        Raises:
+            ImportCancelled: 导入被取消
+            ValueError: 解析失败
+        """
+        importer, takes_path = create_importer(self.file_type)
+        importer.progress_callback = self._on_progress
+
+        if takes_path:
+            source = self.file_path
+        elif self.content is not None:
+            source = self.content
+        else:
+            self._on_progress(0, 1, "读取文件")
+            with open(self.file_path, 'r', encoding='utf-8') as f:
+                source = f.read()
+
+        if self.cancelled:
+            raise ImportCancelled("导入已取消")
+        bases, details = importer.parse(source)
+        if self.avoid_adjacent_colors:
+            ColorManager.apply_colors(bases, details)
+        return bases, details
@@ -0,0 +1,210 @@
+"""
+教务系统课表定时同步
+
+按配置的地址重新获取课表页面并解析，供 MainWindow 定时在后台线程中运行：
+- http(s) 地址：带上保存的 Cookie 请求，并发送 If-None-Match / If-Modified-Since，服务器返回 304 时直接跳过；
+  入口是框架页面时由 frame_fetcher 穿透到课表页面
+- 本地路径：文件或"投放目录"（取其中最新的 .html/.htm），修改时间未变时直接跳过
+- 内容摘要与上次成功解析的相同时跳过解析，同一份页面只解析一次
+
+本模块不依赖 PyQt6，解析结果与当前课表的比对由 core.import_merger 完成
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    from .base_importer import ImportCancelled
+    from .frame_fetcher import FETCH_TIMEOUT, PortalSession, fetch_timetable, has_frames
+    from .import_pipeline import ImportJob
+    from ..models.course_base import CourseBase
+    from ..models.course_detail import CourseDetail
+except ImportError:
+    from importers.base_importer import ImportCancelled
+    from importers.frame_fetcher import FETCH_TIMEOUT, PortalSession, fetch_timetable, has_frames
+    from importers.import_pipeline import ImportJob
+    from models.course_base import CourseBase
+    from models.course_detail import CourseDetail
+
+logger = logging.getLogger(__name__)
+
+HTML_SUFFIXES = ('.html', '.htm')
+
+# 同步状态文件路径（与 config.json 同目录）
+SYNC_STATE_PATH = Path("sync_state.json")
+
+
+@dataclass
+class SyncState:
+    """
+    上一次成功同步的页面标识，用于跳过未变化的页面
+
+    fingerprints 为上次同步带来的课程块指纹（core.import_merger.fingerprint），
+    同步时只允许移除这些课程块，手动添加或其他来源导入的课程不受影响；
+    状态保存在 SYNC_STATE_PATH，重启后仍然有效
+    """
+    etag: str = ""
+    last_modified: str = ""
+    mtime_ns: int = 0
+    path: str = ""
+    digest: str = ""
+    source: str = ""
+    fingerprints: List[Tuple] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, source: str, path: Path = SYNC_STATE_PATH) -> 'SyncState':
+        """读取指定来源的同步状态；文件不存在、损坏或来源已更换时返回空状态"""
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("source") != source:
+                return cls(source=source)
+            valid_keys = cls.__annotations__.keys()
+            state = cls(**{k: v for k, v in data.items() if k in valid_keys})
+        except (OSError, ValueError, TypeError, AttributeError):
+            return cls(source=source)
+        # JSON 中的指纹是列表，转回元组才能与 fingerprint() 的结果比较
+        state.fingerprints = [tuple(fp) for fp in state.fingerprints]
+        return state
+
+    def save(self, path: Path = SYNC_STATE_PATH):
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(asdict(self), f, ensure_ascii=False)
+        except OSError as e:
+            logger.warning(f"保存同步状态失败: {e}")
+
+
+def is_remote(source: str) -> bool:
+    return source.startswith(("http://", "https://"))
+
+
+def latest_html(source: str) -> Optional[Path]:
+    """本地来源对应的 HTML 文件：文件本身，或目录中修改时间最新的 HTML"""
+    path = Path(source)
+    if path.is_file():
+        return path
+    if path.is_dir():
+        pages = [p for p in path.iterdir() if p.is_file() and p.suffix.lower() in HTML_SUFFIXES]
+        if pages:
+            return max(pages, key=lambda p: p.stat().st_mtime_ns)
+    return None
+
+
+class SyncJob(ImportJob):
+    """
+    一次同步任务
+
+    与 ImportJob 接口相同，可直接交给 src/ui/import_worker.py 在线程池中运行；
+    页面未变化时 run() 返回空列表并把 unchanged 置为 True
+    """
+
+    def __init__(self, source: str, state: SyncState, cookie: str = "", progress=None,
+                 avoid_adjacent_colors: bool = False):
+        """
+        Args:
+            source: 课表页面地址，或本地 HTML 文件/目录
+            state: 上一次同步的状态，成功解析后原地更新
+            cookie: 请求时附带的 Cookie（教务系统登录会话）
+            progress: 进度通知，同 ImportJob
+            avoid_adjacent_colors: 同 ImportJob
+        """
+        super().__init__("HTML", content="", progress=progress,
+                         avoid_adjacent_colors=avoid_adjacent_colors)
+        self.source = source
+        self.state = state
+        self.cookie = cookie
+        self.unchanged = False
+
+    def fetch(self) -> Optional[Tuple[str, SyncState]]:
+        """
+        获取页面内容
+
+        Returns:
+            (HTML 内容, 新的同步状态)；页面未变化时返回 None
+
+        Raises:
+            ValueError: 来源不可用或请求失败
+        """
+        if is_remote(self.source):
+            return self._fetch_url()
+        return self._fetch_local()
+
+    def _fetch_url(self) -> Optional[Tuple[str, SyncState]]:
+        headers = {}
+        if self.state.etag:
+            headers["If-None-Match"] = self.state.etag
+        if self.state.last_modified:
+            headers["If-Modified-Since"] = self.state.last_modified
+
+        # 登录 Cookie 只发给配置的教务系统主机
+        session = PortalSession(cookie=self.cookie, timeout=FETCH_TIMEOUT,
+                                cookie_host=urlsplit(self.source).netloc)
+        try:
+            page = session.get(self.source, headers)
+            if page.status == 304:
+                return None
+            state = SyncState(
+                etag=page.headers.get("ETag", ""),
+                last_modified=page.headers.get("Last-Modified", ""),
+            )
+            if has_frames(page.text):
+                # 外层框架页面：并发穿透到课表页面。外层页面不变时内层仍可能变化，
+                # 因此不保存外层的 ETag，只靠内容摘要跳过重复解析
+                page = fetch_timetable(self.source, session=session, first_page=page)
+                state = SyncState()
+        finally:
+            session.close()
+        return page.text, state
+
+    def _fetch_local(self) -> Optional[Tuple[str, SyncState]]:
+        path = latest_html(self.source)
+        if path is None:
+            raise ValueError(f"找不到课表页面: {self.source}")
+        mtime_ns = path.stat().st_mtime_ns
+        if str(path) == self.state.path and mtime_ns == self.state.mtime_ns:
+            return None
+        content = path.read_text(encoding="utf-8", errors="replace")
+        return content, SyncState(path=str(path), mtime_ns=mtime_ns)
+
+    def run(self) -> Tuple[List[CourseBase], List[CourseDetail]]:
+        """
+        获取并解析课表页面
+
+        Raises:
+            ImportCancelled: 同步被取消
+            ValueError: 获取或解析失败
+        """
+        self._on_progress(0, 1, "获取课表页面")
+        fetched = self.fetch()
+        if self.cancelled:
+            raise ImportCancelled("同步已取消")
+        if fetched is None:
+            self.unchanged = True
+            return [], []
+
+        content, state = fetched
+        state.digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        if state.digest == self.state.digest:
+            # 页面标识变了但内容相同（如服务器不支持 ETag），不必重新解析
+            self._commit(state)
+            self.unchanged = True
+            return [], []
+
+        self.content = content
+        result = super().run()
+        self._commit(state)
+        return result
+
+    def _commit(self, state: SyncState):
+        """解析成功后才更新状态，失败时下次同步会重新尝试"""
+        self.state.etag = state.etag
+        self.state.last_modified = state.last_modified
+        self.state.mtime_ns = state.mtime_ns
+        self.state.path = state.path
+        self.state.digest = state.digest
@@ -10,22 +10,29 @@
 import re
 import uuid
 import logging
-from typing import List, Tuple, Optional
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Optional
 
 from bs4 import BeautifulSoup, Tag
 
 try:
     from .base_importer import BaseImporter
+    from .registry import register_importer
+    from .table_grid import normalize_grid
     from ..models.course_base import CourseBase
     from ..models.course_detail import CourseDetail
     from ..models.week_type import WeekType
     from ..utils.color_manager import ColorManager
+    from ..utils.profiler import timed
 except ImportError:
     from importers.base_importer import BaseImporter
+    from importers.registry import register_importer
+    from importers.table_grid import normalize_grid
     from models.course_base import CourseBase
     from models.course_detail import CourseDetail
     from models.week_type import WeekType
     from utils.color_manager import ColorManager
+    from utils.profiler import timed
 
 logger = logging.getLogger(__name__)
 
@@ -34,13 +41,30 @@ class FrameDetectedError(ValueError):
         super().__init__(message)
         self.inner_url = inner_url
 
+
+@dataclass
+class ParseContext:
+    """
+    一次解析的状态：自动侦测出的表格布局和已生成的课程
+
+    每次 parse 新建一个，导入器实例本身不再保存解析状态，
+    同一个实例可以在多个线程中同时解析不同布局的页面
+    """
+    sunday_first: bool
+    first_col_is_header: bool
+    header_cols: int = 0  # 星期列之前的表头列数（如合并单元格的"节次"列可能占两列）
+    course_bases: List[CourseBase] = field(default_factory=list)
+    course_details: List[CourseDetail] = field(default_factory=list)
+    name_to_id: Dict[str, str] = field(default_factory=dict)
+
+@register_importer(table_ids=("kbtable",), cell_classes=("kbcontent",), url_patterns=("jsxsd",), fallback=True)
 class QiangZhiImporter(BaseImporter):
 
     def __init__(
         self,
         school_name: str = "通用强智系统",
-        sunday_first: bool = False, # 默认值，会被自动侦测覆盖
-        first_col_is_header: bool = False, # 默认值，会被自动侦测覆盖
+        sunday_first: bool = False, # 默认值，每次解析时按表头自动侦测
+        first_col_is_header: bool = False, # 默认值，每次解析时按表头自动侦测
         split_pattern: str = r'-{10,}',
         table_id: str = 'kbtable',
         cell_class: str = 'kbcontent',
@@ -76,16 +100,33 @@ class QiangZhiImporter(BaseImporter):
         return self.school_name
 
     def _check_iframe_trap(self, soup: BeautifulSoup) -> Optional[str]:
-        # 1. 检查是否存在包含 'xskb' 或 'list.do' 的 iframe
-        iframe = soup.find('iframe', src=re.compile(r'xskb|list\.do', re.IGNORECASE))
+        # 1. 检查是否存在包含 'xskb' 或 'list.do' 的 iframe / frame (frameset 页面)
+        iframe = soup.find(['iframe', 'frame'], src=re.compile(r'xskb|list\.do', re.IGNORECASE))
         if iframe:
             return iframe.get('src')
         # 2. 检查是否有 id="Frame1" (南华大学特定)
         frame1 = soup.find(id="Frame1")
-        if frame1 and frame1.name == 'iframe':
+        if frame1 and frame1.name in ('iframe', 'frame'):
             return frame1.get('src')
         return None
 
+    def frame_sources(self, content: str) -> List[str]:
+        """
+        页面中所有 iframe / frame 的地址，_check_iframe_trap 命中的排在最前
+
+        供抓取流水线逐层穿透外层框架使用，返回的可能是相对地址
+        """
+        soup = BeautifulSoup(content, 'html.parser')
+        sources = []
+        trap = self._check_iframe_trap(soup)
+        if trap:
+            sources.append(trap)
+        for frame in soup.find_all(['iframe', 'frame']):
+            src = (frame.get('src') or '').strip()
+            if src and src not in sources and not src.lower().startswith(('javascript:', 'about:', 'data:')):
+                sources.append(src)
+        return sources
+
     def _calculate_table_score(self, element: Tag) -> int:
         score = 0
         text = element.get_text()
@@ -123,32 +164,35 @@ class QiangZhiImporter(BaseImporter):
         if candidates: return candidates[0][1]
         return None
 
-    def _autodetect_layout(self, table: Tag):
+    def _autodetect_layout(self, grid: List[List[Tuple[int, Tag]]]) -> ParseContext:
         """
         [新增] 自动分析表格表头，确定列偏移和星期顺序
         解决"星期错位"问题的核心逻辑
+
+        grid 为 normalize_grid 展开后的表格，列号是合并单元格展开后的真实列号
+        以构造参数为默认值，侦测结果只写入返回的 ParseContext，不修改导入器本身
         """
-        rows = table.find_all('tr')
+        context = ParseContext(sunday_first=self.sunday_first, first_col_is_header=self.first_col_is_header,
+                               header_cols=1 if self.first_col_is_header else 0)
         header_row = None
 
         # 1. 寻找包含"星期"的表头行
-        for row in rows:
-            text = row.get_text()
+        for placed in grid:
+            text = "".join(cell.get_text() for _, cell in placed)
             if "星期" in text or "周一" in text:
-                header_row = row
+                header_row = placed
                 break
 
         if not header_row:
-            return # 没找到表头，维持默认设置
+            return context # 没找到表头，维持默认设置
 
         # 2. 分析列结构
-        cells = header_row.find_all(['th', 'td'])
-        col_texts = [cell.get_text(strip=True) for cell in cells]
+        col_texts = [(col, cell.get_text(strip=True)) for col, cell in header_row]
 
         idx_sun = -1
         idx_mon = -1
 
-        for i, text in enumerate(col_texts):
+        for i, text in col_texts:
             if "星期日" in text or "周日" in text:
                 idx_sun = i
             elif "星期一" in text or "周一" in text:
@@ -159,19 +203,22 @@ class QiangZhiImporter(BaseImporter):
         valid_indices = [i for i in [idx_sun, idx_mon] if i >= 0]
         if valid_indices:
             first_day_idx = min(valid_indices)
+            context.header_cols = first_day_idx
             if first_day_idx > 0:
-                self.first_col_is_header = True
+                context.first_col_is_header = True
                 logger.info(f"[{self.school_name}] 自动修正: 检测到首列为表头列")
             else:
-                self.first_col_is_header = False
+                context.first_col_is_header = False
 
         # 4. 判定星期顺序 (南华是星期日开头)
         if idx_sun != -1 and idx_mon != -1:
             if idx_sun < idx_mon:
-                self.sunday_first = True
+                context.sunday_first = True
                 logger.info(f"[{self.school_name}] 自动修正: 检测到星期日排在星期一之前")
             else:
-                self.sunday_first = False
+                context.sunday_first = False
+
+        return context
 
     def validate(self, content: str) -> Tuple[bool, str]:
         if not content or not content.strip():
@@ -191,6 +238,7 @@ class QiangZhiImporter(BaseImporter):
 
         return True, ""
 
+    @timed()
     def parse(self, content: str) -> Tuple[List[CourseBase], List[CourseDetail]]:
         content = content.replace('\u3000', ' ')
         try:
@@ -206,29 +254,31 @@ class QiangZhiImporter(BaseImporter):
         if not table:
             raise ValueError("无法定位课表数据")
 
-        # [关键步骤] 解析数据前，先自动侦测布局
-        self._autodetect_layout(table)
-
-        course_bases, course_details = [], []
-        name_to_id = {}
-
         rows = table.find_all('tr')
         if not rows: return [], []
 
-        for row in rows:
-            td_cells = row.find_all(['td', 'th'])
-            if len(td_cells) < 2: continue
+        # 展开 rowspan/colspan，单元格的列号取虚拟网格中的真实位置
+        grid = normalize_grid([row.find_all(['td', 'th']) for row in rows])
+
+        # [关键步骤] 解析数据前，先自动侦测布局
+        context = self._autodetect_layout(grid)
+
+        for row_idx, placed in enumerate(grid):
+            self.report_progress(row_idx, len(grid), "解析表格行")
+            # 只有一个单元格且从第一列开始的是标题行；被上方合并单元格覆盖的行仍需解析
+            if len(placed) < 2 and (not placed or placed[0][0] == 0): continue
 
-            for col_idx, cell in enumerate(td_cells):
+            for col_idx, cell in placed:
                 # 跳过表头列 (根据自动侦测结果)
-                if self.first_col_is_header and col_idx == 0:
+                if col_idx < context.header_cols:
                     continue
 
-                self._process_cell(cell, col_idx, course_bases, course_details, name_to_id)
+                self._process_cell(cell, col_idx, context)
 
-        return course_bases, course_details
+        self.report_progress(len(grid), len(grid), "解析表格行")
+        return context.course_bases, context.course_details
 
-    def _process_cell(self, cell, col_idx, course_bases, course_details, name_to_id):
+    def _process_cell(self, cell, col_idx, context: ParseContext):
         detail_div = cell.find('div', class_=self.cell_class)
         if not detail_div:
             divs = cell.find_all('div')
@@ -244,9 +294,9 @@ class QiangZhiImporter(BaseImporter):
         segments = re.split(self.split_pattern, raw_html)
 
         for segment in segments:
-            self._parse_segment(segment, col_idx, course_bases, course_details, name_to_id)
+            self._parse_segment(segment, col_idx, context)
 
-    def _parse_segment(self, segment_html, col_idx, course_bases, course_details, name_to_id):
+    def _parse_segment(self, segment_html, col_idx, context: ParseContext):
         seg_soup = BeautifulSoup(segment_html, 'html.parser')
         all_text_list = [t.strip() for t in seg_soup.get_text("|").split("|") if t.strip()]
         if not all_text_list: return
@@ -282,16 +332,16 @@ class QiangZhiImporter(BaseImporter):
         week_ranges = self._parse_complex_weeks(week_sec_text)
         if not week_ranges: return
 
-        if course_name not in name_to_id:
+        if course_name not in context.name_to_id:
             course_id = str(uuid.uuid4())
-            name_to_id[course_name] = course_id
+            context.name_to_id[course_name] = course_id
             course_color = self.color_manager.get_color_for_course(course_name)
-            course_bases.append(CourseBase(name=course_name, course_id=course_id, color=course_color))
+            context.course_bases.append(CourseBase(name=course_name, course_id=course_id, color=course_color))
         else:
-            course_id = name_to_id[course_name]
+            course_id = context.name_to_id[course_name]
 
         # 计算星期几 (使用自动侦测后的参数)
-        day_of_week = self._calculate_day_of_week(col_idx)
+        day_of_week = self._calculate_day_of_week(col_idx, context)
         week_type = self._detect_week_type(segment_html)
 
         for w_start, w_end in week_ranges:
@@ -300,16 +350,14 @@ class QiangZhiImporter(BaseImporter):
                 day_of_week=day_of_week, start_section=start_sec, step=step,
                 start_week=w_start, end_week=w_end, week_type=week_type
             )
-            course_details.append(detail)
+            context.course_details.append(detail)
 
-    def _calculate_day_of_week(self, col_idx: int) -> int:
-        effective_idx = col_idx
-        # 如果侦测到有表头列，减去偏移
-        if self.first_col_is_header and effective_idx > 0:
-            effective_idx -= 1
+    def _calculate_day_of_week(self, col_idx: int, context: ParseContext) -> int:
+        # 减去表头列的偏移
+        effective_idx = max(col_idx - context.header_cols, 0)
 
         # 如果侦测到是星期日开头
-        if self.sunday_first:
+        if context.sunday_first:
             # 0(Sun)->7, 1(Mon)->1, ...
             return effective_idx if effective_idx != 0 else 7
         else:
@@ -0,0 +1,201 @@
+"""
+学校导入器注册表
+
+各学校的 HTML 导入器用 @register_importer 声明页面特征（表格 id、单元格 class、
+标题文字、网址域名/路径片段）。识别页面时只对原始内容做一次正则扫描，提取其中的
+id / class / 标题 / 链接，再到按特征建立的哈希索引中查找命中的导入器，
+只有命中的候选（以及兜底的通用导入器）才做完整的 BeautifulSoup 验证和解析。
+扫描代价只与页面大小有关，学校增加到几十个也不会变慢。
+"""
+
+import importlib
+import re
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+try:
+    from .base_importer import BaseImporter
+except ImportError:
+    from importers.base_importer import BaseImporter
+
+# 内置的学校导入器模块，导入时通过 @register_importer 注册
+# 添加新学校：新建 xxx_importer.py，在类上加 @register_importer，并把模块名加到这里
+SCHOOL_MODULES = (
+    "qiangzhi_importer",
+    "usc_importer",
+)
+
+# 一次扫描提取 id、class、<title> 和链接地址
+_TOKEN_PATTERN = re.compile(
+    r'\bid\s*=\s*["\']?([^"\'\s>]+)'
+    r'|\bclass\s*=\s*["\']([^"\']*)'
+    r'|<title[^>]*>([^<]*)'
+    r'|\b(?:src|href|action)\s*=\s*["\']([^"\']+)',
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class Fingerprint:
+    """导入器声明的页面特征，命中越多越优先"""
+    table_ids: Tuple[str, ...] = ()     # 课表表格的 id
+    cell_classes: Tuple[str, ...] = ()  # 课程单元格的 class
+    titles: Tuple[str, ...] = ()        # <title> 中包含的文字
+    url_patterns: Tuple[str, ...] = ()  # 网址的域名（按后缀匹配）或路径片段，如 "usc.edu.cn"、"jsxsd"
+
+
+@dataclass
+class PageFeatures:
+    """一次扫描得到的页面特征"""
+    ids: Set[str]
+    classes: Set[str]
+    title: str
+    url_tokens: Set[str]
+
+
+def url_tokens(url: str) -> Set[str]:
+    """网址的域名后缀和路径片段：jwxt.usc.edu.cn/jsxsd/x -> {jwxt.usc.edu.cn, usc.edu.cn, edu.cn, cn, jsxsd, x}"""
+    parts = urlsplit(url.strip())
+    tokens = {segment.lower() for segment in parts.path.split('/') if segment}
+    labels = (parts.hostname or "").split('.')
+    tokens.update('.'.join(labels[i:]) for i in range(len(labels)) if labels[i])
+    return tokens
+
+
+def scan_page(content: str, url: str = "") -> PageFeatures:
+    """对原始内容做一次正则扫描，提取页面特征"""
+    features = PageFeatures(set(), set(), "", url_tokens(url) if url else set())
+    for match in _TOKEN_PATTERN.finditer(content):
+        element_id, classes, title, link = match.groups()
+        if element_id is not None:
+            features.ids.add(element_id.lower())
+        elif classes is not None:
+            features.classes.update(c.lower() for c in classes.split())
+        elif title is not None:
+            features.title += title
+        elif link is not None:
+            features.url_tokens |= url_tokens(link)
+    return features
+
+
+class _Entry:
+    """注册表中的一个导入器"""
+
+    def __init__(self, cls, fingerprint: Fingerprint, priority: int, fallback: bool, order: int):
+        self.cls = cls
+        self.fingerprint = fingerprint
+        self.priority = priority
+        self.fallback = fallback
+        self.order = order
+        self._instance: Optional[BaseImporter] = None
+        self._lock = threading.Lock()
+
+    def instance(self) -> BaseImporter:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self.cls()
+        return self._instance
+
+
+class ImporterRegistry:
+    """按页面特征索引的导入器注册表"""
+
+    def __init__(self):
+        self._entries: List[_Entry] = []
+        self._by_id: Dict[str, List[_Entry]] = {}
+        self._by_class: Dict[str, List[_Entry]] = {}
+        self._by_url: Dict[str, List[_Entry]] = {}
+        self._titles: List[Tuple[str, _Entry]] = []
+        self._modules_loaded = False
+        self._lock = threading.Lock()
+
+    def register(self, cls, fingerprint: Fingerprint, priority: int = 0, fallback: bool = False):
+        """
+        注册导入器类
+
+        Args:
+            cls: 导入器类，需可无参构造
+            fingerprint: 页面特征
+            priority: 命中数相同时的优先级，越大越优先
+            fallback: 是否为兜底导入器（没有任何特征命中时也参与验证）
+        """
+        entry = _Entry(cls, fingerprint, priority, fallback, len(self._entries))
+        self._entries.append(entry)
+        for value in fingerprint.table_ids:
+            self._by_id.setdefault(value.lower(), []).append(entry)
+        for value in fingerprint.cell_classes:
+            self._by_class.setdefault(value.lower(), []).append(entry)
+        for value in fingerprint.url_patterns:
+            self._by_url.setdefault(value.lower().strip('/'), []).append(entry)
+        for value in fingerprint.titles:
+            self._titles.append((value, entry))
+        return cls
+
+    def load_builtin(self):
+        """导入内置学校模块（只执行一次）"""
+        if self._modules_loaded:
+            return
+        with self._lock:
+            if not self._modules_loaded:
+                for module in SCHOOL_MODULES:
+                    importlib.import_module(f".{module}", __package__)
+                self._modules_loaded = True
+
+    def candidates(self, content: str, url: str = "") -> List[BaseImporter]:
+        """
+        可能处理该页面的导入器：按特征命中数、优先级排序，兜底导入器排在最后
+
+        Args:
+            content: 页面 HTML
+            url: 页面地址（可选，补充网址特征）
+        """
+        self.load_builtin()
+        features = scan_page(content, url)
+
+        hits: Dict[_Entry, int] = {}
+        for index, tokens in ((self._by_id, features.ids), (self._by_class, features.classes),
+                              (self._by_url, features.url_tokens)):
+            for token in tokens:
+                for entry in index.get(token, ()):
+                    hits[entry] = hits.get(entry, 0) + 1
+        if features.title:
+            for text, entry in self._titles:
+                if text in features.title:
+                    hits[entry] = hits.get(entry, 0) + 1
+
+        ranked = sorted(hits, key=lambda e: (-hits[e], -e.priority, e.order))
+        ranked += sorted((e for e in self._entries if e.fallback and e not in hits),
+                         key=lambda e: (-e.priority, e.order))
+        return [entry.instance() for entry in ranked]
+
+    def importer_classes(self) -> List[type]:
+        self.load_builtin()
+        return [entry.cls for entry in self._entries]
+
+
+registry = ImporterRegistry()
+
+
+def register_importer(
+    table_ids: Tuple[str, ...] = (),
+    cell_classes: Tuple[str, ...] = (),
+    titles: Tuple[str, ...] = (),
+    url_patterns: Tuple[str, ...] = (),
+    priority: int = 0,
+    fallback: bool = False,
+):
+    """
+    类装饰器：把导入器注册到全局注册表
+
+    Example:
+        @register_importer(table_ids=("kbtable",), titles=("南华大学",), url_patterns=("usc.edu.cn",))
+        class USCImporter(QiangZhiImporter): ...
+    """
+    fingerprint = Fingerprint(tuple(table_ids), tuple(cell_classes), tuple(titles), tuple(url_patterns))
+
+    def decorator(cls):
+        return registry.register(cls, fingerprint, priority=priority, fallback=fallback)
+    return decorator
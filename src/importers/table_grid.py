@@ -0,0 +1,59 @@
+"""
+HTML 表格网格展开
+
+课表常用 rowspan / colspan 合并单元格（跨两大节的实验课、合并的节次列等），
+此时单元格在 <tr> 中的序号不再等于它所在的列。这里一次遍历把每个单元格放到
+虚拟二维网格中的真实位置，星期由真实列号计算。
+
+单元格只需支持 .get(属性名)（BeautifulSoup 的 Tag 或 dict 均可），本模块不依赖 bs4
+"""
+
+from typing import Dict, List, Sequence, Tuple, TypeVar
+
+Cell = TypeVar("Cell")
+
+# 单个单元格最多展开的行/列数，防止异常的 span 值撑大网格
+MAX_SPAN = 64
+
+
+def cell_span(cell, attr: str) -> int:
+    """读取 rowspan / colspan，缺失或非法时为 1"""
+    try:
+        value = int(str(cell.get(attr) or 1).strip())
+    except ValueError:
+        return 1
+    return min(max(value, 1), MAX_SPAN)
+
+
+def normalize_grid(rows: Sequence[Sequence[Cell]]) -> List[List[Tuple[int, Cell]]]:
+    """
+    把带 rowspan / colspan 的表格行展开到虚拟网格
+
+    Args:
+        rows: 每一行的单元格列表（如 [tr.find_all(['td', 'th']) for tr in rows]）
+
+    Returns:
+        每一行中从该行开始的单元格及其真实列号 [(列号, 单元格), ...]；
+        被上方 rowspan 覆盖的位置不会重复出现。耗时与单元格数及其覆盖面积成正比
+    """
+    grid = []
+    pending: Dict[int, int] = {}  # 列号 -> 还要向下覆盖的行数
+    for cells in rows:
+        placed = []
+        started: Dict[int, int] = {}
+        col = 0
+        for cell in cells:
+            while pending.get(col, 0) > 0:
+                col += 1
+            colspan = cell_span(cell, "colspan")
+            rowspan = cell_span(cell, "rowspan")
+            placed.append((col, cell))
+            if rowspan > 1:
+                for c in range(col, col + colspan):
+                    started[c] = rowspan - 1
+            col += colspan
+        grid.append(placed)
+        pending = {c: n - 1 for c, n in pending.items() if n > 1}
+        pending.update(started)
+    return grid
+
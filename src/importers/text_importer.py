@@ -14,12 +14,14 @@ try:
     from ..models.course_detail import CourseDetail
     from ..models.week_type import WeekType
     from ..utils.color_manager import ColorManager
+    from ..utils.profiler import timed
 except ImportError:
     from importers.base_importer import BaseImporter
     from models.course_base import CourseBase
     from models.course_detail import CourseDetail
     from models.week_type import WeekType
     from utils.color_manager import ColorManager
+    from utils.profiler import timed
 
 
 class TextImporter(BaseImporter):
@@ -87,6 +89,7 @@ class TextImporter(BaseImporter):
         
         return True, ""
     
+    @timed()
     def parse(self, content: str) -> Tuple[List[CourseBase], List[CourseDetail]]:
         """
         解析文本内容
@@ -110,6 +113,7 @@ class TextImporter(BaseImporter):
         lines = content.strip().split('\n')
         
         for line_num, line in enumerate(lines, 1):
+            self.report_progress(line_num - 1, len(lines), "解析文本行")
             line = line.strip()
             if not line:
                 continue
@@ -122,6 +126,7 @@ class TextImporter(BaseImporter):
                 # 记录错误但继续解析其他行
                 print(f"警告: 第 {line_num} 行解析失败: {line} ({str(e)})")
         
+        self.report_progress(len(lines), len(lines), "解析文本行")
         if not import_beans:
             raise ValueError("没有成功解析任何课程")
         
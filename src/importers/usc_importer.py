@@ -7,10 +7,17 @@
 
 try:
     from .qiangzhi_importer import QiangZhiImporter
+    from .registry import register_importer
 except ImportError:
     from importers.qiangzhi_importer import QiangZhiImporter
+    from importers.registry import register_importer
 
 
+# 与通用强智系统特征相同时让通用导入器优先，只有命中南华大学的标题或域名时才排在前面
+@register_importer(
+    table_ids=("kbtable",), cell_classes=("kbcontent",),
+    titles=("南华大学",), url_patterns=("usc.edu.cn",), priority=-1,
+)
 class USCImporter(QiangZhiImporter):
     """
     南华大学教务系统导入器
@@ -7,6 +7,7 @@ from .week_type import WeekType
 from .time_slot import TimeSlot
 from .course_base import CourseBase
 from .course_detail import CourseDetail
+from .schedule import Schedule
 from .config import Config
 
 __all__ = [
@@ -14,5 +15,6 @@ __all__ = [
     'TimeSlot',
     'CourseBase',
     'CourseDetail',
+    'Schedule',
     'Config',
 ]
\ No newline at end of file
@@ -23,6 +23,7 @@ class Config:
     course_opacity: float = 0.95             # 卡片不透明度
     theme_mode: str = "auto"                 # 主题
     header_style: str = "translucent"        # 表头风格: default, translucent, transparent
+    schedule_view_mode: str = "widget"       # 课表绘制: widget (每格一个控件), model (模型+委托绘制)，重启后生效
 
     # --- 常规: 启动与行为 ---
     auto_start: bool = False                 # 开机自启
@@ -35,6 +36,9 @@ class Config:
     auto_update: bool = True                 # 自动检查更新
     language: str = "zh_CN"                  # 语言
 
+    # --- 导入 ---
+    avoid_adjacent_colors: bool = True       # 导入时尽量让相邻课程块颜色不同
+
     # --- 学期: 课程节数 (修复编辑功能失灵的关键) ---
     total_courses_per_day: int = 12
     morning_count: int = 4
@@ -45,6 +49,25 @@ class Config:
     # 格式: [{"section": 1, "start": "08:00", "end": "08:45"}, ...]
     custom_time_slots: List[Dict[str, Any]] = field(default_factory=list)
 
+    # --- 同步: 定时从教务系统重新获取课表 ---
+    sync_source: str = ""                    # 课表页面地址，或本地 HTML 文件/投放目录
+    sync_interval_minutes: int = 0           # 同步间隔（分钟），0 为关闭
+    sync_cookie: str = ""                    # 请求时附带的 Cookie（登录会话）
+
+    # --- 日历订阅: main_feed.py 提供的 .ics 订阅源 ---
+    ics_feed_host: str = "127.0.0.1"         # 监听地址，手机订阅需改为 0.0.0.0
+    ics_feed_port: int = 8765                # 监听端口
+
+    # --- 调试: 性能采样 ---
+    enable_profiling: bool = False           # 记录热点路径耗时并写入日志
+    profile_dump_path: str = ""              # 非空时导出 cProfile 数据 (pstats)
+
+    # --- 调试: 日志 ---
+    log_level: str = "DEBUG"                 # 本应用的日志级别（第三方库固定为 WARNING）
+    # 按模块覆盖级别，键为 logger 名称（模块 __name__），如 {"importers": "WARNING"}
+    log_levels: Dict[str, str] = field(default_factory=dict)
+    log_json_events: bool = False            # 性能采样/启动计时另存为 logs/events_*.jsonl
+
     @classmethod
     def load(cls) -> 'Config':
         if CONFIG_PATH.exists():
@@ -3,20 +3,62 @@
 src/models/course_base.py
 """
 
+import sys
 from dataclasses import dataclass
+from typing import Any, Dict
 
-@dataclass
+
+def _intern(value):
+    """驻留字符串，使同名课程共用同一个字符串对象"""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class CourseBase:
     """
     课程基础信息
     包含：课程ID、名称、颜色、备注
+
+    使用 __slots__ 存储，按 course_id 计算哈希，可直接作为 dict/set 的键；
+    course_id 创建后不可修改（否则已放入 dict/set 的对象再也找不到），
+    名称、颜色、备注可以修改，需要换 ID 时用 dataclasses.replace 生成新对象
     """
     course_id: str
     name: str
     color: str
     note: str = ""
 
+    def __post_init__(self):
+        object.__setattr__(self, "course_id", _intern(self.course_id))
+        self.name = _intern(self.name)
+        self.color = _intern(self.color)
+
+    def __setattr__(self, name, value):
+        if name == "course_id" and hasattr(self, "course_id"):
+            raise AttributeError("course_id 是哈希字段，创建后不可修改")
+        object.__setattr__(self, name, value)
+
+    def __hash__(self):
+        return hash(self.course_id)
+
     @property
     def id(self):
         """兼容性属性：id 等同于 course_id"""
-        return self.course_id
\ No newline at end of file
+        return self.course_id
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "course_id": self.course_id,
+            "color": self.color,
+            "note": self.note,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CourseBase':
+        return cls(
+            course_id=data["course_id"],
+            name=data["name"],
+            color=data["color"],
+            note=data.get("note", ""),
+        )
@@ -3,13 +3,24 @@
 src/models/course_detail.py
 """
 
+import sys
 from dataclasses import dataclass
+from typing import Any, Dict, Tuple
 from src.models.week_type import WeekType
 
-@dataclass
+
+def _intern(value):
+    """驻留字符串，大课表中重复的教师/教室/课程ID只保留一份"""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(frozen=True, slots=True)
 class CourseDetail:
     """
     课程详细时间地点信息
+
+    不可变、使用 __slots__ 存储；修改请用 dataclasses.replace 生成新对象
+    哈希按 identity_key（课程ID + 时间位置）计算，可直接作为 dict/set 的键
     """
     course_id: str
     teacher: str
@@ -21,6 +32,59 @@ class CourseDetail:
     end_week: int       # 结束周次
     week_type: WeekType # 周次类型
 
+    def __post_init__(self):
+        object.__setattr__(self, "course_id", _intern(self.course_id))
+        object.__setattr__(self, "teacher", _intern(self.teacher))
+        object.__setattr__(self, "location", _intern(self.location))
+
+    def __hash__(self):
+        return hash(self.identity_key)
+
+    @property
+    def identity_key(self) -> Tuple:
+        """标识一个课程块的字段：同一课程在同一时间、同一周次范围只出现一次"""
+        return (self.course_id, self.day_of_week, self.start_section, self.step,
+                self.start_week, self.end_week, self.week_type)
+
     @property
     def end_section(self):
-        return self.start_section + self.step - 1
\ No newline at end of file
+        return self.start_section + self.step - 1
+
+    def is_in_week(self, week: int) -> bool:
+        """判断该课程在指定周次是否上课"""
+        if not (self.start_week <= week <= self.end_week):
+            return False
+        return self.week_type.matches_week(week)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "course_id": self.course_id,
+            "day_of_week": self.day_of_week,
+            "start_section": self.start_section,
+            "step": self.step,
+            "start_week": self.start_week,
+            "end_week": self.end_week,
+            "week_type": self.week_type.value,  # 存枚举值
+            "teacher": self.teacher,
+            "location": self.location,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CourseDetail':
+        # 恢复 WeekType 枚举，未知值按每周处理
+        try:
+            week_type = WeekType(data["week_type"])
+        except (KeyError, ValueError):
+            week_type = WeekType.EVERY_WEEK
+
+        return cls(
+            course_id=data["course_id"],
+            teacher=data.get("teacher", ""),
+            location=data.get("location", ""),
+            day_of_week=data["day_of_week"],
+            start_section=data["start_section"],
+            step=data["step"],
+            start_week=data["start_week"],
+            end_week=data["end_week"],
+            week_type=week_type,
+        )
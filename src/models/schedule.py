@@ -0,0 +1,30 @@
+"""
+课表模型
+src/models/schedule.py
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List
+
+from src.models.course_base import CourseBase
+from src.models.course_detail import CourseDetail
+
+
+@dataclass
+class Schedule:
+    """
+    课表
+    包含：课程基础信息列表、课程详情列表、学期开始日期
+
+    version 为数据版本号，课程每次增删改都要递增（CourseManager 会自动调用 touch()），
+    派生的详情表、学期网格等缓存据此判断是否需要重建
+    """
+    course_bases: List[CourseBase] = field(default_factory=list)
+    course_details: List[CourseDetail] = field(default_factory=list)
+    semester_start_date: date = field(default_factory=date.today)
+    version: int = field(default=0, compare=False, repr=False)
+
+    def touch(self):
+        """标记课程数据已修改"""
+        self.version += 1
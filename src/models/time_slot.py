@@ -4,8 +4,11 @@
 定义每节课的开始和结束时间
 """
 
+import logging
 from typing import Dict, Any, List
-from datetime import time
+from datetime import time, date, datetime, timedelta
+
+logger = logging.getLogger(__name__)
 
 
 class TimeSlot:
@@ -126,3 +129,51 @@ class TimeSlot:
             cls(12, time(21, 45), time(22, 30)),
         ]
         return time_slots
+
+    @classmethod
+    def generate_from_config(cls, config) -> List['TimeSlot']:
+        """
+        根据配置生成时间段（优先读取自定义作息时间）
+
+        自定义时间不足 total_courses_per_day 节时，按 45 分钟一节、
+        课间 10 分钟自动补全；解析失败时回退到默认生成逻辑
+
+        Args:
+            config: Config 对象
+
+        Returns:
+            时间段列表
+        """
+        total = config.total_courses_per_day
+
+        # 1. 尝试读取自定义时间
+        if config.custom_time_slots:
+            try:
+                slots = []
+                for item in config.custom_time_slots:
+                    if item["section"] > total: continue
+                    s = datetime.strptime(item["start"], "%H:%M").time()
+                    e = datetime.strptime(item["end"], "%H:%M").time()
+                    slots.append(cls(item["section"], s, e))
+
+                # 补全不足的节数
+                if len(slots) < total:
+                    last_end = datetime.combine(date.today(), slots[-1].end_time)
+                    current_dt = last_end + timedelta(minutes=10)
+                    for i in range(len(slots) + 1, total + 1):
+                        end_dt = current_dt + timedelta(minutes=45)
+                        slots.append(cls(i, current_dt.time(), end_dt.time()))
+                        current_dt = end_dt + timedelta(minutes=10)
+                return slots
+            except Exception as e:
+                logger.warning(f"自定义时间解析失败，回退默认: {e}")
+
+        # 2. 默认生成逻辑
+        slots = []
+        current_dt = datetime.combine(date.today(), time(8, 0))
+        for i in range(1, total + 1):
+            end_dt = current_dt + timedelta(minutes=45)
+            slots.append(cls(i, current_dt.time(), end_dt.time()))
+            break_time = 120 if i == 4 else (30 if i == 8 else 10)
+            current_dt = end_dt + timedelta(minutes=break_time)
+        return slots
@@ -0,0 +1,76 @@
+"""
+后台导入任务
+src/ui/import_worker.py
+
+在 QThreadPool 中运行 ImportJob，通过信号把进度和解析结果交回界面线程
+"""
+
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from src.importers.base_importer import ImportCancelled
+from src.importers.import_pipeline import ImportJob
+
+
+class ImportWorkerSignals(QObject):
+    """QRunnable 不能直接发信号，由这个对象代发（跨线程自动排队到界面线程）"""
+    progress = pyqtSignal(int, int, str)   # 已完成, 总数, 阶段说明
+    finished = pyqtSignal(object, object)  # bases, details（一次性交回）
+    failed = pyqtSignal(object)            # 异常对象
+    cancelled = pyqtSignal()
+
+
+class ImportWorker(QRunnable):
+    """在线程池中执行一次导入"""
+
+    def __init__(self, job: ImportJob):
+        super().__init__()
+        self.job = job
+        self.signals = ImportWorkerSignals()
+        job.progress = self.signals.progress.emit
+
+    def cancel(self):
+        self.job.cancel()
+
+    def run(self):
+        try:
+            bases, details = self.job.run()
+        except ImportCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            if self.job.cancelled:
+                self.signals.cancelled.emit()
+            else:
+                self.signals.finished.emit(bases, details)
+
+
+def start_import(job: ImportJob, finished: Callable, failed: Callable,
+                 cancelled: Optional[Callable] = None, progress: Optional[Callable] = None) -> ImportWorker:
+    """
+    在全局线程池中启动导入任务
+
+    先连接回调再启动：很快结束的任务（小文件、读取立即出错）可能在 start() 返回前
+    就发出信号，启动后再连接会错过结果
+
+    Args:
+        job: 导入任务
+        finished: 收到 (bases, details)
+        failed: 收到异常对象
+        cancelled: 任务被取消
+        progress: 收到 (已完成, 总数, 阶段说明)
+
+    调用方需要保留返回的 worker 引用，直到收到 finished/failed/cancelled 之一
+    """
+    worker = ImportWorker(job)
+    worker.setAutoDelete(False)
+    if progress is not None:
+        worker.signals.progress.connect(progress)
+    worker.signals.finished.connect(finished)
+    worker.signals.failed.connect(failed)
+    if cancelled is not None:
+        worker.signals.cancelled.connect(cancelled)
+    QThreadPool.globalInstance().start(worker)
+    return worker
@@ -5,15 +5,14 @@ src/ui/main_window.py
 from src.models.config import Config
 import sys
 from pathlib import Path
-from datetime import datetime, date, timedelta
+from datetime import datetime, date
 import json
 import os
-from src.ui.settings_dialog import SettingsDialog
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QToolBar,
     QSizePolicy, QFileDialog, QMessageBox, QMenu, QToolButton, QLabel,
-    QSystemTrayIcon, QApplication
+    QSystemTrayIcon, QApplication, QProgressDialog
 )
 from PyQt6.QtGui import QAction, QIcon
 from PyQt6.QtCore import Qt, QSize, QDate, QTimer
@@ -29,17 +28,14 @@ from src.ui.course_dialog import CourseDialog
 from src.ui.styles import ModernStyles
 from src.models.time_slot import TimeSlot
 from src.models.config import Config
-from src.ui.webview_import_dialog import WebviewImportDialog
-from src.ui.import_preview_dialog import ImportPreviewDialog
 from src.core.storage_manager import StorageManager
+from src.core.course_manager import remove_all
+from src.core.import_merger import fingerprint, merge_courses, pair_courses
+from src.utils.logger import configure_logging, logger, startup_timer
+from src.utils.profiler import profiler
 
-# 尝试导入导入器，防止文件缺失导致 crash
-try:
-    from src.importers.html_importer import HTMLImporter
-    from src.importers.excel_importer import ExcelImporter
-    from src.importers.text_importer import TextImporter
-except ImportError as e:
-    print(f"Warning: Importer modules missing: {e}")
+# 导入器 (bs4 / openpyxl) 与 WebEngine 对话框体积较大，
+# 在首次使用时才导入，首个窗口只加载自身需要的模块
 
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -50,24 +46,32 @@ class MainWindow(QMainWindow):
         # 设置应用图标
         self._set_app_icon()
 
-        self.config = Config.load()
+        with startup_timer.phase("Config.load"):
+            self.config = Config.load()
+        configure_logging(self.config.log_level, self.config.log_levels, self.config.log_json_events)
+        profiler.configure(self.config.enable_profiling, self.config.profile_dump_path)
         self.storage = StorageManager()
+        self._first_painted = False
 
         # 生成时间轴
         self.time_slots = self._generate_time_slots()
 
         self.courses = []
+        self._import_worker = None
 
         self._init_ui()
         self._init_tray_icon()
         self._init_reminder_timer()
+        self._init_sync_timer()
 
-        self.load_saved_data()
+        with startup_timer.phase("加载界面数据"):
+            self.load_saved_data()
         self._setup_connections()
         self._init_semester_week()
 
         # 启动时自动加载本地数据
-        self._load_data_on_startup()
+        with startup_timer.phase("加载本地课表"):
+            self._load_data_on_startup()
 
         # 应用表头风格
         self.schedule_view.set_header_style(self.config.header_style)
@@ -76,39 +80,13 @@ class MainWindow(QMainWindow):
 
     def _generate_time_slots(self):
         """根据 Config 生成时间轴 (优先读取自定义时间)"""
-        # 1. 尝试读取自定义时间
-        if self.config.custom_time_slots:
-            slots = []
-            try:
-                for item in self.config.custom_time_slots:
-                    if item["section"] > self.config.total_courses_per_day: continue
-                    s = datetime.strptime(item["start"], "%H:%M").time()
-                    e = datetime.strptime(item["end"], "%H:%M").time()
-                    slots.append(TimeSlot(item["section"], s, e))
-
-                # 补全不足的节数
-                if len(slots) < self.config.total_courses_per_day:
-                    last_end = datetime.combine(date.today(), slots[-1].end_time)
-                    start_idx = len(slots) + 1
-                    current_dt = last_end + timedelta(minutes=10)
-                    for i in range(start_idx, self.config.total_courses_per_day + 1):
-                        end_dt = current_dt + timedelta(minutes=45)
-                        slots.append(TimeSlot(i, current_dt.time(), end_dt.time()))
-                        current_dt = end_dt + timedelta(minutes=10)
-                return slots
-            except Exception as e:
-                print(f"自定义时间解析失败，回退默认: {e}")
-
-        # 2. 默认生成逻辑
-        slots = []
-        total = self.config.total_courses_per_day
-        current_dt = datetime.combine(date.today(), datetime.strptime("08:00", "%H:%M").time())
-        for i in range(1, total + 1):
-            end_dt = current_dt + timedelta(minutes=45)
-            slots.append(TimeSlot(i, current_dt.time(), end_dt.time()))
-            break_time = 120 if i == 4 else (30 if i == 8 else 10)
-            current_dt = end_dt + timedelta(minutes=break_time)
-        return slots
+        return TimeSlot.generate_from_config(self.config)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self._first_painted:
+            self._first_painted = True
+            startup_timer.mark("首次绘制")
 
     def _init_tray_icon(self):
         self.tray_icon = QSystemTrayIcon(self)
@@ -163,16 +141,61 @@ class MainWindow(QMainWindow):
         self.reminder_timer.timeout.connect(self._check_course_reminders)
         self.reminder_timer.start(60000)
 
+    def _init_sync_timer(self):
+        from src.importers.portal_sync import SyncState
+        self._sync_state = SyncState.load(self.config.sync_source)
+        self._sync_worker = None
+        self.sync_timer = QTimer(self)
+        self.sync_timer.timeout.connect(self._run_sync)
+        self._restart_sync_timer()
+
+    def _restart_sync_timer(self):
+        self.sync_timer.stop()
+        if self.config.sync_source and self.config.sync_interval_minutes > 0:
+            self.sync_timer.start(self.config.sync_interval_minutes * 60000)
+
+    def _run_sync(self):
+        """定时同步：后台获取并解析课表页面，只有课程块发生变化时才应用"""
+        if self._sync_worker is not None or self._import_worker is not None:
+            return
+        from src.importers.portal_sync import SyncJob, SyncState
+        from src.ui.import_worker import start_import
+
+        if self._sync_state.source != self.config.sync_source:
+            # 更换了同步来源，原来同步的课程块不再由新来源管理
+            self._sync_state = SyncState.load(self.config.sync_source)
+        job = SyncJob(self.config.sync_source, self._sync_state, cookie=self.config.sync_cookie,
+                      avoid_adjacent_colors=self.config.avoid_adjacent_colors)
+
+        def on_finished(bases, details):
+            self._sync_worker = None
+            if job.unchanged:
+                self._sync_state.save()
+                return
+            incoming = pair_courses(bases, details)
+            # 只移除上次同步带来的课程块，手动添加和其他导入的课程始终保留
+            result = self._apply_imported_courses(
+                incoming, remove_missing=True, removable=set(self._sync_state.fingerprints))
+            self._sync_state.fingerprints = [fingerprint(c) for c in incoming]
+            self._sync_state.save()
+            if result.has_changes:
+                self.statusBar().showMessage(f"课表已同步：{result.summary()}", 5000)
+                self._show_notification("课表已更新", result.summary())
+
+        def on_failed(error):
+            self._sync_worker = None
+            self.statusBar().showMessage(f"课表同步失败: {error}", 5000)
+
+        def on_cancelled():
+            self._sync_worker = None
+
+        self._sync_worker = start_import(job, on_finished, on_failed, on_cancelled)
+
     def _check_course_reminders(self):
         if not self.config.enable_notification: return
         now = datetime.now()
-        current_weekday = now.isoweekday()
-        todays_courses = []
-        for base, detail in self.courses:
-            if detail.day_of_week == current_weekday:
-                if detail.start_week <= self.schedule_view.current_week <= detail.end_week:
-                    if detail.week_type.matches_week(self.schedule_view.current_week):
-                        todays_courses.append((base, detail))
+        grid = self.schedule_view.get_semester_grid(self.courses)
+        todays_courses = grid.courses_for_day(self.schedule_view.current_week, now.isoweekday())
 
         remind_min = self.config.remind_minutes
         for base, detail in todays_courses:
@@ -256,6 +279,15 @@ class MainWindow(QMainWindow):
         action_save = QAction("保存课表", self)
         action_save.triggered.connect(self._action_save)
         file_menu.addAction(action_save)
+        action_export_ics = QAction("导出日历 (.ics)", self)
+        action_export_ics.triggered.connect(self._action_export_ics)
+        file_menu.addAction(action_export_ics)
+        action_export_image = QAction("导出本周图片 (.png)", self)
+        action_export_image.triggered.connect(self._action_export_image)
+        file_menu.addAction(action_export_image)
+        action_export_pdf = QAction("导出整学期 PDF", self)
+        action_export_pdf.triggered.connect(self._action_export_pdf)
+        file_menu.addAction(action_export_pdf)
 
         self.file_btn.setMenu(file_menu)
         self.toolbar.addWidget(self.file_btn)
@@ -271,6 +303,8 @@ class MainWindow(QMainWindow):
         self.toolbar.addAction(self.action_current_week)
         self.action_next_week = QAction("下一周 ▶", self)
         self.toolbar.addAction(self.action_next_week)
+        self.action_timeline = QAction("🗓 学期总览", self)
+        self.toolbar.addAction(self.action_timeline)
         self.toolbar.addSeparator()
 
         self.action_appearance = QAction("🎨 外观", self)
@@ -288,7 +322,11 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
-        self.schedule_view = ScheduleView(self.time_slots)
+        if self.config.schedule_view_mode == "model":
+            from src.ui.schedule_table_view import ScheduleTableView
+            self.schedule_view = ScheduleTableView(self.time_slots)
+        else:
+            self.schedule_view = ScheduleView(self.time_slots)
         layout.addWidget(self.schedule_view)
         self.setCentralWidget(central_widget)
 
@@ -298,6 +336,7 @@ class MainWindow(QMainWindow):
         self.action_prev_week.triggered.connect(lambda: self._change_week(-1))
         self.action_next_week.triggered.connect(lambda: self._change_week(1))
         self.action_current_week.triggered.connect(self._reset_to_current_week)
+        self.action_timeline.triggered.connect(self._on_open_timeline)
         self.action_appearance.triggered.connect(self.open_appearance_settings)
         self.action_settings.triggered.connect(self._on_open_settings)
         self.schedule_view.course_clicked.connect(self._on_edit_course)
@@ -322,6 +361,7 @@ class MainWindow(QMainWindow):
         self.schedule_view.update_courses(self.courses)
 
     def _on_refresh(self):
+        self.schedule_view.mark_courses_changed()
         self.schedule_view.update_courses(self.courses)
         self.schedule_view.viewport().update()
         self.statusBar().showMessage("课表已刷新", 2000)
@@ -329,10 +369,9 @@ class MainWindow(QMainWindow):
     def _load_data_on_startup(self):
         bases, details, week = self.storage.load()
         if bases and details:
-            self.courses = self._process_imported_data(bases, details)
             self.schedule_view.set_week(week)
             self.action_current_week.setText(f"📅 第 {week} 周 (当前)")
-            self.schedule_view.update_courses(self.courses)
+            self._set_courses(self._process_imported_data(bases, details))
             self.statusBar().showMessage(f"已加载本地课表，共 {len(self.courses)} 个课程块", 3000)
 
     def open_appearance_settings(self):
@@ -359,6 +398,7 @@ class MainWindow(QMainWindow):
         self.time_slots = new_slots
         self.schedule_view.update_time_slots(new_slots)
         self._init_semester_week()
+        self._restart_sync_timer()
         self.schedule_view.update_courses(self.courses)
 
     def update_background(self, path):
@@ -413,7 +453,7 @@ class MainWindow(QMainWindow):
             if bg_path and os.path.exists(bg_path):
                 self.update_background(bg_path)
                 self.schedule_view.set_background_opacity(saved_bg_op)
-            self.courses = []
+            courses = []
             for c_data in data.get("courses", []):
                 try:
                     color_val = c_data.get("color", "#E3F2FD")
@@ -424,26 +464,93 @@ class MainWindow(QMainWindow):
                     start_w = int(weeks_str[0]); end_w = int(weeks_str[1]) if len(weeks_str) > 1 else start_w
                     detail = CourseDetail(c_data.get("day", 1), c_data.get("start", 1), c_data.get("end", 2),
                                           start_w, end_w, w_type, c_data.get("location", ""), c_data.get("teacher", ""))
-                    self.courses.append((base, detail))
+                    courses.append((base, detail))
                 except: pass
-            self.schedule_view.update_courses(self.courses)
+            self._set_courses(courses)
         except Exception as e: print(e)
 
+    def _action_export_ics(self):
+        """导出为 iCalendar 文件，可导入手机/电脑日历"""
+        if not self.courses:
+            QMessageBox.information(self, "提示", "当前没有课程可导出")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "导出日历", "课表.ics", "iCalendar (*.ics)")
+        if not path:
+            return
+        from src.core.ics_exporter import ICSExporter
+        from src.models.schedule import Schedule
+        try:
+            start_date = datetime.strptime(self.config.semester_start_date, "%Y-%m-%d").date()
+            schedule = Schedule(
+                course_bases=list({base.course_id: base for base, _ in self.courses}.values()),
+                course_details=[detail for _, detail in self.courses],
+                semester_start_date=start_date,
+            )
+            exporter = ICSExporter(schedule, self.time_slots)
+            count = exporter.export(path)
+        except Exception as e:
+            QMessageBox.critical(self, "导出失败", str(e))
+            return
+        message = f"已导出 {count} 个日程"
+        if exporter.skipped:
+            message += f"，{exporter.skipped} 个课程块的节次不在作息时间内，已跳过"
+        self.statusBar().showMessage(message, 3000)
+
+    def _create_renderer(self):
+        """按当前背景和透明度创建离屏渲染器"""
+        from src.ui.schedule_renderer import ScheduleRenderer, RenderOptions
+        options = RenderOptions(
+            background_path=getattr(self, 'current_bg_path', ""),
+            background_opacity=self.schedule_view.background_opacity,
+            course_opacity=self.schedule_view.course_opacity,
+        )
+        return ScheduleRenderer(self.time_slots, self.schedule_view.semester_start_date, options)
+
+    def _action_export_image(self):
+        """把当前周课表渲染为图片"""
+        week = self.schedule_view.current_week
+        path, _ = QFileDialog.getSaveFileName(self, "导出图片", f"课表_第{week}周.png", "PNG 图片 (*.png)")
+        if not path:
+            return
+        grid = self.schedule_view.get_semester_grid(self.courses)
+        if self._create_renderer().export_image(path, grid, week):
+            self.statusBar().showMessage(f"已导出第 {week} 周课表图片", 3000)
+        else:
+            QMessageBox.critical(self, "导出失败", f"无法写入图片: {path}")
+
+    def _action_export_pdf(self):
+        """把整个学期每一周渲染为多页 PDF"""
+        grid = self.schedule_view.get_semester_grid(self.courses)
+        if grid.weeks == 0:
+            QMessageBox.information(self, "提示", "当前没有课程可导出")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "导出 PDF", "课表.pdf", "PDF 文件 (*.pdf)")
+        if not path:
+            return
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            pages = self._create_renderer().export_pdf(path, grid, range(1, grid.weeks + 1))
+        except Exception as e:
+            QMessageBox.critical(self, "导出失败", str(e))
+            return
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.statusBar().showMessage(f"已导出 {pages} 周课表到 PDF", 3000)
+
     def _action_new(self):
         reply = QMessageBox.question(self, "新建确认", "确定要新建课表吗？", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if reply == QMessageBox.StandardButton.Yes:
-            self.courses = []; self.schedule_view.update_courses([]); self._action_save(); self.statusBar().showMessage("已新建空课表", 2000)
+            self._set_courses([]); self._action_save(); self.statusBar().showMessage("已新建空课表", 2000)
 
     def _on_import_webview(self):
-        dialog = WebviewImportDialog(self)
+        from src.ui.webview_import_dialog import WebviewImportDialog
+        dialog = WebviewImportDialog(self, avoid_adjacent_colors=self.config.avoid_adjacent_colors)
         if dialog.exec():
             bases, details = dialog.get_imported_data()
             new_courses = self._process_imported_data(bases, details)
             if new_courses:
-                self.courses.extend(new_courses)
-                self.schedule_view.update_courses(self.courses)
-                self._action_save()
-                QMessageBox.information(self, "导入成功", f"成功导入 {len(new_courses)} 门课程")
+                result = self._apply_imported_courses(new_courses)
+                QMessageBox.information(self, "导入成功", f"导入完成：{result.summary()}")
 
     def _on_import_file(self, file_type):
         filters = {
@@ -454,43 +561,62 @@ class MainWindow(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(self, f"选择 {file_type} 文件", "", filters.get(file_type, ""))
         if not file_path: return
 
-        try:
-            bases, details = [], []
-            # 确保变量在 if 之前初始化
-            if file_type == "Excel":
-                importer = ExcelImporter()
-                bases, details = importer.parse(file_path)
-            elif file_type == "HTML":
-                with open(file_path, 'r', encoding='utf-8') as f: content = f.read()
-                importer = HTMLImporter()
-                bases, details = importer.parse(content)
-            elif file_type == "Text":
-                with open(file_path, 'r', encoding='utf-8') as f: content = f.read()
-                importer = TextImporter()
-                bases, details = importer.parse(content)
+        # 在后台线程中读取并解析，界面线程只负责显示进度
+        from src.importers.import_pipeline import ImportJob
+        from src.ui.import_worker import start_import
+
+        progress = QProgressDialog(f"正在导入 {Path(file_path).name}...", "取消", 0, 100, self)
+        progress.setWindowTitle("导入课表")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(300)
+        progress.setValue(0)
 
+        def on_progress(done, total, stage):
+            progress.setLabelText(f"{stage} ({done}/{total})" if stage else f"正在导入 {Path(file_path).name}...")
+            progress.setValue(int(done * 100 / total) if total else 0)
+
+        def on_done():
+            self._import_worker = None
+            progress.canceled.disconnect(worker.cancel)
+            progress.close()
+
+        def on_finished(bases, details):
+            on_done()
             new_courses = self._process_imported_data(bases, details)
             if not new_courses:
                 QMessageBox.warning(self, "提示", "未解析到有效课程")
                 return
-
-            self.courses.extend(new_courses)
-            self.schedule_view.update_courses(self.courses)
+            result = self._apply_imported_courses(new_courses)
+            QMessageBox.information(self, "成功", f"导入完成：{result.summary()}")
+
+        def on_failed(error):
+            on_done()
+            logger.error("导入失败", exc_info=error)
+            QMessageBox.critical(self, "导入失败", f"错误详情:\n{str(error)}")
+
+        def on_cancelled():
+            on_done()
+            self.statusBar().showMessage("导入已取消", 2000)
+
+        # 回调在信号排队送回界面线程后才执行，届时 worker 已赋值
+        worker = start_import(
+            ImportJob(file_type, file_path=file_path, avoid_adjacent_colors=self.config.avoid_adjacent_colors),
+            on_finished, on_failed, on_cancelled, on_progress,
+        )
+        self._import_worker = worker
+        progress.canceled.connect(worker.cancel)
+
+    def _apply_imported_courses(self, new_courses, remove_missing=False, removable=None):
+        """把解析结果按指纹合并进课表，只有课程块发生变化时才刷新和保存"""
+        result = merge_courses(self.courses, new_courses, remove_missing=remove_missing, removable=removable)
+        if result.has_changes:
+            self._set_courses(result.merged)
             self._action_save()
-            QMessageBox.information(self, "成功", f"成功导入 {len(new_courses)} 个课程节点")
-
-        except Exception as e:
-            QMessageBox.critical(self, "导入失败", f"错误详情:\n{str(e)}")
-            import traceback
-            traceback.print_exc()
+        return result
 
     def _process_imported_data(self, bases, details):
         if not bases or not details: return []
-        combined = []
-        base_map = {b.course_id: b for b in bases}
-        for d in details:
-            if d.course_id in base_map: combined.append((base_map[d.course_id], d))
-        return combined
+        return pair_courses(bases, details)
 
     def _change_week(self, delta):
         new_week = self.schedule_view.current_week + delta
@@ -499,6 +625,20 @@ class MainWindow(QMainWindow):
         self.action_current_week.setText(f"📅 第 {new_week} 周")
         self.schedule_view.update_courses(self.courses)
 
+    def _on_open_timeline(self):
+        """连续滚动浏览整个学期，双击某一周跳转"""
+        from src.ui.timeline_view import TimelineDialog
+        dlg = TimelineDialog(
+            self.schedule_view.get_semester_grid(self.courses),
+            self.time_slots,
+            self.schedule_view.semester_start_date,
+            current_week=self.schedule_view.current_week,
+            course_opacity=self.schedule_view.course_opacity,
+            parent=self,
+        )
+        dlg.week_selected.connect(lambda week: self._change_week(week - self.schedule_view.current_week))
+        dlg.exec()
+
     def _on_add_course(self, day=1, section=1):
         dialog = CourseDialog(self)
         dialog.day_combo.setCurrentIndex(day - 1)
@@ -506,22 +646,35 @@ class MainWindow(QMainWindow):
         if dialog.exec():
             base, detail = dialog.get_course_data()
             if base and detail:
-                self.courses.append((base, detail))
-                self.schedule_view.update_courses(self.courses)
+                self._set_courses(self.courses + [(base, detail)])
                 self._action_save()
 
     def _on_edit_course(self, base, detail):
         dialog = CourseDialog(self, base, detail)
-        if dialog.exec():
-            self._remove_course(base.id)
+        result = dialog.exec()
+        if result == 2:
+            # 对话框中点了删除：只删除这一个课程块
+            self._remove_course_details([detail])
+            self._action_save()
+        elif result:
             new_base, new_detail = dialog.get_course_data()
             if new_base and new_detail:
-                self.courses.append((new_base, new_detail))
-                self.schedule_view.update_courses(self.courses)
+                # 替换被编辑的课程块，同一课程的其他课程块沿用新的名称和颜色
+                remaining = remove_all(self.courses, [detail], key=lambda c: c[1])
+                remaining = [(new_base, d) if b.course_id == new_base.course_id else (b, d)
+                             for b, d in remaining]
+                self._set_courses(remaining + [(new_base, new_detail)])
                 self._action_save()
 
-    def _remove_course(self, course_id):
-        self.courses = [c for c in self.courses if c[0].id != course_id]
+    def _remove_course_details(self, details):
+        """按课程块删除，一次遍历过滤"""
+        self._set_courses(remove_all(self.courses, details, key=lambda c: c[1]))
+
+    def _set_courses(self, courses):
+        """替换课程列表并刷新视图；课程的增删改都经过这里，学期网格据此重建"""
+        self.courses = courses
+        self.schedule_view.mark_courses_changed()
+        self.schedule_view.update_courses(self.courses)
 
     def _on_empty_cell_clicked(self, day, section):
         self._on_add_course(day, section)
\ No newline at end of file
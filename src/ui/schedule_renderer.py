@@ -0,0 +1,296 @@
+"""
+课表离屏渲染
+src/ui/schedule_renderer.py
+
+直接根据课程数据把一周（或整个学期的每一周）绘制到 QImage，再导出为 PNG 或多页 PDF，
+不显示窗口，也不为每个格子创建 CourseWidget。
+QImage 上的 QPainter 可在非 GUI 线程使用，多周并行渲染；
+字体和缩放后的背景图只创建一次，各周共用
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import Qt, QRectF, QSize, QMarginsF
+from PyQt6.QtGui import QColor, QFont, QImage, QPainter, QPainterPath, QPageLayout, QPageSize, QPdfWriter
+
+from src.models.time_slot import TimeSlot
+from src.core.semester_grid import SemesterGrid
+from src.core.week_layout import CourseCard, WeekHeaderLabels, WeekLayout
+from src.utils.profiler import timed
+
+# 并行渲染的线程数上限
+MAX_RENDER_THREADS = 4
+
+
+@dataclass
+class RenderOptions:
+    """渲染参数（尺寸为像素）"""
+    width: int = 1600
+    height: int = 1200
+    header_height: int = 60
+    time_column_width: int = 80
+    background_path: str = ""
+    background_opacity: float = 1.0
+    course_opacity: float = 0.95
+    title: str = "第 {week} 周"        # 标题，{week} 替换为周次；为空时不画标题
+    title_height: int = 50
+    font_scale: float = 0.0              # 字体缩放，0 为按 height 自动（1200 像素高为 1.0）
+
+
+class RenderFonts:
+    """渲染用字体，按像素大小创建一次"""
+
+    def __init__(self, scale: float = 1.0):
+        def font(size, bold=False):
+            f = QFont("Microsoft YaHei")
+            f.setPixelSize(max(int(size * scale), 1))
+            f.setBold(bold)
+            return f
+
+        self.title = font(24, True)
+        self.header = font(15)
+        self.header_today = font(16, True)
+        self.section = font(20, True)
+        self.time = font(12)
+        self.course_name = font(14, True)
+        self.course_info = font(12)
+
+
+def text_color_for(color: QColor) -> QColor:
+    """按背景亮度选择文字颜色，与 CourseWidget 一致"""
+    if 0.299 * color.red() + 0.587 * color.green() + 0.114 * color.blue() < 128:
+        return QColor("white")
+    return QColor("#333333")
+
+
+def paint_course_card(painter: QPainter, rect: QRectF, base, detail, opacity: float, fonts: RenderFonts):
+    """
+    绘制一个课程卡片：圆角色块 + 课程名 / 教师 / @地点
+
+    离屏渲染和课表的委托绘制共用
+    """
+    try:
+        color = QColor(base.color)
+    except Exception:
+        color = QColor("#E3F2FD")
+    if not color.isValid():
+        color = QColor("#E3F2FD")
+    color.setAlpha(int(255 * opacity))
+
+    card = rect.adjusted(2, 2, -2, -2)
+    path = QPainterPath()
+    path.addRoundedRect(card, 8, 8)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.fillPath(path, color)
+
+    painter.setPen(text_color_for(color))
+    inner = card.adjusted(4, 4, -4, -4)
+    flags = Qt.AlignmentFlag.AlignHCenter.value | Qt.TextFlag.TextWordWrap.value
+    lines = [(fonts.course_name, base.name)]
+    if detail.teacher:
+        lines.append((fonts.course_info, detail.teacher))
+    if detail.location:
+        lines.append((fonts.course_info, f"@{detail.location}"))
+
+    # 先量出总高度再垂直居中
+    heights = []
+    for font, text in lines:
+        painter.setFont(font)
+        heights.append(painter.boundingRect(inner, flags, text).height())
+    y = inner.top() + max((inner.height() - sum(heights) - 2 * (len(lines) - 1)) / 2, 0)
+    for (font, text), height in zip(lines, heights):
+        if y >= inner.bottom():
+            break
+        painter.setFont(font)
+        painter.drawText(QRectF(inner.left(), y, inner.width(), min(height, inner.bottom() - y)), flags, text)
+        y += height + 2
+
+
+class ScheduleRenderer:
+    """
+    课表离屏渲染器
+
+    Example:
+        renderer = ScheduleRenderer(time_slots, semester_start, RenderOptions(background_path=bg))
+        renderer.export_pdf("课表.pdf", grid, range(1, grid.weeks + 1))
+    """
+
+    def __init__(self, time_slots: Sequence[TimeSlot], semester_start_date: date,
+                 options: Optional[RenderOptions] = None):
+        self.time_slots = list(time_slots)
+        # 表头日期与课表视图共用同一映射
+        self.header_labels = WeekHeaderLabels(semester_start_date)
+        self.options = options or RenderOptions()
+        self._fonts = threading.local()
+        self._time_labels = [
+            (str(slot.section_number), slot.start_time.strftime('%H:%M'), slot.end_time.strftime('%H:%M'))
+            for slot in self.time_slots
+        ]
+        self._background: Optional[QImage] = None
+        self._scaled_backgrounds: Dict[Tuple[int, int], QImage] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def fonts(self) -> RenderFonts:
+        """字体按线程各创建一次，线程池中的线程复用"""
+        fonts = getattr(self._fonts, "value", None)
+        if fonts is None:
+            scale = self.options.font_scale or self.options.height / 1200
+            fonts = self._fonts.value = RenderFonts(scale)
+        return fonts
+
+    # ---------- 背景 ----------
+
+    def _scaled_background(self, size: QSize) -> Optional[QImage]:
+        """按尺寸缓存缩放（铺满并居中裁剪）后的背景图"""
+        path = self.options.background_path
+        if not path or not Path(path).exists():
+            return None
+        key = (size.width(), size.height())
+        with self._lock:
+            cached = self._scaled_backgrounds.get(key)
+            if cached is not None:
+                return cached
+            if self._background is None:
+                self._background = QImage(path)  # GIF 取第一帧
+            if self._background.isNull():
+                return None
+            scaled = self._background.scaled(
+                size, Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                Qt.TransformationMode.SmoothTransformation
+            )
+            x, y = (scaled.width() - size.width()) // 2, (scaled.height() - size.height()) // 2
+            cached = self._scaled_backgrounds[key] = scaled.copy(x, y, size.width(), size.height())
+            return cached
+
+    # ---------- 绘制 ----------
+
+    def paint_week(self, painter: QPainter, size: QSize, week: int, cards: List[CourseCard]):
+        """把一周课表画到 painter 上（左上角为原点）"""
+        opts = self.options
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+
+        painter.fillRect(0, 0, size.width(), size.height(), Qt.GlobalColor.white)
+        background = self._scaled_background(size)
+        if background is not None:
+            painter.setOpacity(opts.background_opacity)
+            painter.drawImage(0, 0, background)
+            painter.setOpacity(1.0)
+
+        top = 0.0
+        if opts.title:
+            painter.setFont(self.fonts.title)
+            painter.setPen(QColor("#2c3e50"))
+            painter.drawText(QRectF(0, 0, size.width(), opts.title_height), Qt.AlignmentFlag.AlignCenter,
+                             opts.title.format(week=week))
+            top = opts.title_height
+
+        rows = max(len(self.time_slots), 1)
+        col_width = (size.width() - opts.time_column_width) / 7
+        row_height = (size.height() - top - opts.header_height) / rows
+        body_top = top + opts.header_height
+
+        # 表头：月份 + 星期/日期
+        header_bg = QColor(255, 255, 255, 102)
+        painter.fillRect(QRectF(0, top, size.width(), opts.header_height), header_bg)
+        dates, texts = self.header_labels.dates(week), self.header_labels.texts(week)
+        monday = dates[0]
+        painter.setFont(self.fonts.header_today)
+        painter.setPen(QColor("#2d8cf0"))
+        painter.drawText(QRectF(0, top, opts.time_column_width, opts.header_height),
+                         Qt.AlignmentFlag.AlignCenter, f"{monday.month}\n月")
+        today = date.today()
+        for day in range(1, 8):
+            is_today = dates[day - 1] == today
+            painter.setFont(self.fonts.header_today if is_today else self.fonts.header)
+            painter.setPen(QColor("#2d8cf0") if is_today else QColor("#5f6368"))
+            rect = QRectF(opts.time_column_width + (day - 1) * col_width, top, col_width, opts.header_height)
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, texts[day - 1])
+
+        # 时间列
+        painter.fillRect(QRectF(0, body_top, opts.time_column_width, size.height() - body_top), header_bg)
+        line_pen = QColor(0, 0, 0, 30)
+        for row, (section, start, end) in enumerate(self._time_labels):
+            rect = QRectF(0, body_top + row * row_height, opts.time_column_width, row_height)
+            painter.setPen(line_pen)
+            painter.drawLine(rect.bottomLeft(), rect.bottomRight())
+            painter.setPen(QColor("#2c3e50"))
+            painter.setFont(self.fonts.section)
+            painter.drawText(rect.adjusted(0, 0, 0, -rect.height() / 2), Qt.AlignmentFlag.AlignCenter, section)
+            painter.setPen(QColor("#7f8c8d"))
+            painter.setFont(self.fonts.time)
+            painter.drawText(rect.adjusted(0, rect.height() / 2, 0, 0), Qt.AlignmentFlag.AlignCenter,
+                             f"{start}\n{end}")
+
+        for card in cards:
+            rect = QRectF(opts.time_column_width + (card.column - 1) * col_width,
+                          body_top + card.row * row_height, col_width, card.row_span * row_height)
+            paint_course_card(painter, rect, card.base, card.detail, opts.course_opacity, self.fonts)
+
+    def render_week(self, layout: WeekLayout, week: int, size: Optional[QSize] = None) -> QImage:
+        """渲染一周为 QImage（可在工作线程调用）"""
+        size = size or QSize(self.options.width, self.options.height)
+        image = QImage(size, QImage.Format.Format_ARGB32_Premultiplied)
+        painter = QPainter(image)
+        try:
+            self.paint_week(painter, size, week, layout.cards(week))
+        finally:
+            painter.end()
+        return image
+
+    @timed()
+    def render_weeks(self, grid: SemesterGrid, weeks: Sequence[int], size: Optional[QSize] = None,
+                     max_workers: int = MAX_RENDER_THREADS) -> List[QImage]:
+        """并行渲染多周，按 weeks 的顺序返回"""
+        layout = WeekLayout(grid, self.time_slots)
+        weeks = list(weeks)
+        # 卡片布局在当前线程算好，工作线程只读
+        for week in weeks:
+            layout.cards(week)
+        if len(weeks) <= 1 or max_workers <= 1:
+            return [self.render_week(layout, week, size) for week in weeks]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(weeks))) as pool:
+            return list(pool.map(lambda week: self.render_week(layout, week, size), weeks))
+
+    # ---------- 导出 ----------
+
+    def export_image(self, path: str, grid: SemesterGrid, week: int) -> bool:
+        """导出一周为图片（格式由扩展名决定）"""
+        return self.render_weeks(grid, [week])[0].save(path)
+
+    @timed()
+    def export_pdf(self, path: str, grid: SemesterGrid, weeks: Sequence[int], resolution: int = 150) -> int:
+        """
+        导出多周为多页 PDF（A4 横向，每周一页）
+
+        各页先在工作线程中按页面像素尺寸渲染成图片，再依次写入 PDF
+
+        Returns:
+            页数
+        """
+        weeks = list(weeks)
+        if not weeks:
+            return 0
+        writer = QPdfWriter(path)
+        writer.setResolution(resolution)
+        writer.setPageLayout(QPageLayout(QPageSize(QPageSize.PageSizeId.A4),
+                                         QPageLayout.Orientation.Landscape, QMarginsF(0, 0, 0, 0)))
+        page = writer.pageLayout().paintRectPixels(resolution)
+        images = self.render_weeks(grid, weeks, QSize(page.width(), page.height()))
+
+        painter = QPainter(writer)
+        try:
+            for index, image in enumerate(images):
+                if index:
+                    writer.newPage()
+                painter.drawImage(0, 0, image)
+        finally:
+            painter.end()
+        return len(images)
@@ -0,0 +1,260 @@
+"""
+课表视图（模型 + 委托绘制）
+src/ui/schedule_table_view.py
+
+ScheduleView 为每个课程格子 setCellWidget 一个 CourseWidget（带布局、标签和阴影），
+控件越多切换周次和滚动越慢。这里用 QAbstractTableModel 提供一周的占用网格，
+QStyledItemDelegate 直接画课程卡片，跨节课程用 setSpan 合并，
+绘制与滚动开销只与可见格子有关。对外接口与 ScheduleView 相同，
+由 Config.schedule_view_mode 选择
+"""
+
+from datetime import date
+from typing import Dict, List, Optional
+
+from PyQt6.QtWidgets import QTableView, QHeaderView, QAbstractItemView, QStyledItemDelegate
+from PyQt6.QtCore import Qt, pyqtSignal, QAbstractTableModel, QModelIndex, QRectF
+from PyQt6.QtGui import QColor, QFont, QPainter
+
+from src.models.time_slot import TimeSlot
+from src.core.semester_grid import SemesterGridCache
+from src.core.week_layout import CourseCard, WeekHeaderLabels, WeekLayout
+from src.ui.schedule_view import ScheduleViewMixin, TimeColumnDelegate, time_column_colors
+from src.ui.schedule_renderer import RenderFonts, paint_course_card
+from src.utils.profiler import timed
+
+# 课程卡片数据（仅卡片左上角的格子有值）
+CourseRole = Qt.ItemDataRole.UserRole + 1
+
+
+class ScheduleTableModel(QAbstractTableModel):
+    """一周课表：行为作息时间中的节次，第0列为时间列，第1-7列为周一到周日"""
+
+    def __init__(self, time_slots: List[TimeSlot], parent=None):
+        super().__init__(parent)
+        self._time_texts: List[str] = []
+        self._starts: Dict[tuple, CourseCard] = {}
+        self._covered: Dict[tuple, CourseCard] = {}
+        self._time_colors = time_column_colors("transparent")
+        self._header_texts = [""] * 8
+        self._today_column = -1
+        self._header_font = QFont("Microsoft YaHei")
+        self._header_font.setPixelSize(13)
+        self._today_font = QFont("Microsoft YaHei")
+        self._today_font.setPixelSize(14)
+        self._today_font.setBold(True)
+        self._month_font = QFont("Microsoft YaHei", 12, QFont.Weight.Bold)
+        self.set_time_slots(time_slots)
+
+    # ---------- 更新 ----------
+
+    def set_time_slots(self, time_slots: List[TimeSlot]):
+        self.beginResetModel()
+        self._time_texts = [
+            f"{slot.section_number}\n{slot.start_time.strftime('%H:%M')}\n{slot.end_time.strftime('%H:%M')}"
+            for slot in time_slots
+        ]
+        self._starts, self._covered = {}, {}
+        self.endResetModel()
+
+    def set_cards(self, cards: List[CourseCard]):
+        """替换本周的课程卡片"""
+        self.beginResetModel()
+        self._starts = {(card.row, card.column): card for card in cards}
+        self._covered = {}
+        for card in cards:
+            for row in range(card.row, card.row + card.row_span):
+                self._covered[(row, card.column)] = card
+        self.endResetModel()
+
+    def set_time_column_style(self, style_mode: str):
+        self._time_colors = time_column_colors(style_mode)
+        if self._time_texts:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._time_texts) - 1, 0))
+
+    def set_header(self, texts: List[str], today_column: int):
+        """表头文字（8列）及今天所在的列，-1 表示不在本周"""
+        self._header_texts = texts
+        self._today_column = today_column
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, 7)
+
+    # ---------- 查询 ----------
+
+    def cards(self) -> List[CourseCard]:
+        return list(self._starts.values())
+
+    def card_at(self, row: int, column: int) -> Optional[CourseCard]:
+        """覆盖某个格子的课程卡片（含跨节覆盖的格子）"""
+        return self._covered.get((row, column))
+
+    # ---------- QAbstractTableModel ----------
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._time_texts)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 8
+
+    def flags(self, index):
+        return Qt.ItemFlag.ItemIsEnabled
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if column == 0:
+            if role == Qt.ItemDataRole.DisplayRole:
+                return self._time_texts[row]
+            if role == Qt.ItemDataRole.BackgroundRole:
+                return self._time_colors[0]
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return self._time_colors[1]
+            return None
+
+        card = self._starts.get((row, column))
+        if card is None:
+            return None
+        if role == CourseRole:
+            return card
+        if role == Qt.ItemDataRole.ToolTipRole:
+            lines = [card.base.name, card.detail.teacher, f"@{card.detail.location}" if card.detail.location else ""]
+            return "\n".join(line for line in lines if line)
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal or not 0 <= section < 8:
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._header_texts[section]
+        if role == Qt.ItemDataRole.FontRole:
+            if section == 0:
+                return self._month_font
+            return self._today_font if section == self._today_column else self._header_font
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if section == 0 or section == self._today_column:
+                return QColor("#2d8cf0")
+            return QColor("#5f6368")
+        return None
+
+
+class CourseCardDelegate(QStyledItemDelegate):
+    """直接绘制课程卡片，跨节格子由视图的 span 给出完整区域"""
+
+    def __init__(self, view: "ScheduleTableView"):
+        super().__init__(view)
+        self._view = view
+        self._fonts = RenderFonts()
+
+    def paint(self, painter, option, index):
+        card = index.data(CourseRole)
+        if card is None:
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        paint_course_card(painter, QRectF(option.rect), card.base, card.detail,
+                          self._view.course_opacity, self._fonts)
+        painter.restore()
+
+
+class ScheduleTableView(ScheduleViewMixin, QTableView):
+    """模型/委托实现的课表视图，公开接口与 ScheduleView 一致"""
+    course_clicked = pyqtSignal(object, object)
+    empty_cell_clicked = pyqtSignal(int, int)
+
+    def __init__(self, time_slots: List[TimeSlot], parent=None):
+        super().__init__(parent)
+        self.time_slots = time_slots
+        self.current_week = 1
+        self.semester_start_date = date.today()
+        self.background_opacity = 1.0
+        self.course_opacity = 0.95
+        self.background_movie = None
+        self.background_pixmap = None
+        self._grid_cache = SemesterGridCache(len(time_slots))
+        self._courses_version = 0
+        self._layout: Optional[WeekLayout] = None
+        self._header_labels = WeekHeaderLabels(self.semester_start_date)
+
+        self._model = ScheduleTableModel(time_slots, self)
+        self.setModel(self._model)
+        self._init_table_ui()
+        self.clicked.connect(self._on_index_clicked)
+        self._init_background_painting()
+
+    def _init_table_ui(self):
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+        self.setColumnWidth(0, 70)
+        self.verticalHeader().setVisible(False)
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.verticalHeader().setDefaultSectionSize(75)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setShowGrid(False)
+        self.setMouseTracking(False)
+
+        self.setItemDelegate(CourseCardDelegate(self))
+        self.setItemDelegateForColumn(0, TimeColumnDelegate(self))
+        self.update_header_dates()
+
+        # 设置默认透明样式
+        self.set_header_style("transparent")
+
+    def _update_time_column_style(self, style_mode):
+        self._model.set_time_column_style(style_mode)
+
+    @property
+    def cell_courses(self) -> Dict[tuple, tuple]:
+        """(行, 列) -> (CourseBase, CourseDetail)，与 ScheduleView.cell_courses 相同"""
+        return {(card.row, card.column): (card.base, card.detail) for card in self._model.cards()}
+
+    @timed()
+    def update_courses(self, courses):
+        grid = self.get_semester_grid(courses)
+        if self._layout is None or self._layout.grid is not grid:
+            self._layout = WeekLayout(grid, self.time_slots)
+        cards = self._layout.cards(self.current_week)
+
+        self.clearSpans()
+        self._model.set_cards(cards)
+        for card in cards:
+            if card.row_span > 1:
+                self.setSpan(card.row, card.column, card.row_span, 1)
+
+    def _on_index_clicked(self, index):
+        row, column = index.row(), index.column()
+        if column == 0:
+            return
+        card = self._model.card_at(row, column)
+        if card is not None:
+            self.course_clicked.emit(card.base, card.detail)
+        elif row < len(self.time_slots):
+            self.empty_cell_clicked.emit(column, self.time_slots[row].section_number)
+
+    def set_semester_start_date(self, start_date: date):
+        self.semester_start_date = start_date
+        if start_date != self._header_labels.semester_start_date:
+            self._header_labels = WeekHeaderLabels(start_date)
+        self.update_header_dates()
+
+    def update_header_dates(self):
+        today = date.today()
+        texts = [f"{today.month}\n月", *self._header_labels.texts(self.current_week)]
+        self._model.set_header(texts, self._header_labels.today_column(self.current_week, today))
+
+    def set_week(self, week):
+        self.current_week = week
+        self.update_header_dates()
+
+    def set_course_opacity(self, opacity: float):
+        self.course_opacity = opacity
+        self.viewport().update()
+
+    def update_time_slots(self, time_slots: List[TimeSlot]):
+        self.time_slots = time_slots
+        self._grid_cache = SemesterGridCache(len(time_slots))
+        self._layout = None
+        self.clearSpans()
+        self._model.set_time_slots(time_slots)
+        self.viewport().update()
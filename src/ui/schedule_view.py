@@ -14,9 +14,9 @@ from PyQt6.QtWidgets import (
     QGraphicsDropShadowEffect
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QRect, QEvent
-from PyQt6.QtGui import QColor, QFont, QMovie, QPainter, QPixmap, QPen
+from PyQt6.QtGui import QBrush, QColor, QFont, QMovie, QPainter, QPixmap, QPen
 from typing import List
-from datetime import date, timedelta
+from datetime import date
 from pathlib import Path as FilePath
 import sys
 from pathlib import Path
@@ -30,6 +30,9 @@ from src.models.course_base import CourseBase
 from src.models.course_detail import CourseDetail
 from src.models.time_slot import TimeSlot
 from src.ui.overlay_scrollbar import OverlayScrollBar
+from src.core.semester_grid import SemesterGrid, SemesterGridCache
+from src.core.week_layout import WeekHeaderLabels
+from src.utils.profiler import timed
 
 
 class TimeColumnDelegate(QStyledItemDelegate):
@@ -70,6 +73,15 @@ class TimeColumnDelegate(QStyledItemDelegate):
         painter.restore()
 
 
+def time_column_colors(style_mode):
+    """时间列的 (背景色, 文字色)，与表头风格一致"""
+    if style_mode == "translucent":
+        return QColor(255, 255, 255, 102), QColor("#5f6368")  # 40% 不透明度
+    if style_mode == "transparent":
+        return QColor(255, 255, 255, 0), QColor("#2c3e50")  # 完全透明，深色文字
+    return QColor(248, 249, 250, 255), QColor("#444444")  # 不透明
+
+
 class CourseWidget(QWidget):
     clicked = pyqtSignal()
 
@@ -143,23 +155,82 @@ class CourseWidget(QWidget):
         )
 
 
-class ScheduleView(QTableWidget):
-    course_clicked = pyqtSignal(object, object)
-    empty_cell_clicked = pyqtSignal(int, int)
+class HeaderRenderer:
+    """
+    ScheduleView 的表头
 
-    def __init__(self, time_slots: List[TimeSlot], parent=None):
-        super().__init__(len(time_slots), 8, parent)
-        self.time_slots = time_slots
-        self.current_week = 1
-        self.semester_start_date = date.today()
-        self.background_opacity = 1.0
-        self.course_opacity = 0.95
-        self.background_movie = None
-        self.background_pixmap = None
-        self.cell_courses = {}
+    8 个表头项、字体和画刷只创建一次，整学期的日期文字预先算好；
+    切换周次时只原地修改变化了的文字和“今天”的高亮
+    """
 
-        self._init_table_ui()
-        self.cellClicked.connect(self._on_cell_clicked)
+    def __init__(self, table: QTableWidget, semester_start_date: date):
+        self._table = table
+        self._labels = WeekHeaderLabels(semester_start_date)
+        self._font = QFont("Microsoft YaHei")
+        self._font.setPixelSize(13)
+        self._today_font = QFont("Microsoft YaHei")
+        self._today_font.setPixelSize(14)
+        self._today_font.setBold(True)
+        self._brush = QBrush(QColor("#5f6368"))
+        self._today_brush = QBrush(QColor("#2d8cf0"))
+        self._items: List[QTableWidgetItem] = []
+        self._state = None  # 上次显示的 (文字, 今天所在列, 月份)
+
+    def set_semester_start_date(self, start_date: date):
+        if start_date != self._labels.semester_start_date:
+            self._labels = WeekHeaderLabels(start_date)
+            self._state = None
+
+    def _ensure_items(self):
+        # setHorizontalHeaderItem 等会替换表头项，此时重新创建；
+        # setHorizontalHeaderLabels 会改写已有表头项的文字，此时全部重写
+        if self._items and all(self._table.horizontalHeaderItem(i) is item for i, item in enumerate(self._items)):
+            if self._state is not None:
+                texts, _, month = self._state
+                shown = tuple(item.text() for item in self._items[1:])
+                if shown != texts or self._items[0].text() != f"{month}\n月":
+                    self._state = None
+            return
+        month = QTableWidgetItem()
+        month.setFont(QFont("Microsoft YaHei", 12, QFont.Weight.Bold))
+        month.setForeground(self._today_brush)
+        self._items = [month] + [QTableWidgetItem() for _ in range(7)]
+        for col, item in enumerate(self._items):
+            if col:
+                item.setFont(self._font)
+                item.setForeground(self._brush)
+            self._table.setHorizontalHeaderItem(col, item)
+        self._state = None
+
+    def update(self, week: int, today: date):
+        """显示第 week 周的表头，只修改与上次不同的部分"""
+        self._ensure_items()
+        texts = self._labels.texts(week)
+        today_column = self._labels.today_column(week, today)
+        old_texts, old_today, old_month = self._state or ((None,) * 7, -1, None)
+
+        if today.month != old_month:
+            self._items[0].setText(f"{today.month}\n月")
+        for col in range(1, 8):
+            item = self._items[col]
+            if texts[col - 1] != old_texts[col - 1]:
+                item.setText(texts[col - 1])
+            if (col == today_column) != (col == old_today):
+                is_today = col == today_column
+                item.setFont(self._today_font if is_today else self._font)
+                item.setForeground(self._today_brush if is_today else self._brush)
+        self._state = (texts, today_column, today.month)
+
+
+class ScheduleViewMixin:
+    """
+    课表视图的公共部分：背景绘制、表头风格、学期网格缓存
+
+    ScheduleView (QTableWidget + CourseWidget) 和 ScheduleTableView (模型 + 委托绘制)
+    共用，子类需实现 _update_time_column_style
+    """
+
+    def _init_background_painting(self):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.overlay_scroll = OverlayScrollBar(self)
 
@@ -168,7 +239,7 @@ class ScheduleView(QTableWidget):
         self.viewport().setAutoFillBackground(False)
 
         # 2. 移除边框
-        self.setFrameShape(QTableWidget.Shape.NoFrame)
+        self.setFrameShape(QAbstractItemView.Shape.NoFrame)
         
         # 3. 安装事件过滤器在 viewport 上绘制背景
         self.viewport().installEventFilter(self)
@@ -177,26 +248,6 @@ class ScheduleView(QTableWidget):
         self.horizontalHeader().setAutoFillBackground(False)
         self.horizontalHeader().installEventFilter(self)
 
-    def _init_table_ui(self):
-        headers = ["", "周一", "周二", "周三", "周四", "周五", "周六", "周日"]
-        self.setHorizontalHeaderLabels(headers)
-        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-        self.setColumnWidth(0, 70)
-        self.verticalHeader().setVisible(False)
-        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
-        self.setShowGrid(False)
-        self.setFrameShape(QTableWidget.Shape.NoFrame)
-
-        self.setItemDelegateForColumn(0, TimeColumnDelegate(self))
-        self._refresh_time_column()
-        for i in range(self.rowCount()): 
-            self.setRowHeight(i, 75)
-        
-        # 设置默认透明样式
-        self.set_header_style("transparent")
-
     def eventFilter(self, obj, event):
         """事件过滤器：在 viewport 和表头上绘制背景"""
         if event.type() == QEvent.Type.Paint:
@@ -272,6 +323,148 @@ class ScheduleView(QTableWidget):
             # 默认绘制白底
             painter.fillRect(rect, Qt.GlobalColor.white)
 
+    def get_semester_grid(self, courses) -> SemesterGrid:
+        """课程列表对应的学期网格，供课表视图和提醒共用"""
+        return self._grid_cache.get(courses, self._courses_version)
+
+    def mark_courses_changed(self):
+        """
+        课程列表增删改后调用，下次取学期网格时重建
+
+        切换周次等只重绘的 update_courses 不需要调用
+        """
+        self._courses_version += 1
+
+    def set_background_opacity(self, opacity: float):
+        self.background_opacity = opacity
+        self.viewport().update()
+        self.horizontalHeader().update()
+
+    def set_background(self, image_path: str, opacity: float):
+        self.background_opacity = opacity
+        if self.background_movie: 
+            self.background_movie.stop()
+            self.background_movie = None
+        
+        if not image_path or not FilePath(image_path).exists():
+            self.background_pixmap = None
+        elif image_path.lower().endswith('.gif'):
+            self.background_movie = QMovie(image_path)
+            # 连接到 viewport 和表头的更新
+            self.background_movie.frameChanged.connect(self.viewport().update)
+            self.background_movie.frameChanged.connect(self.horizontalHeader().update)
+            self.background_movie.start()
+            self.background_pixmap = None
+        else:
+            self.background_pixmap = QPixmap(image_path)
+        
+        self.viewport().update()
+        self.horizontalHeader().update()
+
+    def set_header_style(self, style_mode):
+        """
+        设置表头样式
+        
+        Args:
+            style_mode: 样式模式
+                - "translucent": 半透明毛玻璃效果 (40% 不透明度)
+                - "transparent": 完全透明，显示背景图片
+                - 其他: 默认不透明样式
+        """
+        if style_mode == "translucent":
+            bg_color = "rgba(255, 255, 255, 102)"  # 40% 不透明度
+            border_color = "rgba(0, 0, 0, 20)"
+            text_color = "#5f6368"
+        elif style_mode == "transparent":
+            bg_color = "rgba(255, 255, 255, 0)"  # 完全透明
+            border_color = "rgba(255, 255, 255, 80)"  # 半透明白色边框
+            text_color = "#2c3e50"  # 深色文字，确保在背景上可读
+        else:
+            bg_color = "rgba(248, 249, 250, 255)"
+            border_color = "#E0E0E0"
+            text_color = "#5f6368"
+
+        style = f"""
+            QHeaderView::section {{
+                background-color: {bg_color};
+                color: {text_color};
+                border: none;
+                border-bottom: 1px solid {border_color};
+                border-right: 1px solid {border_color};
+                padding: 4px;
+                font-weight: bold;
+            }}
+            QTableCornerButton::section {{
+                background-color: {bg_color};
+                border: none;
+                border-bottom: 1px solid {border_color};
+                border-right: 1px solid {border_color};
+            }}
+        """
+        self.horizontalHeader().setStyleSheet(style)
+        
+        # 更新角落按钮样式
+        if self.findChild(QWidget):
+            corner = self.findChild(QWidget)
+            if corner: 
+                corner.setStyleSheet(
+                    f"background-color: {bg_color}; "
+                    f"border-bottom: 1px solid {border_color};"
+                )
+        
+        # 更新时间列样式以匹配表头
+        self._update_time_column_style(style_mode)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.viewport().update()
+        self.horizontalHeader().update()
+        if hasattr(self, 'overlay_scroll'):
+            self.overlay_scroll.update_position()
+
+
+class ScheduleView(ScheduleViewMixin, QTableWidget):
+    course_clicked = pyqtSignal(object, object)
+    empty_cell_clicked = pyqtSignal(int, int)
+
+    def __init__(self, time_slots: List[TimeSlot], parent=None):
+        super().__init__(len(time_slots), 8, parent)
+        self.time_slots = time_slots
+        self.current_week = 1
+        self.semester_start_date = date.today()
+        self.background_opacity = 1.0
+        self.course_opacity = 0.95
+        self.background_movie = None
+        self.background_pixmap = None
+        self.cell_courses = {}
+        self._grid_cache = SemesterGridCache(len(time_slots))
+        self._courses_version = 0
+        self._header = HeaderRenderer(self, self.semester_start_date)
+
+        self._init_table_ui()
+        self.cellClicked.connect(self._on_cell_clicked)
+        self._init_background_painting()
+
+    def _init_table_ui(self):
+        headers = ["", "周一", "周二", "周三", "周四", "周五", "周六", "周日"]
+        self.setHorizontalHeaderLabels(headers)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+        self.setColumnWidth(0, 70)
+        self.verticalHeader().setVisible(False)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setShowGrid(False)
+        self.setFrameShape(QTableWidget.Shape.NoFrame)
+
+        self.setItemDelegateForColumn(0, TimeColumnDelegate(self))
+        self._refresh_time_column()
+        for i in range(self.rowCount()): 
+            self.setRowHeight(i, 75)
+        
+        # 设置默认透明样式
+        self.set_header_style("transparent")
+
     def _refresh_time_column(self):
         """刷新时间列内容"""
         for i, time_slot in enumerate(self.time_slots):
@@ -289,16 +482,8 @@ class ScheduleView(QTableWidget):
         Args:
             style_mode: 样式模式 ("translucent", "transparent", 或其他)
         """
-        if style_mode == "translucent":
-            bg_color = QColor(255, 255, 255, 102)  # 40% 不透明度
-            fg_color = QColor("#5f6368")
-        elif style_mode == "transparent":
-            bg_color = QColor(255, 255, 255, 0)  # 完全透明
-            fg_color = QColor("#2c3e50")  # 深色文字
-        else:
-            bg_color = QColor(248, 249, 250, 255)  # 不透明
-            fg_color = QColor("#444444")
-        
+        bg_color, fg_color = time_column_colors(style_mode)
+
         # 更新所有时间列单元格
         for row in range(self.rowCount()):
             item = self.item(row, 0)
@@ -306,30 +491,16 @@ class ScheduleView(QTableWidget):
                 item.setBackground(bg_color)
                 item.setForeground(fg_color)
 
+    @timed()
     def update_courses(self, courses):
         self._clear_course_cells()
         self.cell_courses.clear()
-        course_grid = {}
-
-        for base, detail in courses:
-            if not (detail.start_week <= self.current_week <= detail.end_week): 
-                continue
-            if not detail.week_type.matches_week(self.current_week): 
-                continue
-
-            day = detail.day_of_week
-            for section in range(detail.start_section, detail.end_section + 1):
-                key = (day, section)
-                if key not in course_grid: 
-                    course_grid[key] = []
-                course_grid[key].append((base, detail))
-
-        for (day, section), course_list in course_grid.items():
-            row = self._get_row_for_section(section)
-            if row is not None and course_list:
-                base, detail = course_list[0]
-                if section == detail.start_section:
-                    self._set_course_cell(row, day, base, detail)
+
+        # 学期网格只在课程列表变化后重建，切换周次直接查表
+        for base, detail in self.get_semester_grid(courses).placements(self.current_week):
+            row = self._get_row_for_section(detail.start_section)
+            if row is not None:
+                self._set_course_cell(row, detail.day_of_week, base, detail)
 
     def _get_row_for_section(self, section):
         for i, ts in enumerate(self.time_slots):
@@ -386,44 +557,16 @@ class ScheduleView(QTableWidget):
 
     def set_semester_start_date(self, start_date: date):
         self.semester_start_date = start_date
+        self._header.set_semester_start_date(start_date)
         self.update_header_dates()
 
     def update_header_dates(self):
-        week_start = self.semester_start_date + timedelta(weeks=self.current_week - 1)
-        current_month = date.today().month
-        item_0 = QTableWidgetItem(f"{current_month}\n月")
-        item_0.setFont(QFont("Microsoft YaHei", 12, QFont.Weight.Bold))
-        item_0.setForeground(QColor("#2d8cf0"))
-        self.setHorizontalHeaderItem(0, item_0)
-
-        week_names = ['周一', '周二', '周三', '周四', '周五', '周六', '周日']
-        today = date.today()
-        for i in range(7):
-            current_date = week_start + timedelta(days=i)
-            text = f"{week_names[i]}\n{current_date.strftime('%m/%d')}"
-            item = QTableWidgetItem(text)
-            font = QFont("Microsoft YaHei")
-            font.setPixelSize(13)
-            col_index = i + 1
-            if current_date == today:
-                font.setBold(True)
-                font.setPixelSize(14)
-                item.setForeground(QColor("#2d8cf0"))
-            else:
-                font.setBold(False)
-                item.setForeground(QColor("#5f6368"))
-            item.setFont(font)
-            self.setHorizontalHeaderItem(col_index, item)
+        self._header.update(self.current_week, date.today())
 
     def set_week(self, week):
         self.current_week = week
         self.update_header_dates()
 
-    def set_background_opacity(self, opacity: float):
-        self.background_opacity = opacity
-        self.viewport().update()
-        self.horizontalHeader().update()
-
     def set_course_opacity(self, opacity: float):
         self.course_opacity = opacity
         for row in range(self.rowCount()):
@@ -432,92 +575,11 @@ class ScheduleView(QTableWidget):
                 if isinstance(widget, CourseWidget): 
                     widget.update_opacity(opacity)
 
-    def set_background(self, image_path: str, opacity: float):
-        self.background_opacity = opacity
-        if self.background_movie: 
-            self.background_movie.stop()
-            self.background_movie = None
-        
-        if not image_path or not FilePath(image_path).exists():
-            self.background_pixmap = None
-        elif image_path.lower().endswith('.gif'):
-            self.background_movie = QMovie(image_path)
-            # 连接到 viewport 和表头的更新
-            self.background_movie.frameChanged.connect(self.viewport().update)
-            self.background_movie.frameChanged.connect(self.horizontalHeader().update)
-            self.background_movie.start()
-            self.background_pixmap = None
-        else:
-            self.background_pixmap = QPixmap(image_path)
-        
-        self.viewport().update()
-        self.horizontalHeader().update()
-
     def update_time_slots(self, time_slots: List[TimeSlot]):
         self.time_slots = time_slots
+        self._grid_cache = SemesterGridCache(len(time_slots))
         self.setRowCount(len(time_slots))
         for i in range(self.rowCount()): 
             self.setRowHeight(i, 75)
         self._refresh_time_column()
         self.viewport().update()
-
-    def set_header_style(self, style_mode):
-        """
-        设置表头样式
-        
-        Args:
-            style_mode: 样式模式
-                - "translucent": 半透明毛玻璃效果 (40% 不透明度)
-                - "transparent": 完全透明，显示背景图片
-                - 其他: 默认不透明样式
-        """
-        if style_mode == "translucent":
-            bg_color = "rgba(255, 255, 255, 102)"  # 40% 不透明度
-            border_color = "rgba(0, 0, 0, 20)"
-            text_color = "#5f6368"
-        elif style_mode == "transparent":
-            bg_color = "rgba(255, 255, 255, 0)"  # 完全透明
-            border_color = "rgba(255, 255, 255, 80)"  # 半透明白色边框
-            text_color = "#2c3e50"  # 深色文字，确保在背景上可读
-        else:
-            bg_color = "rgba(248, 249, 250, 255)"
-            border_color = "#E0E0E0"
-            text_color = "#5f6368"
-
-        style = f"""
-            QHeaderView::section {{
-                background-color: {bg_color};
-                color: {text_color};
-                border: none;
-                border-bottom: 1px solid {border_color};
-                border-right: 1px solid {border_color};
-                padding: 4px;
-                font-weight: bold;
-            }}
-            QTableCornerButton::section {{
-                background-color: {bg_color};
-                border: none;
-                border-bottom: 1px solid {border_color};
-                border-right: 1px solid {border_color};
-            }}
-        """
-        self.horizontalHeader().setStyleSheet(style)
-        
-        # 更新角落按钮样式
-        if self.findChild(QWidget):
-            corner = self.findChild(QWidget)
-            if corner: 
-                corner.setStyleSheet(
-                    f"background-color: {bg_color}; "
-                    f"border-bottom: 1px solid {border_color};"
-                )
-        
-        # 更新时间列样式以匹配表头
-        self._update_time_column_style(style_mode)
-
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        self.viewport().update()
-        self.horizontalHeader().update()
-        if hasattr(self, 'overlay_scroll'):
-            self.overlay_scroll.update_position()
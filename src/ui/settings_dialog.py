@@ -276,6 +276,20 @@ class SettingsDialog(QDialog):
         layout.addLayout(h_style)
         layout.addSpacing(15)
 
+        # 课表绘制方式
+        layout.addWidget(QLabel("课表绘制方式 (重启后生效):", styleSheet=STYLE_BODY))
+        self.combo_view_mode = QComboBox()
+        self.combo_view_mode.addItem("控件 (兼容)", "widget")
+        self.combo_view_mode.addItem("直接绘制 (课程多时更流畅)", "model")
+        if self.config:
+            index = self.combo_view_mode.findData(self.config.schedule_view_mode)
+            self.combo_view_mode.setCurrentIndex(max(index, 0))
+        self.combo_view_mode.currentIndexChanged.connect(
+            lambda i: self._update_config("schedule_view_mode", self.combo_view_mode.itemData(i))
+        )
+        layout.addWidget(self.combo_view_mode)
+        layout.addSpacing(15)
+
         # 背景图
         bg_layout = QHBoxLayout()
         btn_img = QPushButton("📂 选择背景图...")
@@ -0,0 +1,256 @@
+"""
+学期总览（多周连续滚动）
+src/ui/timeline_view.py
+
+把整个学期的各周纵向排列，连续滚动浏览。只绘制与可见区域相交的周，
+每周由 ScheduleRenderer 从学期网格渲染成图片并缓存；可见周前后的几周
+在线程池中预先渲染，滚动到时直接贴图。双击某一周跳转到该周
+"""
+
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, List, Optional, Set
+
+from PyQt6.QtWidgets import QAbstractScrollArea, QDialog, QVBoxLayout, QLabel
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QPainter
+
+from src.models.time_slot import TimeSlot
+from src.core.semester_grid import SemesterGrid
+from src.core.week_layout import WeekLayout, visible_weeks
+from src.ui.schedule_renderer import ScheduleRenderer, RenderOptions, MAX_RENDER_THREADS
+
+ROW_HEIGHT = 50          # 每节的高度
+TITLE_HEIGHT = 40
+HEADER_HEIGHT = 50
+WEEK_GAP = 16            # 相邻两周的间距
+PREFETCH_WEEKS = 2       # 可见区域上下各预渲染的周数
+CACHE_WEEKS = 16         # 最多缓存的周图片数
+
+
+class _RenderSignals(QObject):
+    rendered = pyqtSignal(object, object)  # 任务, QImage
+
+
+class _WeekRenderTask(QRunnable):
+    """在线程池中渲染一周"""
+
+    def __init__(self, renderer: ScheduleRenderer, layout: WeekLayout, week: int, size: QSize, generation: int):
+        super().__init__()
+        self.renderer = renderer
+        self.layout = layout
+        self.week = week
+        self.size = size
+        self.generation = generation
+        self.signals = _RenderSignals()
+
+    def run(self):
+        image = self.renderer.render_week(self.layout, self.week, self.size)
+        self.signals.rendered.emit(self, image)
+
+
+class TimelineView(QAbstractScrollArea):
+    """多周连续滚动视图"""
+    week_activated = pyqtSignal(int)
+
+    def __init__(self, time_slots: List[TimeSlot], semester_start_date: date,
+                 course_opacity: float = 0.95, parent=None):
+        super().__init__(parent)
+        self.time_slots = list(time_slots)
+        self.semester_start_date = semester_start_date
+        self.course_opacity = course_opacity
+        self._grid: Optional[SemesterGrid] = None
+        self._layout: Optional[WeekLayout] = None
+        self._renderer: Optional[ScheduleRenderer] = None
+        self._images: "OrderedDict[int, QImage]" = OrderedDict()
+        self._pending: Dict[int, _WeekRenderTask] = {}
+        # 线程池中尚未完成的任务，完成前必须保留引用（包括已失效版本的）
+        self._tasks: Set[_WeekRenderTask] = set()
+        # 课程、尺寸等变化后加一，丢弃旧版本的渲染结果
+        self._generation = 0
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(MAX_RENDER_THREADS)
+
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.verticalScrollBar().setSingleStep(ROW_HEIGHT)
+
+    # ---------- 数据 ----------
+
+    @property
+    def weeks(self) -> int:
+        return self._grid.weeks if self._grid is not None else 0
+
+    @property
+    def block_height(self) -> int:
+        return TITLE_HEIGHT + HEADER_HEIGHT + len(self.time_slots) * ROW_HEIGHT
+
+    def set_grid(self, grid: SemesterGrid):
+        """显示的学期网格（与课表视图共用 SemesterGridCache 的结果）"""
+        if grid is self._grid:
+            return
+        self._grid = grid
+        self._layout = WeekLayout(grid, self.time_slots)
+        self._invalidate()
+
+    def set_semester_start_date(self, start_date: date):
+        self.semester_start_date = start_date
+        self._invalidate()
+
+    def set_time_slots(self, time_slots: List[TimeSlot]):
+        self.time_slots = list(time_slots)
+        if self._grid is not None:
+            self._layout = WeekLayout(self._grid, self.time_slots)
+        self._invalidate()
+
+    def set_course_opacity(self, opacity: float):
+        self.course_opacity = opacity
+        self._invalidate()
+
+    def scroll_to_week(self, week: int):
+        self.verticalScrollBar().setValue((week - 1) * (self.block_height + WEEK_GAP))
+
+    def week_at(self, y: int) -> Optional[int]:
+        """视口中某一高度所在的周次，落在间距中时为 None"""
+        stride = self.block_height + WEEK_GAP
+        offset = self.verticalScrollBar().value() + y
+        week = offset // stride + 1
+        if offset % stride >= self.block_height or not 1 <= week <= self.weeks:
+            return None
+        return week
+
+    # ---------- 缓存与渲染 ----------
+
+    def _invalidate(self):
+        self._generation += 1
+        self._images.clear()
+        self._pending.clear()
+        self._renderer = None
+        self._update_scroll_range()
+        self.viewport().update()
+
+    def _block_size(self) -> QSize:
+        return QSize(max(self.viewport().width(), 400), self.block_height)
+
+    def _ensure_renderer(self) -> ScheduleRenderer:
+        if self._renderer is None:
+            size = self._block_size()
+            options = RenderOptions(
+                width=size.width(), height=size.height(),
+                header_height=HEADER_HEIGHT, title_height=TITLE_HEIGHT,
+                course_opacity=self.course_opacity, font_scale=0.85,
+            )
+            self._renderer = ScheduleRenderer(self.time_slots, self.semester_start_date, options)
+        return self._renderer
+
+    def _store(self, week: int, image: QImage):
+        self._images[week] = image
+        self._images.move_to_end(week)
+        while len(self._images) > CACHE_WEEKS:
+            self._images.popitem(last=False)
+
+    def _image(self, week: int) -> QImage:
+        """可见周的图片：命中缓存直接返回，否则当场渲染"""
+        image = self._images.get(week)
+        if image is None:
+            image = self._ensure_renderer().render_week(self._layout, week, self._block_size())
+            self._store(week, image)
+        else:
+            self._images.move_to_end(week)
+        return image
+
+    def _prefetch(self, visible: range):
+        """在线程池中预渲染可见区域上下相邻的周"""
+        renderer, size = self._ensure_renderer(), self._block_size()
+        first = max(visible.start - PREFETCH_WEEKS, 1)
+        last = min(visible.stop - 1 + PREFETCH_WEEKS, self.weeks)
+        for week in range(first, last + 1):
+            if week in self._images or week in self._pending:
+                continue
+            # 卡片布局在界面线程算好，工作线程只读
+            self._layout.cards(week)
+            task = _WeekRenderTask(renderer, self._layout, week, size, self._generation)
+            task.setAutoDelete(False)
+            task.signals.rendered.connect(self._on_rendered)
+            self._pending[week] = task
+            self._tasks.add(task)
+            self._pool.start(task)
+
+    def _on_rendered(self, task: _WeekRenderTask, image: QImage):
+        self._tasks.discard(task)
+        if task.generation != self._generation:
+            return
+        self._pending.pop(task.week, None)
+        if task.week not in self._images:
+            self._store(task.week, image)
+
+    # ---------- Qt 事件 ----------
+
+    def _update_scroll_range(self):
+        total = max(self.weeks * (self.block_height + WEEK_GAP) - WEEK_GAP, 0)
+        bar = self.verticalScrollBar()
+        bar.setRange(0, max(total - self.viewport().height(), 0))
+        bar.setPageStep(self.viewport().height())
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        painter.fillRect(self.viewport().rect(), QColor("#f0f2f5"))
+        if self._layout is None or self.weeks == 0:
+            painter.setPen(QColor("#7f8c8d"))
+            painter.drawText(self.viewport().rect(), Qt.AlignmentFlag.AlignCenter, "当前没有课程")
+            painter.end()
+            return
+
+        offset = self.verticalScrollBar().value()
+        stride = self.block_height + WEEK_GAP
+        visible = visible_weeks(offset, self.viewport().height(), self.block_height, self.weeks, WEEK_GAP)
+        for week in visible:
+            painter.drawImage(0, (week - 1) * stride - offset, self._image(week))
+        painter.end()
+        self._prefetch(visible)
+
+    def scrollContentsBy(self, dx, dy):
+        self.viewport().update()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if self._renderer is not None and self._renderer.options.width != self._block_size().width():
+            self._invalidate()
+        else:
+            self._update_scroll_range()
+
+    def mouseDoubleClickEvent(self, event):
+        week = self.week_at(int(event.position().y()))
+        if week is not None:
+            self.week_activated.emit(week)
+        super().mouseDoubleClickEvent(event)
+
+
+class TimelineDialog(QDialog):
+    """学期总览窗口，双击某一周后关闭并跳转"""
+    week_selected = pyqtSignal(int)
+
+    def __init__(self, grid: SemesterGrid, time_slots: List[TimeSlot], semester_start_date: date,
+                 current_week: int = 1, course_opacity: float = 0.95, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("学期总览")
+        self.resize(1000, 800)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        hint = QLabel("滚动浏览整个学期，双击某一周跳转到该周")
+        hint.setStyleSheet("color: #7f8c8d; padding: 6px;")
+        layout.addWidget(hint)
+
+        self.timeline = TimelineView(time_slots, semester_start_date, course_opacity, self)
+        self.timeline.set_grid(grid)
+        layout.addWidget(self.timeline)
+        self.timeline.week_activated.connect(self._on_week_activated)
+        self._current_week = current_week
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.timeline.scroll_to_week(self._current_week)
+
+    def _on_week_activated(self, week: int):
+        self.week_selected.emit(week)
+        self.accept()
@@ -12,8 +12,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import QUrl, Qt
 from pathlib import Path
 
-# --- 引入数据模型与导入器 ---
-from src.importers.html_importer import HTMLImporter
+# --- 引入导入流水线 ---
+from src.importers.import_pipeline import ImportJob
+from src.ui.import_worker import start_import
 from src.ui.styles import ModernStyles
 
 # WebEngine 兼容处理
@@ -36,8 +37,9 @@ except ImportError:
 
 
 class WebviewImportDialog(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, avoid_adjacent_colors=False):
         super().__init__(parent)
+        self.avoid_adjacent_colors = avoid_adjacent_colors
         self.setWindowTitle("🌐 导入向导 - 智能识别")
         self.resize(1000, 700)
 
@@ -46,6 +48,7 @@ class WebviewImportDialog(QDialog):
 
         # 存储解析结果 (bases, details)
         self.parsed_result = ([], [])
+        self._import_worker = None
 
         self._init_ui()
 
@@ -169,31 +172,48 @@ class WebviewImportDialog(QDialog):
         self.webview.page().runJavaScript(js_code, self._process_html)
 
     def _process_html(self, html_content):
-        """调用 HTMLImporter 解析 HTML"""
-        try:
-            # 1. 初始化导入器
-            importer = HTMLImporter()
-
-            # 2. 尝试验证
-            valid, msg = importer.validate(html_content)
-            if not valid:
-                raise ValueError(f"页面格式无法识别: {msg}")
-
-            # 3. 执行解析 (返回 bases, details)
-            self.parsed_result = importer.parse(html_content)
-
-            count = len(self.parsed_result[0])
-            if count == 0:
-                raise ValueError("未解析到任何课程，请确认当前页面是课表页。")
-
-            # 4. 成功
-            QMessageBox.information(self, "提取成功", f"成功识别出 {count} 门课程！\n点击确定导入到主界面。")
-            self.accept()  # 关闭对话框，返回 True
-
-        except Exception as e:
-            QMessageBox.warning(self, "提取失败", str(e))
-            self.btn_extract.setText("📥 提取当前页课表")
-            self.btn_extract.setEnabled(True)
+        """在后台线程中调用 HTMLImporter 解析 HTML，避免 JS 回调中阻塞界面"""
+        if not html_content:
+            self._on_extract_failed(ValueError("未能获取页面内容"))
+            return
+
+        self.btn_extract.setText("正在解析课表...")
+        self._import_worker = start_import(
+            ImportJob("HTML", content=html_content, avoid_adjacent_colors=self.avoid_adjacent_colors),
+            self._on_parse_finished, self._on_extract_failed,
+            self._reset_extract_button, self._on_parse_progress,
+        )
+
+    def _on_parse_progress(self, done, total, stage):
+        if total:
+            self.btn_extract.setText(f"正在解析课表 {int(done * 100 / total)}%")
+
+    def _on_parse_finished(self, bases, details):
+        self._import_worker = None
+        if not bases:
+            self._on_extract_failed(ValueError("未解析到任何课程，请确认当前页面是课表页。"))
+            return
+
+        self.parsed_result = (bases, details)
+        QMessageBox.information(self, "提取成功", f"成功识别出 {len(bases)} 门课程！\n点击确定导入到主界面。")
+        self.accept()  # 关闭对话框，返回 True
+
+    def _on_extract_failed(self, error):
+        self._import_worker = None
+        QMessageBox.warning(self, "提取失败", str(error))
+        self._reset_extract_button()
+
+    def _reset_extract_button(self):
+        self._import_worker = None
+        self.btn_extract.setText("📥 提取当前页课表")
+        self.btn_extract.setEnabled(True)
+
+    def reject(self):
+        # 关闭对话框时取消仍在进行的解析
+        if self._import_worker is not None:
+            self._import_worker.cancel()
+            self._import_worker = None
+        super().reject()
 
     def get_imported_data(self):
         """返回 (bases, details)"""
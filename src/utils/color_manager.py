@@ -1,11 +1,75 @@
+"""
+颜色管理器
+src/utils/color_manager.py
+
+按课程名称从调色板中取色，同名课程永远同色；
+批量分配时可根据课程在课表中的位置，尽量让相邻的课程块颜色不同
+不依赖 PyQt6，导入器等无界面路径可直接使用
+"""
+
 import hashlib
-from PyQt6.QtGui import QColor
+from functools import lru_cache
+from typing import Dict, Iterable, List, Sequence, Set
+
+
+@lru_cache(maxsize=4096)
+def _palette_index(course_name: str, salt: str, size: int) -> int:
+    """课程名称在调色板中的位置（MD5 取模），同一名称只计算一次"""
+    digest = hashlib.md5((course_name + salt).encode('utf-8')).digest()
+    return int.from_bytes(digest, 'big') % size
+
+
+def _weeks_overlap(a, b) -> bool:
+    """两个课程块是否有共同的上课周"""
+    start, end = max(a.start_week, b.start_week), min(a.end_week, b.end_week)
+    if start > end:
+        return False
+    parities = {t.value for t in (a.week_type, b.week_type)} - {"every"}
+    if len(parities) == 2:
+        return False  # 单周与双周
+    if not parities:
+        return True
+    odd = parities.pop() == "odd"
+    return end > start or (start % 2 == 1) == odd
+
+
+def course_adjacency(names_by_id: Dict[str, str], details: Iterable) -> Dict[str, Set[str]]:
+    """
+    课表中相邻（上下相连或左右相邻且节次重叠、且有共同上课周）的课程名称
+
+    Args:
+        names_by_id: 课程ID -> 课程名称
+        details: CourseDetail 列表
+    """
+    cells: Dict[tuple, List] = {}
+    blocks = []
+    for detail in details:
+        name = names_by_id.get(detail.course_id)
+        if name is None:
+            continue
+        blocks.append((name, detail))
+        for section in range(detail.start_section, detail.start_section + detail.step):
+            cells.setdefault((detail.day_of_week, section), []).append((name, detail))
+
+    adjacency: Dict[str, Set[str]] = {}
+    for name, detail in blocks:
+        day, start, end = detail.day_of_week, detail.start_section, detail.start_section + detail.step - 1
+        neighbours = [(day, start - 1), (day, end + 1)]
+        for section in range(start, end + 1):
+            neighbours += [(day - 1, section), (day + 1, section)]
+        for cell in neighbours:
+            for other_name, other in cells.get(cell, ()):
+                if other_name != name and _weeks_overlap(detail, other):
+                    adjacency.setdefault(name, set()).add(other_name)
+                    adjacency.setdefault(other_name, set()).add(name)
+    return adjacency
+
 
 class ColorManager:
     """
     颜色管理器：用于生成美观的课程颜色
     """
-    
+
     # 预设的现代配色板 (低饱和度，护眼)
     # 格式: Hex Code
     PALETTE = [
@@ -23,18 +87,68 @@ class ColorManager:
         "#F0F4C3", # Lime
     ]
 
+    DEFAULT_COLOR = "#E0E0E0" # 默认灰色
+
     @staticmethod
-    def get_color_for_course(course_name: str) -> str:
+    def get_color_for_course(course_name: str, salt: str = "") -> str:
         """
         根据课程名称生成固定的颜色
+
+        Args:
+            course_name: 课程名称
+            salt: 附加到名称上的随机串，用于"重新分配颜色"时换一套配色
         """
         if not course_name:
-            return "#E0E0E0" # 默认灰色
-            
+            return ColorManager.DEFAULT_COLOR
+
         # 使用 MD5 哈希确保同一个课程名永远对应同一个颜色
-        hash_obj = hashlib.md5(course_name.encode('utf-8'))
-        hash_int = int(hash_obj.hexdigest(), 16)
-        
-        # 从调色板中取色
-        index = hash_int % len(ColorManager.PALETTE)
-        return ColorManager.PALETTE[index]
\ No newline at end of file
+        palette = ColorManager.PALETTE
+        return palette[_palette_index(course_name, salt, len(palette))]
+
+    @staticmethod
+    def assign_colors(
+        bases: Sequence,
+        details: Iterable = (),
+        avoid_adjacent: bool = True,
+        salt: str = "",
+    ) -> Dict[str, str]:
+        """
+        为一次导入的所有课程批量分配颜色
+
+        每门课程优先使用 get_color_for_course 的颜色；avoid_adjacent 时按相邻课程数从多到少
+        依次着色，与已着色的相邻课程撞色则顺延到调色板中下一个未被相邻课程使用的颜色
+
+        Args:
+            bases: CourseBase 列表
+            details: CourseDetail 列表，用于判断相邻关系
+            avoid_adjacent: 是否尽量避免相邻课程块同色
+            salt: 同 get_color_for_course
+
+        Returns:
+            课程名称 -> 颜色
+        """
+        palette = ColorManager.PALETTE
+        names = list(dict.fromkeys(base.name for base in bases))
+        colors = {name: ColorManager.get_color_for_course(name, salt) for name in names}
+        if not avoid_adjacent:
+            return colors
+
+        adjacency = course_adjacency({base.course_id: base.name for base in bases}, details)
+        order = sorted((name for name in names if name and name in adjacency),
+                       key=lambda name: -len(adjacency[name]))
+        assigned: Dict[str, int] = {}
+        for name in order:
+            used = {assigned[other] for other in adjacency[name] if other in assigned}
+            preferred = _palette_index(name, salt, len(palette))
+            index = next((i % len(palette) for i in range(preferred, preferred + len(palette))
+                          if i % len(palette) not in used), preferred)
+            assigned[name] = index
+            colors[name] = palette[index]
+        return colors
+
+    @staticmethod
+    def apply_colors(bases: Sequence, details: Iterable = (), avoid_adjacent: bool = True, salt: str = ""):
+        """按 assign_colors 的结果原地修改 CourseBase.color"""
+        colors = ColorManager.assign_colors(bases, details, avoid_adjacent, salt)
+        for base in bases:
+            base.color = colors.get(base.name, base.color)
@@ -3,45 +3,116 @@
 src/utils/logger.py
 
 自动将日志保存到 logs 目录
+各模块的日志调用只把记录放进队列 (QueueHandler)，由后台线程 (QueueListener)
+统一写文件和控制台，界面线程和导入线程不会被磁盘 I/O 阻塞。
+模块级别和 JSON Lines 事件输出由 configure_logging 按 Config 设置
 """
+import atexit
+import json
 import logging
+import os
+import queue
 import sys
+import time
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
 
+APP_LOGGER_NAME = "WakeUpSchedule"
+# 本应用的 logger：全局 logger 和各模块 logging.getLogger(__name__) 的顶层包名
+# （以 src.xxx 和 xxx 两种路径导入时都能匹配）。其余第三方库的 logger 继承根 logger 的级别
+APP_LOGGER_NAMES = (APP_LOGGER_NAME, "src", "core", "importers", "models", "storage", "ui", "utils")
+# 根 logger 的级别：asyncio、PIL 等第三方库的 DEBUG/INFO 日志不进入队列
+ROOT_LOG_LEVEL = logging.WARNING
 
-def setup_logger(name: str = "WakeUpSchedule") -> logging.Logger:
+
+class _LogPipeline(QueueListener):
     """
-    设置并返回日志记录器
-    
-    日志文件保存在项目根目录的 logs 文件夹中
-    自动按日期命名，超过 5MB 自动轮转
+    后台写日志的监听器，整个进程只有一个
+
+    挂在根 logger 的 QueueHandler 上（以 src.utils.logger 和 utils.logger 两种路径
+    导入本模块时共用），同时记录 JSON Lines 事件文件和是否已停止
     """
-    # 获取项目根目录
+
+    def __init__(self, log_queue, *handlers):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.json_handler: Optional[logging.Handler] = None
+        self.stopped = False
+
+    def replace_handlers(self, handlers):
+        """停止后台线程（写完队列中已有的记录）再换上新的 handler 列表"""
+        if self.stopped:
+            return
+        self.stop()
+        self.handlers = tuple(handlers)
+        self.start()
+
+
+def _pipeline() -> Optional[_LogPipeline]:
+    for handler in logging.getLogger().handlers:
+        pipeline = getattr(handler, "wakeup_pipeline", None)
+        if pipeline is not None:
+            return pipeline
+    return None
+
+
+def _logs_dir() -> Path:
+    """项目根目录（或打包后 exe 所在目录）下的 logs 文件夹"""
     if getattr(sys, 'frozen', False):
         # 打包后的 exe
         base_dir = Path(sys.executable).parent
     else:
         # 开发环境
         base_dir = Path(__file__).parent.parent.parent
-    
-    # 创建 logs 目录
     logs_dir = base_dir / "logs"
     logs_dir.mkdir(exist_ok=True)
+    return logs_dir
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    每条记录一行 JSON
+
+    用于性能采样、启动计时等事件：logger.info(msg, extra={"event": 名称, "data": {...}})
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "event": getattr(record, "event", None),
+            "message": record.getMessage(),
+        }
+        entry.update(getattr(record, "data", None) or {})
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _EventFilter(logging.Filter):
+    """只保留带 event 字段的记录"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return getattr(record, "event", None) is not None
+
+
+def setup_logger(name: str = APP_LOGGER_NAME) -> logging.Logger:
+    """
+    设置并返回日志记录器
     
-    # 日志文件名（按日期）
-    log_filename = f"wakeup_{datetime.now().strftime('%Y%m%d')}.log"
-    log_path = logs_dir / log_filename
-    
-    # 创建 logger
+    日志文件保存在项目根目录的 logs 文件夹中
+    自动按日期命名，超过 5MB 自动轮转
+    队列处理器挂在根 logger 上，logging.getLogger(__name__) 的模块日志同样写入文件；
+    根 logger 为 WARNING，只有本应用的 logger 默认输出 DEBUG
+    """
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-    
-    # 避免重复添加 handler
-    if logger.handlers:
+    if _pipeline() is not None:
         return logger
-    
+
+    # 日志文件名（按日期）
+    log_path = _logs_dir() / f"wakeup_{datetime.now().strftime('%Y%m%d')}.log"
+
     # 文件 handler（带轮转，最大 5MB，保留 5 个备份）
     file_handler = RotatingFileHandler(
         log_path,
@@ -55,7 +126,7 @@ def setup_logger(name: str = "WakeUpSchedule") -> logging.Logger:
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
+    handlers = [file_handler]
     
     # 控制台 handler（仅在开发环境显示）
     if not getattr(sys, 'frozen', False):
@@ -63,15 +134,139 @@ def setup_logger(name: str = "WakeUpSchedule") -> logging.Logger:
         console_handler.setLevel(logging.INFO)
         console_format = logging.Formatter('%(levelname)s: %(message)s')
         console_handler.setFormatter(console_format)
-        logger.addHandler(console_handler)
-    
+        handlers.append(console_handler)
+
+    log_queue = queue.SimpleQueue()
+    pipeline = _LogPipeline(log_queue, *handlers)
+    pipeline.start()
+    atexit.register(shutdown_logging)
+
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.wakeup_pipeline = pipeline
+    root = logging.getLogger()
+    root.addHandler(queue_handler)
+    root.setLevel(ROOT_LOG_LEVEL)
+    _set_app_level(logging.DEBUG)
+    logger.setLevel(logging.DEBUG)
     return logger
 
 
+def _set_app_level(level: int):
+    for name in APP_LOGGER_NAMES:
+        logging.getLogger(name).setLevel(level)
+
+
+def _parse_level(value) -> Optional[int]:
+    if isinstance(value, int):
+        return value
+    level = getattr(logging, str(value).strip().upper(), None)
+    return level if isinstance(level, int) else None
+
+
+def configure_logging(level: str = "DEBUG", module_levels: Optional[Dict[str, str]] = None,
+                      json_events: bool = False):
+    """
+    按配置调整日志
+
+    Args:
+        level: 本应用各 logger（APP_LOGGER_NAMES）的级别；根 logger 固定为 WARNING，
+            第三方库的日志不受影响
+        module_levels: 按 logger 名称覆盖级别，如 {"importers": "WARNING", "src.core.ics_feed": "DEBUG"}；
+            名称为模块的 __name__，子模块继承父级设置，也可用于第三方库（如 {"asyncio": "DEBUG"}）
+        json_events: 是否把带 event 字段的记录（性能采样、启动计时）另存为 logs/events_YYYYMMDD.jsonl
+    """
+    setup_logger()
+    pipeline = _pipeline()
+
+    default = _parse_level(level)
+    if default is None:
+        logger.warning(f"无效的日志级别: {level}，使用 DEBUG")
+        default = logging.DEBUG
+    _set_app_level(default)
+    for name, value in (module_levels or {}).items():
+        module_level = _parse_level(value)
+        if module_level is None:
+            logger.warning(f"无效的日志级别: {name}={value}")
+            continue
+        logging.getLogger(name).setLevel(module_level)
+
+    if json_events and pipeline.json_handler is None:
+        json_handler = RotatingFileHandler(
+            _logs_dir() / f"events_{datetime.now().strftime('%Y%m%d')}.jsonl",
+            maxBytes=5 * 1024 * 1024,
+            backupCount=5,
+            encoding='utf-8'
+        )
+        json_handler.setFormatter(JsonLinesFormatter())
+        json_handler.addFilter(_EventFilter())
+        pipeline.json_handler = json_handler
+        pipeline.replace_handlers(pipeline.handlers + (json_handler,))
+    elif not json_events and pipeline.json_handler is not None:
+        json_handler, pipeline.json_handler = pipeline.json_handler, None
+        pipeline.replace_handlers(h for h in pipeline.handlers if h is not json_handler)
+        json_handler.close()
+
+
+def shutdown_logging():
+    """写完队列中剩余的记录并关闭文件（程序退出时自动调用）"""
+    pipeline = _pipeline()
+    if pipeline is None or pipeline.stopped:
+        return
+    pipeline.stopped = True
+    pipeline.stop()
+    for handler in pipeline.handlers:
+        handler.close()
+
+
 # 全局 logger 实例
 logger = setup_logger()
 
 
+class StartupTimer:
+    """
+    启动耗时统计
+
+    设置环境变量 WAKEUP_STARTUP_TIMING=1 后，
+    每个阶段的耗时和累计耗时都会写入日志
+    """
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self._start = time.perf_counter()
+        self._last = self._start
+
+    def mark(self, phase: str):
+        """记录从上一个标记点到现在的耗时"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        elapsed, total = (now - self._last) * 1000, (now - self._start) * 1000
+        logger.info(
+            f"[启动计时] {phase}: {elapsed:.1f} ms (累计 {total:.1f} ms)",
+            extra={"event": "startup_phase",
+                   "data": {"phase": phase, "elapsed_ms": round(elapsed, 3), "total_ms": round(total, 3)}}
+        )
+        self._last = now
+
+    @contextmanager
+    def phase(self, name: str):
+        """统计一个代码块的耗时"""
+        if not self.enabled:
+            yield
+            return
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - begin) * 1000
+            logger.info(f"[启动计时] {name}: {elapsed:.1f} ms",
+                        extra={"event": "startup_phase", "data": {"phase": name, "elapsed_ms": round(elapsed, 3)}})
+            self._last = time.perf_counter()
+
+
+startup_timer = StartupTimer(os.getenv("WAKEUP_STARTUP_TIMING") == "1")
+
+
 def log_exception(exc_type, exc_value, exc_tb):
     """全局异常处理，记录未捕获的异常到日志"""
     if issubclass(exc_type, KeyboardInterrupt):
@@ -0,0 +1,178 @@
+"""
+性能采样工具
+src/utils/profiler.py
+
+为热点路径（课表渲染、导入解析、存储、冲突检测）记录调用次数和耗时分布
+默认关闭，在 Config 中设置 enable_profiling 后生效，
+结果写入 setup_logger 的轮转日志（开启 JSON Lines 事件时同时写入 events_*.jsonl），
+可选导出 cProfile/pstats 文件
+"""
+
+import atexit
+import bisect
+import cProfile
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+try:
+    from .logger import logger
+except ImportError:
+    from utils.logger import logger
+
+# 耗时分布的桶上界 (毫秒)，最后一个桶收集所有更慢的调用
+BUCKET_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000]
+
+
+class HotPathStats:
+    """单个热点路径的统计数据"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, elapsed_ms: float):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.max_ms:
+            self.max_ms = elapsed_ms
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def histogram(self) -> Dict[str, int]:
+        """返回非空桶 {"<=5ms": 3, ">1000ms": 1, ...}"""
+        result = {}
+        for i, n in enumerate(self.buckets):
+            if not n:
+                continue
+            label = f"<={BUCKET_BOUNDS_MS[i]}ms" if i < len(BUCKET_BOUNDS_MS) else f">{BUCKET_BOUNDS_MS[-1]}ms"
+            result[label] = n
+        return result
+
+    def summary(self) -> str:
+        buckets = " ".join(f"{k}:{v}" for k, v in self.histogram().items())
+        return (
+            f"{self.name}: 调用 {self.count} 次, 平均 {self.mean_ms:.2f} ms, "
+            f"最大 {self.max_ms:.2f} ms, 总计 {self.total_ms:.1f} ms | {buckets}"
+        )
+
+
+class Profiler:
+    """
+    热点路径采样器
+
+    关闭时 timed/section 只多一次属性判断，不影响正常使用
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.dump_path = ""
+        self._stats: Dict[str, HotPathStats] = {}
+        self._lock = threading.Lock()
+        self._cprofile: Optional[cProfile.Profile] = None
+        self._atexit_registered = False
+
+    def configure(self, enabled: bool, dump_path: str = ""):
+        """
+        开启或关闭采样
+
+        Args:
+            enabled: 是否记录热点路径
+            dump_path: 非空时同时运行 cProfile，并在 report() 时导出 pstats 文件
+        """
+        self.enabled = enabled
+        self.dump_path = dump_path if enabled else ""
+
+        if self.dump_path and self._cprofile is None:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        elif not self.dump_path and self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile = None
+
+        if enabled and not self._atexit_registered:
+            atexit.register(self.report)
+            self._atexit_registered = True
+
+    def record(self, name: str, elapsed_ms: float):
+        """记录一次调用"""
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = HotPathStats(name)
+            stats.add(elapsed_ms)
+
+    @contextmanager
+    def section(self, name: str):
+        """统计一个代码块的耗时"""
+        if not self.enabled:
+            yield
+            return
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - begin) * 1000)
+
+    def get_stats(self) -> List[HotPathStats]:
+        """按总耗时从高到低返回所有统计"""
+        with self._lock:
+            return sorted(self._stats.values(), key=lambda s: s.total_ms, reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def report(self):
+        """将统计结果写入日志，并导出 cProfile 数据（如已开启）"""
+        stats = self.get_stats()
+        if stats:
+            logger.info(f"[性能] 热点路径统计 ({len(stats)} 项):")
+            for s in stats:
+                logger.info(f"[性能] {s.summary()}", extra={"event": "hot_path", "data": {
+                    "name": s.name, "count": s.count, "mean_ms": round(s.mean_ms, 3),
+                    "max_ms": round(s.max_ms, 3), "total_ms": round(s.total_ms, 3),
+                    "histogram": s.histogram(),
+                }})
+
+        if self._cprofile is not None and self.dump_path:
+            try:
+                self._cprofile.dump_stats(self.dump_path)
+                logger.info(f"[性能] cProfile 数据已导出: {self.dump_path}")
+            except OSError as e:
+                logger.warning(f"[性能] 导出 cProfile 数据失败: {e}")
+
+
+# 全局采样器
+profiler = Profiler()
+
+
+def timed(name: Optional[str] = None) -> Callable:
+    """
+    热点路径装饰器
+
+    Args:
+        name: 统计名称，默认使用函数的限定名 (如 "ScheduleView.update_courses")
+    """
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            begin = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.record(label, (time.perf_counter() - begin) * 1000)
+        return wrapper
+    return decorator
@@ -0,0 +1,96 @@
+"""
+时间工具函数
+src/utils/time_utils.py
+
+周次计算、单双周判断等与日期相关的纯函数
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+
+def parse_semester_start_date(text: str) -> date:
+    """
+    解析配置中的学期开始日期（YYYY-MM-DD）
+
+    Args:
+        text: 日期字符串
+
+    Returns:
+        学期开始日期，格式无效时记录警告并返回今天
+    """
+    try:
+        return datetime.strptime(text, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        logger.warning(f"学期开始日期无效: {text}，使用今天")
+        return date.today()
+
+
+def calculate_week_number(semester_start_date: date, target_date: date) -> int:
+    """
+    计算指定日期是学期的第几周
+
+    Args:
+        semester_start_date: 学期开始日期（第1周的第一天）
+        target_date: 目标日期
+
+    Returns:
+        周次（从1开始），学期开始前返回 0
+    """
+    days = (target_date - semester_start_date).days
+    if days < 0:
+        return 0
+    return days // 7 + 1
+
+
+def is_odd_week(week: int) -> bool:
+    """判断是否为单周"""
+    return week % 2 != 0
+
+
+def is_even_week(week: int) -> bool:
+    """判断是否为双周"""
+    return week % 2 == 0
+
+
+def get_week_start_date(semester_start_date: date, week: int) -> date:
+    """
+    获取指定周次的第一天
+
+    Args:
+        semester_start_date: 学期开始日期
+        week: 周次（从1开始）
+
+    Returns:
+        该周第一天的日期
+    """
+    return semester_start_date + timedelta(weeks=week - 1)
+
+
+def get_week_end_date(semester_start_date: date, week: int) -> date:
+    """
+    获取指定周次的最后一天
+
+    Args:
+        semester_start_date: 学期开始日期
+        week: 周次（从1开始）
+
+    Returns:
+        该周最后一天的日期
+    """
+    return get_week_start_date(semester_start_date, week) + timedelta(days=6)
+
+
+def get_current_week(semester_start_date: date) -> int:
+    """
+    获取今天所在的周次
+
+    Args:
+        semester_start_date: 学期开始日期
+
+    Returns:
+        当前周次
+    """
+    return calculate_week_number(semester_start_date, date.today())
@@ -3,8 +3,11 @@
 src/utils/validators.py
 """
 
+import re
 from typing import Tuple
 
+_HEX_COLOR = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
 def validate_course_name(name: str) -> Tuple[bool, str]:
     if not name or not name.strip():
         return False, "课程名称不能为空"
@@ -36,6 +39,13 @@ def validate_week_range(start: int, end: int) -> Tuple[bool, str]:
         return False, "开始周次不能大于结束周次"
     return True, ""
 
+def validate_color(color: str) -> Tuple[bool, str]:
+    if not color:
+        return False, "颜色不能为空"
+    if not _HEX_COLOR.match(color):
+        return False, "颜色必须是 #RRGGBB 格式的十六进制代码"
+    return True, ""
+
 def validate_note(note: str) -> Tuple[bool, str]:
     if note and len(note) > 200:
         return False, "备注不能超过 200 字"
@@ -0,0 +1,78 @@
+"""
+测试课程颜色分配
+"""
+
+import sys
+import hashlib
+from pathlib import Path
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail, WeekType
+from models.schedule import Schedule
+from core.course_manager import CourseManager
+from utils.color_manager import ColorManager, course_adjacency
+
+
+def _legacy_color(name):
+    """原实现：MD5 十六进制摘要转整数后取模"""
+    index = int(hashlib.md5(name.encode('utf-8')).hexdigest(), 16) % len(ColorManager.PALETTE)
+    return ColorManager.PALETTE[index]
+
+
+def _course(course_id, day, start, step=2, weeks=(1, 16), week_type=WeekType.EVERY_WEEK):
+    base = CourseBase(course_id=course_id, name=course_id, color="")
+    detail = CourseDetail(course_id=course_id, teacher="", location="", day_of_week=day,
+                          start_section=start, step=step, start_week=weeks[0], end_week=weeks[1],
+                          week_type=week_type)
+    return base, detail
+
+
+def test_same_colors_as_before():
+    """缓存后的取色结果与原实现一致，已保存课表的颜色不变"""
+    for name in ["高等数学", "大学英语", "大学物理", "线性代数", "Python 程序设计"]:
+        assert ColorManager.get_color_for_course(name) == _legacy_color(name)
+    assert ColorManager.get_color_for_course("") == ColorManager.DEFAULT_COLOR
+
+
+def test_adjacency_uses_grid_and_weeks():
+    """上下相连、左右相邻且有共同上课周的课程才算相邻"""
+    courses = [
+        _course("A", 1, 1),
+        _course("B", 1, 3),                                   # A 下方
+        _course("C", 2, 2),                                   # A 右侧，节次重叠
+        _course("D", 2, 5),                                   # 与 C 之间隔一节
+        _course("E", 1, 5, week_type=WeekType.ODD_WEEK),      # B 下方，单周
+        _course("F", 1, 7, week_type=WeekType.EVEN_WEEK),     # E 下方，双周
+    ]
+    adjacency = course_adjacency({b.course_id: b.name for b, _ in courses}, [d for _, d in courses])
+    assert adjacency["A"] == {"B", "C"}
+    assert "D" not in adjacency.get("C", set())
+    assert "F" not in adjacency.get("E", set())
+
+
+def test_batch_avoids_adjacent_collisions():
+    """批量分配后相邻课程颜色不同"""
+    courses = [_course(f"课程{day}-{start}", day, start) for day in range(1, 8) for start in range(1, 12, 2)]
+    bases = [b for b, _ in courses]
+    details = [d for _, d in courses]
+
+    colors = ColorManager.assign_colors(bases, details)
+    adjacency = course_adjacency({b.course_id: b.name for b in bases}, details)
+    assert all(colors[name] != colors[other] for name, others in adjacency.items() for other in others)
+
+    plain = ColorManager.assign_colors(bases, details, avoid_adjacent=False)
+    assert plain == {b.name: ColorManager.get_color_for_course(b.name) for b in bases}
+
+
+def test_reassign_colors_uses_palette():
+    """重新分配颜色只使用调色板中的颜色"""
+    courses = [_course("A", 1, 1), _course("B", 1, 3)]
+    schedule = Schedule(course_bases=[b for b, _ in courses], course_details=[d for _, d in courses])
+    ok, _ = CourseManager(schedule).reassign_colors()
+    assert ok
+    a, b = schedule.course_bases
+    assert a.color in ColorManager.PALETTE and b.color in ColorManager.PALETTE
+    assert a.color != b.color
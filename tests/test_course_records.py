@@ -0,0 +1,133 @@
+"""
+测试紧凑课程记录（__slots__、不可变、字符串驻留、按标识哈希）
+"""
+
+import sys
+import dataclasses
+from pathlib import Path
+
+import pytest
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models.course_base import CourseBase
+# CourseDetail 通过 src.models 导入 WeekType，这里使用同一个枚举类
+from models.course_detail import CourseDetail, WeekType
+from models.schedule import Schedule
+from core.course_manager import CourseManager, remove_all
+
+
+def _detail(course_id="math", teacher="张老师", location="A101", day=1, start=1):
+    return CourseDetail(course_id=course_id, teacher=teacher, location=location,
+                        day_of_week=day, start_section=start, step=2,
+                        start_week=1, end_week=16, week_type=WeekType.EVERY_WEEK)
+
+
+def test_records_have_no_instance_dict():
+    """记录使用 __slots__，没有逐实例的 __dict__"""
+    assert not hasattr(_detail(), "__dict__")
+    assert not hasattr(CourseBase("math", "高等数学", "#FF8A80"), "__dict__")
+
+
+def test_course_detail_is_immutable():
+    """CourseDetail 不可修改，需用 dataclasses.replace 生成新对象"""
+    detail = _detail()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        detail.teacher = "李老师"
+
+    moved = dataclasses.replace(detail, location="B202")
+    assert moved.location == "B202"
+    assert detail.location == "A101"
+
+
+def test_repeated_strings_are_interned():
+    """不同来源构造的相同字符串共用同一个对象"""
+    a = _detail(teacher="".join(["张", "老师"]), location="".join(["A", "101"]))
+    b = _detail(teacher="".join(["张", "老", "师"]), location="".join(["A1", "01"]))
+    assert a.teacher is b.teacher
+    assert a.location is b.location
+
+    restored = CourseDetail.from_dict(a.to_dict())
+    assert restored.teacher is a.teacher
+
+
+def test_details_usable_as_dict_and_set_keys():
+    """相同标识字段的课程块哈希一致，可去重"""
+    a = _detail()
+    b = _detail()
+    c = _detail(day=2)
+    assert a == b and hash(a) == hash(b)
+    assert len({a, b, c}) == 2
+    assert {a: "周一"}[b] == "周一"
+
+
+def test_course_base_hash_by_course_id():
+    """CourseBase 按 course_id 哈希，修改颜色不影响在集合中的查找"""
+    base = CourseBase("math", "高等数学", "#FF8A80")
+    bases = {base}
+    base.color = "#80D8FF"
+    assert base in bases
+
+
+def test_to_dict_round_trip():
+    """to_dict/from_dict 往返一致，未知的周类型按每周处理"""
+    detail = dataclasses.replace(_detail(), week_type=WeekType.ODD_WEEK)
+    assert CourseDetail.from_dict(detail.to_dict()) == detail
+
+    data = detail.to_dict()
+    data["week_type"] = "unknown"
+    assert CourseDetail.from_dict(data).week_type == WeekType.EVERY_WEEK
+
+    base = CourseBase("math", "高等数学", "#FF8A80", note="期中考试")
+    assert CourseBase.from_dict(base.to_dict()) == base
+
+
+def test_delete_course_details_in_bulk():
+    """批量删除按集合过滤，返回实际删除的数量"""
+    details = [_detail(day=d, start=s) for d in range(1, 6) for s in (1, 3, 5)]
+    schedule = Schedule(course_bases=[CourseBase("math", "高等数学", "#FF8A80")],
+                        course_details=list(details))
+    manager = CourseManager.__new__(CourseManager)
+    manager.schedule = schedule
+
+    removed = manager.delete_course_details([_detail(day=1), _detail(day=3, start=5), _detail(day=7)])
+    assert removed == 2
+    assert len(schedule.course_details) == len(details) - 2
+
+
+def test_course_base_id_is_frozen():
+    """course_id 是哈希字段，创建后不可修改；更新课程时保留原 ID 生成新对象"""
+    base = CourseBase("math", "高等数学", "#FF8A80")
+    with pytest.raises(AttributeError):
+        base.course_id = "physics"
+    assert base in {base}
+
+    schedule = Schedule(course_bases=[base])
+    manager = CourseManager(schedule)
+    ok, _ = manager.update_course_base("math", CourseBase("other", "数学分析", "#80D8FF"))
+    assert ok
+    assert schedule.course_bases[0].course_id == "math"
+    assert schedule.course_bases[0].name == "数学分析"
+
+
+def test_single_delete_uses_identity_hash():
+    """单个删除与批量删除走同一实现，按标识字段匹配，不存在时报告失败"""
+    details = [_detail(day=1), _detail(day=2), _detail(day=3)]
+    schedule = Schedule(course_details=list(details))
+    manager = CourseManager(schedule)
+
+    ok, _ = manager.delete_course_detail(_detail(day=2))
+    assert ok and schedule.course_details == [details[0], details[2]]
+    version = schedule.version
+    ok, msg = manager.delete_course_detail(_detail(day=2))
+    assert not ok and msg
+    assert schedule.version == version
+
+
+def test_remove_all_with_key():
+    """(CourseBase, CourseDetail) 列表按课程块删除"""
+    base = CourseBase("math", "高等数学", "#FF8A80")
+    courses = [(base, _detail(day=d)) for d in range(1, 5)]
+    assert remove_all(courses, [_detail(day=2), _detail(day=4)], key=lambda c: c[1]) == [courses[0], courses[2]]
+    assert remove_all(courses, []) == courses
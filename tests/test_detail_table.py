@@ -0,0 +1,153 @@
+"""
+测试列式课程详情表
+"""
+
+import sys
+import random
+from pathlib import Path
+
+import pytest
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail, WeekType
+from models.schedule import Schedule
+from core.conflict_detector import ConflictDetector
+from core.course_manager import CourseManager
+from core.detail_table import DetailTable, DetailTableCache, iter_rows, week_mask_of
+from core.schedule_manager import ScheduleManager
+
+
+def _random_details(n, seed=7):
+    rng = random.Random(seed)
+    details = []
+    for i in range(n):
+        start_week = rng.randint(1, 10)
+        details.append(CourseDetail(
+            course_id=f"c{rng.randrange(40)}",
+            teacher=f"教师{rng.randrange(15)}",
+            location=f"教室{rng.randrange(25)}",
+            day_of_week=rng.randint(1, 7),
+            start_section=rng.randint(1, 11),
+            step=rng.choice([1, 2, 2, 3]),
+            start_week=start_week,
+            end_week=rng.randint(start_week, 20),
+            week_type=rng.choice(list(WeekType)),
+        ))
+    return details
+
+
+def test_iter_rows_sparse_and_dense():
+    """稀疏和稠密位图都按从小到大的顺序返回行号"""
+    assert list(iter_rows(0)) == []
+    assert list(iter_rows(0b10110)) == [1, 2, 4]
+    dense = list(range(0, 500, 3))
+    mask = sum(1 << r for r in dense)
+    assert list(iter_rows(mask)) == dense
+
+
+def test_week_mask_matches_is_in_week():
+    """周次位图与 is_in_week 一致"""
+    for detail in _random_details(200):
+        mask = week_mask_of(detail)
+        for week in range(0, 25):
+            assert bool(mask >> week & 1) == detail.is_in_week(week)
+
+
+def test_filter_matches_loop():
+    """组合过滤结果与逐行循环一致，并保持原顺序"""
+    details = _random_details(2000)
+    table = DetailTable(details)
+
+    for day in range(1, 8):
+        for week in (1, 6, 13):
+            expected = [d for d in details if d.day_of_week == day and d.is_in_week(week)]
+            assert table.select(table.filter(day=day, week=week)) == expected
+
+    expected = [d for d in details if d.location == "教室3" and d.teacher == "教师5"]
+    assert table.select(table.filter(location="教室3", teacher="教师5")) == expected
+    assert table.filter(location="不存在的教室") == 0
+
+
+def test_group_count_and_teaching_load():
+    """分组计数与教师总课时"""
+    details = _random_details(1000)
+    table = DetailTable(details)
+
+    expected = {}
+    for d in details:
+        expected[d.location] = expected.get(d.location, 0) + 1
+    assert table.group_count("location") == expected
+
+    tuesday = table.filter(day=2)
+    expected = {}
+    for d in details:
+        if d.day_of_week == 2:
+            expected[d.teacher] = expected.get(d.teacher, 0) + 1
+    assert table.group_count("teacher", tuesday) == expected
+
+    expected = {}
+    for d in details:
+        weeks = sum(1 for w in range(1, 21) if d.is_in_week(w))
+        if weeks:
+            expected[d.teacher] = expected.get(d.teacher, 0) + d.step * weeks
+    assert table.teaching_load() == expected
+
+    with pytest.raises(ValueError):
+        table.group_count("note")
+
+
+def test_conflict_rows_matches_pairwise_check():
+    """冲突位图与逐对比较一致"""
+    details = _random_details(500)
+    table = DetailTable(details)
+    probe = details[0]
+
+    expected = [
+        d for d in details
+        if d.day_of_week == probe.day_of_week
+        and not (d.end_section < probe.start_section or probe.end_section < d.start_section)
+        and week_mask_of(d) & week_mask_of(probe)
+    ]
+    assert table.select(table.conflict_rows(probe)) == expected
+
+
+def test_cache_rebuilds_on_version_change():
+    """版本号变化或列表被替换后重建，删一条再加一条（长度不变）也能发现"""
+    details = _random_details(10)
+    cache = DetailTableCache()
+    first = cache.get(details, 0)
+    assert cache.get(details, 0) is first
+
+    details[0] = _random_details(1, seed=99)[0]
+    second = cache.get(details, 1)
+    assert second is not first and second.details[0] is details[0]
+
+    assert cache.get(list(details), 1) is not second
+    cache.invalidate()
+    assert cache.get(details, 1) is not second
+
+
+def test_managers_see_delete_then_add_with_same_length():
+    """经 CourseManager 删一条再加一条后，查询和冲突检测都不使用旧的详情表"""
+    schedule = Schedule()
+    courses = CourseManager(schedule)
+    courses.add_course_base(CourseBase("c1", "高等数学", "#FF8A80"))
+    courses.add_course_base(CourseBase("c2", "大学英语", "#80D8FF"))
+    old = CourseDetail("c1", "", "", 1, 1, 2, 1, 16, WeekType.EVERY_WEEK)
+    new = CourseDetail("c2", "", "", 3, 1, 2, 1, 16, WeekType.EVERY_WEEK)
+    courses.add_course_detail(old)
+
+    manager = ScheduleManager(schedule)
+    detector = ConflictDetector(schedule)
+    assert len(manager.get_courses_for_day(1, 1)) == 1
+    assert detector.detect_conflicts(CourseDetail("c9", "", "", 1, 1, 1, 1, 1, WeekType.EVERY_WEEK)) == [old]
+
+    courses.delete_course_detail(old)
+    courses.add_course_detail(new)
+    assert len(schedule.course_details) == 1
+    assert manager.get_courses_for_day(1, 1) == []
+    assert [d for _, d in manager.get_courses_for_day(1, 3)] == [new]
+    assert detector.detect_conflicts(CourseDetail("c9", "", "", 1, 1, 1, 1, 1, WeekType.EVERY_WEEK)) == []
@@ -0,0 +1,149 @@
+"""
+测试教务系统框架页面抓取流水线（本地 HTTP 桩服务器）
+"""
+
+import sys
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from importers.frame_fetcher import PortalSession, decode_html, fetch_timetable
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+# 同一层的两个框架必须同时到达，串行抓取时会超时
+_level_barrier = threading.Barrier(2, timeout=5)
+
+PAGES = {
+    "/index.jsp": '<frameset><frame src="nav.jsp"><frame src="jsxsd/main.jsp"></frameset>',
+    "/nav.jsp": "<html>导航栏</html>",
+    "/jsxsd/main.jsp": '<html><iframe id="Frame1" src="xskb/xskb_list.do"></iframe></html>',
+    "/jsxsd/xskb/xskb_list.do": '<html><table id="kbtable">高等数学</table></html>',
+}
+
+
+class _PortalHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = []
+
+    def setup(self):
+        super().setup()
+        _PortalHandler.connections.append(self.client_address)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=()):
+        self.send_response(status)
+        for key, value in headers:
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/login":
+            self._send(302, headers=[("Location", "/index.jsp"), ("Set-Cookie", "JSESSIONID=abc; Path=/")])
+            return
+        if self.path in ("/nav.jsp", "/jsxsd/main.jsp"):
+            _level_barrier.wait()
+        if self.path == "/jsxsd/xskb/xskb_list.do" and "JSESSIONID=abc" not in self.headers.get("Cookie", ""):
+            self._send(403)
+            return
+        if self.path == "/echo-cookie":
+            self._send(200, self.headers.get("Cookie", "").encode("utf-8"))
+            return
+        if self.path == "/gbk.html":
+            self._send(200, "<html>课表</html>".encode("gbk"), [("Content-Type", "text/html; charset=gbk")])
+            return
+        page = PAGES.get(self.path)
+        if page is None:
+            self._send(404)
+        else:
+            self._send(200, page.encode("utf-8"), [("Content-Type", "text/html; charset=utf-8")])
+
+
+def _inspect(html):
+    """不依赖 bs4 的页面检查"""
+    return "kbtable" in html, re.findall(r'src="([^"]+)"', html)
+
+
+@pytest.fixture
+def portal():
+    _PortalHandler.connections = []
+    _level_barrier.reset()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PortalHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_follows_frames_concurrently_with_cookies(portal):
+    """登录重定向后保存 Cookie，同层框架并发抓取，穿透两层找到课表"""
+    page = fetch_timetable(f"{portal}/login", inspect=_inspect)
+    assert page.url == f"{portal}/jsxsd/xskb/xskb_list.do"
+    assert "高等数学" in page.text
+
+
+def test_missing_cookie_fails(portal):
+    """没有登录会话时课表页面返回 403，报告未找到课表"""
+    with pytest.raises(ValueError):
+        fetch_timetable(f"{portal}/index.jsp", inspect=_inspect)
+
+
+def test_configured_cookie_only_sent_to_source_host(portal):
+    """配置的登录 Cookie 只发给配置的主机，同一服务器换个主机名（第三方主机）收不到"""
+    host = portal.split("//", 1)[1]
+    session = PortalSession(cookie="token=secret", cookie_host=host)
+    try:
+        assert session.get(f"{portal}/echo-cookie").text == "token=secret"
+        other = f"http://localhost:{host.rsplit(':', 1)[1]}"
+        assert "secret" not in session.get(f"{other}/echo-cookie").text
+    finally:
+        session.close()
+
+    session = PortalSession(cookie="token=secret")
+    try:
+        assert session.get(f"{portal}/echo-cookie").text == ""
+    finally:
+        session.close()
+
+
+def test_session_reuses_connection(portal):
+    """同一主机的顺序请求复用 keep-alive 连接"""
+    session = PortalSession()
+    try:
+        for _ in range(3):
+            assert session.get(f"{portal}/index.jsp").status == 200
+    finally:
+        session.close()
+    assert len(_PortalHandler.connections) == 1
+
+
+def test_decodes_declared_charset(portal):
+    """按 Content-Type 声明的编码解码"""
+    session = PortalSession()
+    try:
+        assert session.get(f"{portal}/gbk.html").text == "<html>课表</html>"
+    finally:
+        session.close()
+    assert decode_html('<meta charset="gbk">课表'.encode("gbk")).endswith("课表")
+
+
+def test_default_inspector_finds_timetable(portal):
+    """默认检查使用导入器识别课表页面"""
+    pytest.importorskip("bs4")
+    from importers.frame_fetcher import inspect_page
+
+    assert inspect_page((EXAMPLES / "test_usc_sample.html").read_text(encoding="utf-8"))[0]
+    is_timetable, frames = inspect_page(PAGES["/jsxsd/main.jsp"])
+    assert not is_timetable and frames == ["xskb/xskb_list.do"]
@@ -0,0 +1,93 @@
+"""
+测试多课表共同空闲时间查找
+"""
+
+import sys
+import random
+from datetime import date
+from pathlib import Path
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail, WeekType
+from models.schedule import Schedule
+from core.schedule_manager import ScheduleManager
+from core.free_time_finder import FreeTimeFinder
+
+
+def _detail(day, start, step=2, weeks=(1, 4), week_type=WeekType.EVERY_WEEK, course_id="c"):
+    return CourseDetail(course_id=course_id, teacher="", location="",
+                        day_of_week=day, start_section=start, step=step,
+                        start_week=weeks[0], end_week=weeks[1], week_type=week_type)
+
+
+def _brute_force_free(schedules, start_week, end_week, sections):
+    free = []
+    for week in range(start_week, end_week + 1):
+        for day in range(1, 8):
+            for section in range(1, sections + 1):
+                if not any(
+                    d.day_of_week == day and d.start_section <= section <= d.end_section and d.is_in_week(week)
+                    for schedule in schedules for d in schedule.course_details
+                ):
+                    free.append((week, day, section))
+    return free
+
+
+def test_common_free_cells_small_case():
+    """两人课表的共同空闲格子"""
+    finder = FreeTimeFinder(start_week=1, end_week=2, sections_per_day=2)
+    alice = Schedule(course_details=[_detail(1, 1, step=2)])
+    bob = [_detail(2, 2, step=1, week_type=WeekType.EVEN_WEEK)]
+
+    free = finder.find_common_free_cells([alice, bob])
+    assert (1, 1, 1) not in free and (2, 1, 2) not in free
+    assert (1, 2, 2) in free
+    assert (2, 2, 2) not in free
+    assert len(free) == 2 * 7 * 2 - 4 - 1
+
+
+def test_matches_brute_force():
+    """随机课表的结果与逐格检查一致"""
+    rng = random.Random(3)
+    schedules = []
+    for _ in range(6):
+        details = []
+        for _ in range(8):
+            start_week = rng.randint(1, 10)
+            details.append(_detail(
+                day=rng.randint(1, 7), start=rng.randint(1, 11), step=rng.choice([1, 2, 3]),
+                weeks=(start_week, rng.randint(start_week, 18)), week_type=rng.choice(list(WeekType)),
+            ))
+        schedules.append(Schedule(course_details=details))
+
+    finder = FreeTimeFinder(start_week=3, end_week=16, sections_per_day=12)
+    assert finder.find_common_free_cells(schedules) == _brute_force_free(schedules, 3, 16, 12)
+
+
+def test_thread_pool_gives_same_result():
+    """课表较多时使用线程池，结果不变"""
+    rng = random.Random(11)
+    schedules = [
+        [_detail(rng.randint(1, 7), rng.randint(1, 11), step=1, weeks=(1, 20)) for _ in range(3)]
+        for _ in range(80)
+    ]
+    finder = FreeTimeFinder()
+    assert finder.common_free(schedules, max_workers=4) == finder.common_free(schedules)
+
+
+def test_schedule_manager_entry_point():
+    """通过 ScheduleManager 查找与其他课表的共同空闲时间"""
+    schedule = Schedule(
+        course_bases=[CourseBase("c", "高等数学", "#FF8A80")],
+        course_details=[_detail(1, 1, step=12, weeks=(1, 1))],
+        semester_start_date=date(2024, 9, 2),
+    )
+    manager = ScheduleManager(schedule)
+    other = ScheduleManager(Schedule(course_details=[_detail(2, 1, step=12, weeks=(1, 1))]))
+
+    free = manager.find_common_free_time([other], start_week=1, end_week=1)
+    assert all(day not in (1, 2) for _, day, _ in free)
+    assert len(free) == 5 * 12
@@ -0,0 +1,149 @@
+"""
+测试 iCalendar 导出
+"""
+
+import io
+import sys
+import time as time_module
+from datetime import date, datetime, time
+from pathlib import Path
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail, WeekType
+from models.schedule import Schedule
+from models.time_slot import TimeSlot
+from core.ics_exporter import ICSExporter, fold_line, escape_text
+from core.week_calculator import WeekCalculator
+
+# 2024-09-01 是周日
+SEMESTER_START = date(2024, 9, 1)
+SLOTS = [TimeSlot(n, time(7 + n, 0), time(7 + n, 45)) for n in range(1, 13)]
+STAMP = datetime(2024, 8, 1, 12, 0, 0)
+
+
+def _detail(day=1, start=1, step=2, weeks=(1, 16), week_type=WeekType.EVERY_WEEK,
+            course_id="c1", location="A101", teacher="张老师"):
+    return CourseDetail(course_id=course_id, teacher=teacher, location=location,
+                        day_of_week=day, start_section=start, step=step,
+                        start_week=weeks[0], end_week=weeks[1], week_type=week_type)
+
+
+def _export(details, bases=None):
+    bases = bases or [CourseBase("c1", "高等数学", "#FFFFFF")]
+    schedule = Schedule(course_bases=bases, course_details=details, semester_start_date=SEMESTER_START)
+    return ICSExporter(schedule, SLOTS, dtstamp=STAMP).to_string()
+
+
+def _events(text):
+    """按事件拆出未折行的属性字典"""
+    unfolded = text.replace("\r\n ", "")
+    events = []
+    for block in unfolded.split("BEGIN:VEVENT\r\n")[1:]:
+        props = {}
+        for line in block.split("END:VEVENT")[0].split("\r\n"):
+            if line:
+                key, _, value = line.partition(":")
+                props[key] = value
+        events.append(props)
+    return events
+
+
+def test_date_of_with_sunday_start():
+    """学期从周日开始时，第1周的周一是次日"""
+    calc = WeekCalculator(SEMESTER_START)
+    assert calc.date_of(1, 7) == date(2024, 9, 1)
+    assert calc.date_of(1, 1) == date(2024, 9, 2)
+    assert calc.date_of(2, 6) == date(2024, 9, 14)
+    for week in (1, 5, 18):
+        for day in range(1, 8):
+            d = calc.date_of(week, day)
+            assert d.isoweekday() == day
+            assert calc.calculate_week(d) == week
+
+
+def test_weekly_event_uses_single_rrule():
+    """普通课程：一个事件 + 每周重复"""
+    text = _export([_detail(day=1, start=3, step=2, weeks=(1, 16))])
+    events = _events(text)
+    assert len(events) == 1
+    event = events[0]
+    assert event["DTSTART"] == "20240902T100000"
+    assert event["DTEND"] == "20240902T114500"
+    assert event["RRULE"] == "FREQ=WEEKLY;INTERVAL=1;COUNT=16"
+    assert "EXDATE" not in event
+    assert event["SUMMARY"] == "高等数学"
+    assert event["LOCATION"] == "A101"
+    assert text.startswith("BEGIN:VCALENDAR\r\n")
+    assert text.endswith("END:VCALENDAR\r\n")
+
+
+def test_odd_and_even_weeks_use_interval_two():
+    """单双周课程隔周重复"""
+    events = _export([
+        _detail(day=2, weeks=(1, 15), week_type=WeekType.ODD_WEEK),
+        _detail(day=4, weeks=(1, 16), week_type=WeekType.EVEN_WEEK),
+    ])
+    odd, even = _events(events)
+    assert odd["RRULE"] == "FREQ=WEEKLY;INTERVAL=2;COUNT=8"
+    assert odd["DTSTART"].startswith("20240903")
+    assert even["RRULE"] == "FREQ=WEEKLY;INTERVAL=2;COUNT=8"
+    # 第2周周四
+    assert even["DTSTART"].startswith("20240912")
+
+
+def test_split_week_ranges_merge_with_exdate():
+    """同一时间地点的 1-8、11-16 周合并为一个事件，缺的周用 EXDATE"""
+    events = _events(_export([_detail(weeks=(1, 8)), _detail(weeks=(11, 16))]))
+    assert len(events) == 1
+    event = events[0]
+    assert event["RRULE"] == "FREQ=WEEKLY;INTERVAL=1;COUNT=16"
+    assert event["EXDATE"] == "20241028T080000,20241104T080000"
+
+
+def test_different_location_is_separate_event():
+    """地点不同的课程块分别导出，UID 稳定且唯一"""
+    details = [_detail(weeks=(1, 8), location="A101"), _detail(weeks=(9, 16), location="B202")]
+    first = _events(_export(details))
+    second = _events(_export(details))
+    assert len(first) == 2
+    assert first[0]["UID"] != first[1]["UID"]
+    assert [e["UID"] for e in first] == [e["UID"] for e in second]
+
+
+def test_missing_time_slot_is_skipped():
+    """节次超出作息时间的课程块跳过并计数"""
+    bases = [CourseBase("c1", "高等数学", "#FFFFFF")]
+    schedule = Schedule(course_bases=bases, course_details=[_detail(start=12, step=2), _detail()],
+                        semester_start_date=SEMESTER_START)
+    exporter = ICSExporter(schedule, SLOTS, dtstamp=STAMP)
+    assert exporter.write(io.StringIO()) == 1
+    assert exporter.skipped == 1
+
+
+def test_escape_and_fold():
+    """特殊字符转义，长行按 UTF-8 字节折行且不拆开汉字"""
+    assert escape_text("a,b;c\\d\ne") == "a\\,b\\;c\\\\d\\ne"
+    line = "SUMMARY:" + "课程名称" * 20
+    folded = fold_line(line)
+    parts = folded[:-2].split("\r\n ")
+    assert len(parts) > 1
+    assert all(len(p.encode("utf-8")) <= 75 - (i > 0) for i, p in enumerate(parts))
+    assert "".join(parts) == line
+
+
+def test_large_schedule_is_small_and_fast():
+    """整学期课表（每天 5 大节）导出只有几十 KB 且耗时很短"""
+    bases = [CourseBase(f"c{i}", f"课程{i}", "#FFFFFF") for i in range(35)]
+    details = [
+        _detail(day=day, start=1 + 2 * block, weeks=(1, 18), course_id=f"c{(day - 1) * 5 + block}")
+        for day in range(1, 8) for block in range(5)
+    ]
+    begin = time_module.perf_counter()
+    text = _export(details, bases)
+    elapsed = time_module.perf_counter() - begin
+    assert len(_events(text)) == 35
+    assert len(text.encode("utf-8")) < 20 * 1024
+    assert elapsed < 0.5
@@ -0,0 +1,198 @@
+"""
+测试日历订阅源服务（本地 HTTP 客户端请求 asyncio 服务）
+"""
+
+import sys
+import asyncio
+import threading
+import http.client
+import logging
+import socket
+from datetime import date, time, timedelta
+from pathlib import Path
+
+import pytest
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail, WeekType
+from models.schedule import Schedule
+from models.time_slot import TimeSlot
+import core.ics_feed as ics_feed
+from core.ics_feed import ICSFeed, ICSFeedServer
+
+SLOTS = [TimeSlot(n, time(7 + n, 0), time(7 + n, 45)) for n in range(1, 13)]
+
+
+class _Storage:
+    """模拟存储层：修改课程时变化标记加一"""
+
+    def __init__(self):
+        self.version = 1
+        self.location = "A101"
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        detail = CourseDetail(course_id="c1", teacher="张老师", location=self.location,
+                              day_of_week=1, start_section=1, step=2,
+                              start_week=1, end_week=16, week_type=WeekType.EVERY_WEEK)
+        schedule = Schedule(course_bases=[CourseBase("c1", "高等数学", "#FFFFFF")],
+                            course_details=[detail], semester_start_date=date(2024, 9, 1))
+        return schedule, SLOTS
+
+    def change_token(self):
+        return self.version
+
+
+@pytest.fixture
+def feed_server():
+    """在后台事件循环中启动订阅源服务（随机端口）"""
+    storage = _Storage()
+    feed = ICSFeed(storage.load, storage.change_token)
+    server = ICSFeedServer(feed, "127.0.0.1", 0)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result(5)
+    yield server, storage
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+
+def _get(server, path=None, headers=None, method="GET", conn=None):
+    conn = conn or http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+    conn.request(method, path or server.path, headers=headers or {})
+    response = conn.getresponse()
+    return response, response.read()
+
+
+def test_serves_calendar_with_validators(feed_server):
+    """首次请求返回日历内容和 ETag / Last-Modified"""
+    server, storage = feed_server
+    response, body = _get(server)
+    assert response.status == 200
+    assert response.getheader("Content-Type").startswith("text/calendar")
+    assert response.getheader("ETag").startswith('"')
+    assert response.getheader("Last-Modified")
+    assert body.startswith(b"BEGIN:VCALENDAR")
+    assert "高等数学".encode("utf-8") in body
+    assert int(response.getheader("Content-Length")) == len(body)
+
+
+def test_conditional_requests_return_304_without_rebuild(feed_server):
+    """未变化时带条件头请求返回 304，且不重新生成"""
+    server, storage = feed_server
+    response, _ = _get(server)
+    etag, last_modified = response.getheader("ETag"), response.getheader("Last-Modified")
+
+    for headers in ({"If-None-Match": etag}, {"If-None-Match": f"W/{etag}"},
+                    {"If-None-Match": f'"other", {etag}'}, {"If-Modified-Since": last_modified}):
+        response, body = _get(server, headers=headers)
+        assert response.status == 304
+        assert body == b""
+        assert response.getheader("ETag") == etag
+
+    response, _ = _get(server, headers={"If-None-Match": '"stale"'})
+    assert response.status == 200
+    assert server.feed.builds == 1
+    assert storage.loads == 1
+
+
+def test_rebuilds_only_when_storage_changes(feed_server):
+    """存储层报告变化后才重新生成，旧 ETag 失效"""
+    server, storage = feed_server
+    response, _ = _get(server)
+    old_etag = response.getheader("ETag")
+
+    storage.location = "B202"
+    response, _ = _get(server, headers={"If-None-Match": old_etag})
+    assert response.status == 304  # 变化标记未变，不会重新读取
+    assert storage.loads == 1
+
+    storage.version += 1
+    response, body = _get(server, headers={"If-None-Match": old_etag})
+    assert response.status == 200
+    assert response.getheader("ETag") != old_etag
+    assert b"B202" in body
+    assert storage.loads == 2
+
+
+def test_unchanged_content_keeps_etag(feed_server):
+    """变化标记改变但内容相同时 ETag 不变"""
+    server, storage = feed_server
+    response, _ = _get(server)
+    etag = response.getheader("ETag")
+    storage.version += 1
+    response, _ = _get(server, headers={"If-None-Match": etag})
+    assert response.status == 304
+    assert server.feed.builds == 2
+
+
+def test_keep_alive_head_and_errors(feed_server):
+    """同一连接上连续请求；HEAD 无响应体；未知路径与方法"""
+    server, _ = feed_server
+    conn = http.client.HTTPConnection("127.0.0.1", server.port, timeout=5)
+    response, body = _get(server, method="HEAD", conn=conn)
+    assert response.status == 200
+    assert body == b""
+    assert int(response.getheader("Content-Length")) > 0
+
+    response, _ = _get(server, path=server.path + "?token=1", conn=conn)
+    assert response.status == 200
+    response, _ = _get(server, path="/other.ics", conn=conn)
+    assert response.status == 404
+    response, _ = _get(server, method="POST", conn=conn)
+    assert response.status == 405
+    conn.close()
+
+
+def test_identical_data_keeps_validators_across_token_change(monkeypatch):
+    """变化标记改变、时间也过去了，但课表内容相同：正文、ETag 和 Last-Modified 都不变"""
+    storage = _Storage()
+    feed = ICSFeed(storage.load, storage.change_token)
+    first = feed.build(1)
+
+    later = ics_feed._now() + timedelta(hours=1)
+    monkeypatch.setattr(ics_feed, "_now", lambda: later)
+    second = feed.build(2, first)
+    assert (second.body, second.etag, second.last_modified) == (first.body, first.etag, first.last_modified)
+    assert second.token == 2
+
+    storage.location = "B202"
+    third = feed.build(3, second)
+    assert third.etag != first.etag
+    assert third.last_modified == int(later.timestamp())
+    assert later.strftime("DTSTAMP:%Y%m%dT%H%M%SZ").encode() in third.body
+
+
+def test_client_closing_keep_alive_connection_is_not_an_error(feed_server, caplog):
+    """保持连接的客户端请求后直接断开是正常情况，不应记录未处理的异常"""
+    server, _ = feed_server
+    caplog.set_level(logging.ERROR, logger="asyncio")
+    with socket.create_connection(("127.0.0.1", server.port), timeout=5) as sock:
+        sock.sendall(f"GET {server.path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+        assert sock.recv(4096).startswith(b"HTTP/1.1 200")
+    # 服务端读到连接结束后关闭连接，之后新的请求仍能正常处理
+    response, _ = _get(server)
+    assert response.status == 200
+    assert not [r for r in caplog.records if r.name == "asyncio"]
+
+
+def test_read_request_returns_none_on_clean_close():
+    """两个请求之间连接关闭返回 None，请求读到一半被关闭视为错误"""
+    async def read(data):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await ICSFeedServer._read_request(reader)
+
+    assert asyncio.run(read(b"")) is None
+    with pytest.raises(ValueError):
+        asyncio.run(read(b"GET / HTTP/1.1\r\nHost"))
+    method, target, version, headers = asyncio.run(read(b"GET /a HTTP/1.1\r\nHost: x\r\n\r\n"))
+    assert (method, target, headers["host"]) == ("GET", "/a", "x")
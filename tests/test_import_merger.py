@@ -0,0 +1,132 @@
+"""
+测试导入合并引擎
+"""
+
+import sys
+from pathlib import Path
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail, WeekType
+from core.import_merger import merge_courses, fingerprint
+
+
+def _course(course_id, name, day, start, teacher="张三", location="A101",
+            weeks=(1, 16), week_type=WeekType.EVERY_WEEK, color="#FF8A80"):
+    base = CourseBase(course_id=course_id, name=name, color=color)
+    detail = CourseDetail(course_id=course_id, teacher=teacher, location=location, day_of_week=day,
+                          start_section=start, step=2, start_week=weeks[0], end_week=weeks[1],
+                          week_type=week_type)
+    return base, detail
+
+
+def _timetable(prefix):
+    return [
+        _course(f"{prefix}-1", "高等数学", 1, 1),
+        _course(f"{prefix}-2", "大学英语", 2, 3, teacher="李四"),
+        _course(f"{prefix}-3", "大学物理", 3, 5, weeks=(1, 15), week_type=WeekType.ODD_WEEK),
+    ]
+
+
+def test_reimport_same_timetable_is_noop():
+    """重复导入同一份课表（课程ID不同）不产生重复课程块"""
+    existing = _timetable("old")
+    result = merge_courses(existing, _timetable("new"))
+
+    assert not result.has_changes
+    assert len(result.unchanged) == 3
+    assert result.merged == existing
+
+
+def test_fingerprint_compares_actual_weeks():
+    """周次写法不同但实际上课周相同，视为同一课程块"""
+    a = _course("a", "大学物理", 3, 5, weeks=(1, 15), week_type=WeekType.ODD_WEEK)
+    b = _course("b", "大学物理", 3, 5, weeks=(1, 16), week_type=WeekType.ODD_WEEK)
+    assert fingerprint(a) == fingerprint(b)
+
+
+def test_added_changed_removed():
+    """新增、变更、移除分别识别，变更的课程块保留原课程ID和颜色"""
+    existing = _timetable("old")
+    incoming = _timetable("new")
+    incoming[1] = _course("new-2", "大学英语", 2, 3, teacher="李四", location="B202")
+    del incoming[2]
+    incoming.append(_course("new-4", "线性代数", 4, 1))
+    incoming.append(_course("new-5", "高等数学", 5, 1))
+
+    result = merge_courses(existing, incoming, remove_missing=True)
+    assert [c[0].name for c in result.added] == ["线性代数", "高等数学"]
+    assert len(result.changed) == 1 and len(result.unchanged) == 1
+    assert result.removed == [existing[2]]
+
+    old, new = result.changed[0]
+    assert old is existing[1]
+    assert new[0] is existing[1][0] and new[1].course_id == "old-2" and new[1].location == "B202"
+
+    # 同名课程沿用已有的 CourseBase
+    math = result.added[1]
+    assert math[0] is existing[0][0] and math[1].course_id == "old-1"
+
+    assert [c[0].name for c in result.merged] == ["高等数学", "大学英语", "线性代数", "高等数学"]
+
+
+def test_keep_missing_by_default():
+    """默认只增不删，手动添加的课程保留"""
+    existing = _timetable("old") + [_course("manual", "社团活动", 6, 1)]
+    result = merge_courses(existing, _timetable("new"))
+
+    assert not result.has_changes
+    assert result.removed == [existing[3]]
+    assert result.merged == existing
+
+
+def test_duplicates_matched_one_to_one():
+    """重复的课程块按次数匹配"""
+    existing = [_course("a", "高等数学", 1, 1)]
+    incoming = [_course("b", "高等数学", 1, 1), _course("c", "高等数学", 1, 1)]
+    result = merge_courses(existing, incoming)
+    assert len(result.unchanged) == 1 and len(result.added) == 1
+
+
+def test_remove_missing_only_removes_owned_blocks():
+    """同步时只移除上次同步带来的课程块，手动添加的课程即使不在页面中也保留"""
+    synced = _timetable("old")
+    manual = _course("manual", "社团活动", 6, 1)
+    existing = synced + [manual]
+    incoming = _timetable("new")[:2]
+
+    owned = {fingerprint(c) for c in synced}
+    result = merge_courses(existing, incoming, remove_missing=True, removable=owned)
+    assert result.removed == [synced[2]]
+    assert result.merged == [synced[0], synced[1], manual]
+
+    # 还没有同步记录时什么都不删
+    result = merge_courses(existing, incoming, remove_missing=True, removable=set())
+    assert not result.has_changes and result.merged == existing
+
+
+def test_sync_does_not_update_manual_block_in_same_slot():
+    """同一时间位置既有手动课程块又有同步课程块时，同步只更新自己带来的课程块"""
+    manual = _course("manual", "数学", 1, 1, teacher="自习", location="图书馆", weeks=(1, 8))
+    synced = _course("synced", "数学", 1, 1, weeks=(9, 16))
+    incoming = [_course("new", "数学", 1, 1, location="B202", weeks=(9, 16))]
+
+    result = merge_courses([manual, synced], incoming, remove_missing=True,
+                           removable={fingerprint(synced)})
+    assert [old for old, _ in result.changed] == [synced]
+    assert result.changed[0][1][1].location == "B202"
+    assert result.removed == [] and result.added == []
+    assert result.merged[0] == manual
+    assert result.summary() == "新增 0，更新 1，未变 0"
+
+
+def test_duplicate_slots_changed_one_to_one():
+    """同一时间位置的重复课程块按出现顺序逐个更新，多出的为新增"""
+    existing = [_course("a", "高等数学", 1, 1), _course("b", "高等数学", 1, 1, location="A102")]
+    incoming = [_course(f"n{k}", "高等数学", 1, 1, location=f"C{k}") for k in range(3)]
+    result = merge_courses(existing, incoming)
+    assert [old for old, _ in result.changed] == existing
+    assert [new[1].location for _, new in result.changed] == ["C0", "C1"]
+    assert len(result.added) == 1 and result.added[0][1].location == "C2"
@@ -0,0 +1,62 @@
+"""
+测试后台导入流水线（不依赖 PyQt6）
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from importers.base_importer import ImportCancelled
+from importers.import_pipeline import ImportJob, create_importer
+
+TEXT = "\n".join([
+    "周一 1-2节 高等数学 张三 A101 1-16周",
+    "周三 3-4节 大学英语 李四 B202 1-8周(单)",
+    "周五 5-6节 大学物理 王五 C303 9-16周",
+])
+
+
+def test_parse_content_with_progress():
+    """解析内容并报告进度，最后一次进度为完成"""
+    events = []
+    job = ImportJob("Text", content=TEXT, progress=lambda *args: events.append(args))
+    bases, details = job.run()
+
+    assert len(bases) == 3 and len(details) == 3
+    assert events and events[-1][0] == events[-1][1]
+
+
+def test_parse_file_path(tmp_path):
+    """非 Excel 导入器由任务读取文件内容"""
+    path = tmp_path / "schedule.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    bases, _ = ImportJob("Text", file_path=str(path)).run()
+    assert [b.name for b in bases] == ["高等数学", "大学英语", "大学物理"]
+
+
+def test_cancel_before_run():
+    """开始前取消，直接抛出 ImportCancelled"""
+    job = ImportJob("Text", content=TEXT)
+    job.cancel()
+    with pytest.raises(ImportCancelled):
+        job.run()
+
+
+def test_cancel_during_parse():
+    """解析过程中取消，导入器在下一次报告进度时停止"""
+    job = ImportJob("Text", content="\n".join([TEXT] * 100))
+    job.progress = lambda done, total, stage: job.cancel()
+    with pytest.raises(ImportCancelled):
+        job.run()
+
+
+def test_unknown_type():
+    """不支持的类型"""
+    with pytest.raises(ValueError):
+        create_importer("PDF")
+    with pytest.raises(ValueError):
+        ImportJob("Text")
@@ -0,0 +1,38 @@
+"""
+测试后台导入任务
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtWidgets import QApplication
+
+from src.importers.import_pipeline import ImportJob
+from src.ui.import_worker import start_import
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def test_immediate_failure_reaches_callback(app, tmp_path):
+    """读取立即出错的任务在启动前就已连接回调，不会丢失结果"""
+    failed, finished = [], []
+    worker = start_import(ImportJob("Text", file_path=str(tmp_path / "missing.txt")),
+                          lambda bases, details: finished.append(bases), failed.append)
+    QThreadPool.globalInstance().waitForDone()
+    app.processEvents()
+
+    assert worker is not None
+    assert len(failed) == 1 and finished == []
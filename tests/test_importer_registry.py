@@ -0,0 +1,100 @@
+"""
+测试学校导入器注册表
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from importers.base_importer import BaseImporter
+from importers.registry import Fingerprint, ImporterRegistry, scan_page, url_tokens
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+
+def _school(name):
+    class SchoolImporter(BaseImporter):
+        school = name
+
+        def validate(self, content):
+            return True, ""
+
+        def parse(self, content):
+            return [], []
+
+    SchoolImporter.__name__ = f"{name}Importer"
+    return SchoolImporter
+
+
+def _registry(schools=50):
+    registry = ImporterRegistry()
+    registry._modules_loaded = True  # 不加载内置学校模块
+    for i in range(schools):
+        registry.register(_school(f"school{i}"), Fingerprint(
+            table_ids=(f"table{i}",), titles=(f"第{i}大学",), url_patterns=(f"s{i}.edu.cn",),
+        ))
+    registry.register(_school("generic"), Fingerprint(table_ids=("kbtable",)), fallback=True)
+    return registry
+
+
+def test_scan_page_extracts_features():
+    """一次扫描提取 id、class、标题和链接"""
+    html = ('<html><head><title>南华大学课表</title></head><body>'
+            '<iframe src="https://jwxt.usc.edu.cn/jsxsd/xskb/xskb_list.do"></iframe>'
+            '<table ID="kbtable"><td><div class="kbcontent sykb">课程</div></td></table></body></html>')
+    features = scan_page(html)
+    assert "kbtable" in features.ids
+    assert {"kbcontent", "sykb"} <= features.classes
+    assert features.title == "南华大学课表"
+    assert {"usc.edu.cn", "edu.cn", "jsxsd"} <= features.url_tokens
+
+
+def test_url_tokens():
+    assert url_tokens("http://jwxt.usc.edu.cn/jsxsd/") == {
+        "jwxt.usc.edu.cn", "usc.edu.cn", "edu.cn", "cn", "jsxsd"}
+
+
+def test_only_matching_schools_are_candidates():
+    """50 所学校中只有特征命中的导入器和兜底导入器参与完整验证"""
+    registry = _registry()
+    candidates = registry.candidates('<title>第7大学</title><table id="table7"></table>')
+    assert [type(c).school for c in candidates] == ["school7", "generic"]
+
+    candidates = registry.candidates('<table id="kbtable"></table>', url="https://jw.s3.edu.cn/")
+    assert [type(c).school for c in candidates] == ["school3", "generic"]
+
+    assert [type(c).school for c in registry.candidates("<html></html>")] == ["generic"]
+
+
+def test_more_hits_and_priority_win():
+    """命中数多的优先，相同时按优先级"""
+    registry = ImporterRegistry()
+    registry._modules_loaded = True
+    registry.register(_school("generic"), Fingerprint(table_ids=("kbtable",)), fallback=True)
+    registry.register(_school("usc"), Fingerprint(table_ids=("kbtable",), titles=("南华大学",)), priority=-1)
+
+    assert type(registry.candidates('<title>南华大学</title><table id="kbtable">')[0]).school == "usc"
+    assert type(registry.candidates('<table id="kbtable">')[0]).school == "generic"
+
+
+def test_instances_are_cached():
+    registry = _registry(1)
+    first = registry.candidates('<table id="table0">')[0]
+    assert registry.candidates('<table id="table0">')[0] is first
+
+
+def test_builtin_schools_route_usc_sample():
+    """内置注册：南华大学示例页面优先交给 USCImporter"""
+    pytest.importorskip("bs4")
+    from importers.registry import registry
+    from importers.usc_importer import USCImporter
+    from importers.html_importer import HTMLImporter
+
+    html = (EXAMPLES / "test_usc_sample.html").read_text(encoding="utf-8")
+    assert isinstance(registry.candidates(html)[0], USCImporter)
+    bases, details = HTMLImporter().parse(html)
+    assert bases and details
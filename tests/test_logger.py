@@ -0,0 +1,110 @@
+"""
+测试队列日志流水线
+"""
+
+import sys
+import json
+import time
+import logging
+from pathlib import Path
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+import utils.logger as app_logging
+from utils.logger import JsonLinesFormatter, _EventFilter, _pipeline, configure_logging, setup_logger
+
+
+class _SlowHandler(logging.Handler):
+    """模拟很慢的磁盘写入"""
+
+    def __init__(self, delay):
+        super().__init__(logging.DEBUG)
+        self.delay = delay
+        self.messages = []
+
+    def emit(self, record):
+        time.sleep(self.delay)
+        self.messages.append((record.name, record.getMessage()))
+
+
+def test_logging_does_not_block_on_handlers():
+    """日志调用只入队，慢 handler 在后台线程执行；模块 logger 的记录同样送达"""
+    setup_logger()
+    pipeline = _pipeline()
+    original = pipeline.handlers
+    slow = _SlowHandler(0.05)
+    pipeline.replace_handlers(original + (slow,))
+    try:
+        begin = time.perf_counter()
+        for i in range(10):
+            logging.getLogger("importers.sample").debug(f"解析第 {i} 行")
+        assert time.perf_counter() - begin < 0.25
+    finally:
+        pipeline.replace_handlers(original)  # 停止时写完队列中的记录
+    assert slow.messages == [("importers.sample", f"解析第 {i} 行") for i in range(10)]
+
+
+def test_setup_logger_installs_single_pipeline():
+    """重复调用只挂一个队列处理器"""
+    setup_logger()
+    setup_logger("Other")
+    handlers = [h for h in logging.getLogger().handlers if getattr(h, "wakeup_pipeline", None)]
+    assert len(handlers) == 1
+
+
+def test_module_levels_from_config():
+    """按模块设置级别，子模块继承，非法级别被忽略"""
+    try:
+        configure_logging("INFO", {"importers": "WARNING", "core.ics_feed": "debug", "bad": "LOUD"})
+        assert logging.getLogger("importers.qiangzhi_importer").getEffectiveLevel() == logging.WARNING
+        assert logging.getLogger("core.ics_feed").getEffectiveLevel() == logging.DEBUG
+        assert logging.getLogger("core.other").getEffectiveLevel() == logging.INFO
+        assert logging.getLogger("bad").level == logging.NOTSET
+    finally:
+        for name in ("importers", "core.ics_feed"):
+            logging.getLogger(name).setLevel(logging.NOTSET)
+        configure_logging("DEBUG")
+
+
+def test_json_lines_events():
+    """带 event 的记录输出为一行 JSON，附加数据展开为字段"""
+    record = logging.LogRecord("WakeUpSchedule", logging.INFO, __file__, 1, "[性能] 渲染", None, None)
+    record.event = "hot_path"
+    record.data = {"name": "ScheduleView.update_courses", "count": 3}
+    line = JsonLinesFormatter().format(record)
+    entry = json.loads(line)
+    assert "\n" not in line
+    assert entry["event"] == "hot_path"
+    assert entry["count"] == 3
+    assert entry["message"] == "[性能] 渲染"
+
+    plain = logging.LogRecord("x", logging.INFO, __file__, 1, "普通日志", None, None)
+    assert _EventFilter().filter(record)
+    assert not _EventFilter().filter(plain)
+
+
+def test_json_events_handler_toggles(tmp_path, monkeypatch):
+    """开启后事件文件 handler 加入后台线程，关闭后移除"""
+    setup_logger()
+    pipeline = _pipeline()
+    monkeypatch.setattr(app_logging, "_logs_dir", lambda: tmp_path)
+    try:
+        configure_logging(json_events=True)
+        assert pipeline.json_handler in pipeline.handlers
+        assert list(tmp_path.glob("events_*.jsonl"))
+    finally:
+        configure_logging(json_events=False)
+    assert pipeline.json_handler is None
+    assert all(not isinstance(h.formatter, JsonLinesFormatter) for h in pipeline.handlers)
+
+
+def test_third_party_debug_not_enabled():
+    """根 logger 为 WARNING：第三方库的 DEBUG 日志不入队，本应用的 logger 仍可输出 DEBUG"""
+    configure_logging("DEBUG")
+    assert logging.getLogger().level == logging.WARNING
+    assert not logging.getLogger("asyncio").isEnabledFor(logging.DEBUG)
+    assert not logging.getLogger("PIL.PngImagePlugin").isEnabledFor(logging.INFO)
+    assert logging.getLogger("src.importers.qiangzhi_importer").isEnabledFor(logging.DEBUG)
+    assert logging.getLogger("core.ics_feed").isEnabledFor(logging.DEBUG)
+    assert logging.getLogger("WakeUpSchedule").isEnabledFor(logging.DEBUG)
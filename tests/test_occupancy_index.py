@@ -0,0 +1,120 @@
+"""
+测试教室 / 教师占用索引
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models.course_detail import CourseDetail, WeekType
+from core.detail_table import DetailTable
+from core.occupancy_index import OccupancyIndex
+
+
+def _detail(teacher, location, day, start, step=2, weeks=(1, 16), week_type=WeekType.EVERY_WEEK):
+    return CourseDetail(course_id=f"{teacher}-{location}", teacher=teacher, location=location,
+                        day_of_week=day, start_section=start, step=step,
+                        start_week=weeks[0], end_week=weeks[1], week_type=week_type)
+
+
+def _index(details):
+    return OccupancyIndex(DetailTable(details))
+
+
+def test_free_rooms_by_week():
+    """按周次判断教室是否空闲，考虑单双周"""
+    index = _index([
+        _detail("张老师", "A101", day=3, start=3),
+        _detail("李老师", "A102", day=3, start=3, week_type=WeekType.ODD_WEEK),
+        _detail("王老师", "A103", day=3, start=1, weeks=(1, 6)),
+        _detail("赵老师", "A104", day=2, start=3),
+    ])
+
+    assert index.free_rooms(3, 3, 4, 7) == ["A103", "A104"]
+    assert index.free_rooms(3, 3, 4, 8) == ["A102", "A103", "A104"]
+    # 2-3 节与 A103 的 1-2 节重叠（第 6 周以内）
+    assert index.free_rooms(3, 2, 3, 5) == ["A104"]
+
+
+def test_free_teachers_and_unknown_names():
+    """查询空闲教师；不在索引中的候选视为空闲"""
+    index = _index([_detail("张老师", "A101", day=1, start=1)])
+
+    assert index.free_teachers(1, 1, 2, 3) == []
+    assert index.free_teachers(1, 3, 4, 3) == ["张老师"]
+    assert index.free_resources("teacher", 1, 1, 2, 3, candidates=["张老师", "新老师"]) == ["新老师"]
+    assert index.is_free("room", "A101", 1, 2, 2, 17)
+
+    with pytest.raises(ValueError):
+        index.names("building")
+
+
+def test_empty_names_not_indexed():
+    """没有填写教室的课程不会产生名为空字符串的教室"""
+    index = _index([_detail("张老师", "", day=1, start=1)])
+    assert index.names("room") == []
+    assert index.names("teacher") == ["张老师"]
+
+
+def test_earliest_common_free_slot():
+    """多位教师最早的共同空闲时间"""
+    index = _index([
+        _detail("张老师", "A101", day=1, start=1, step=4),
+        _detail("李老师", "A102", day=1, start=5, step=2),
+        _detail("李老师", "A102", day=1, start=7, step=6, weeks=(1, 3)),
+    ])
+
+    # 周一 1-6 节被占满，7-12 节李老师前 3 周有课
+    assert index.earliest_common_free_slot(["张老师", "李老师"], step=2, days=[1]) == (4, 1, 7)
+    # 允许周二时，第 1 周周二第 1 节就空闲
+    assert index.earliest_common_free_slot(["张老师", "李老师"], step=2) == (1, 2, 1)
+    # 从第 17 周开始所有课程都结束了
+    assert index.earliest_common_free_slot(["张老师"], step=4, start_week=17, days=[1]) == (17, 1, 1)
+    assert index.earliest_common_free_slot(["李老师"], step=13, days=[1]) is None
+
+
+def test_out_of_range_queries_rejected():
+    """节次或星期超出范围时报错，而不是读到下一天的格子"""
+    index = _index([_detail("张老师", "A101", day=2, start=1), _detail("李老师", "A102", day=7, start=11)])
+    assert index.sections_per_day == 12
+
+    # 周一 13-14 节会落到周二 1-2 节的格子
+    with pytest.raises(ValueError):
+        index.busy_weeks("room", "A101", 1, 13, 14)
+    with pytest.raises(ValueError):
+        index.free_rooms(7, 11, 13, 1)
+    with pytest.raises(ValueError):
+        index.free_rooms(8, 1, 2, 1)
+    with pytest.raises(ValueError):
+        index.is_free("teacher", "张老师", 1, 0, 1, 1)
+    with pytest.raises(ValueError):
+        index.free_teachers(3, 4, 3, 1)
+    # 未索引的名称同样校验范围
+    with pytest.raises(ValueError):
+        index.busy_weeks("room", "B999", 1, 12, 13)
+
+    assert index.free_rooms(7, 11, 12, 1) == ["A101"]
+
+
+def test_common_free_slot_and_week_rejected_out_of_range():
+    """共同空闲时间的星期、连续节数以及周次超出范围时报错"""
+    index = _index([_detail("张老师", "A101", day=1, start=1)])
+
+    # 星期 0 会通过负下标读到周日的格子，星期 8 会越界
+    with pytest.raises(ValueError):
+        index.earliest_common_free_slot(["张老师"], days=[0])
+    with pytest.raises(ValueError):
+        index.earliest_common_free_slot(["张老师"], days=[8])
+    # step=0 时不检查任何格子，会把有课的第 1 节当作空闲
+    with pytest.raises(ValueError):
+        index.earliest_common_free_slot(["张老师"], step=0, days=[1])
+    with pytest.raises(ValueError):
+        index.is_free("room", "A101", 1, 1, 2, -1)
+    with pytest.raises(ValueError):
+        index.free_rooms(1, 1, 2, 0)
+
+    assert index.earliest_common_free_slot(["张老师"], step=1, days=[1]) == (1, 1, 3)
@@ -0,0 +1,113 @@
+"""
+测试教务系统课表定时同步（本地 HTTP 服务器提供 examples/ 中的示例页面）
+"""
+
+import sys
+import os
+import hashlib
+import functools
+import threading
+from http.server import HTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from importers.portal_sync import SyncJob, SyncState
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+SAMPLE = "test_usc_sample.html"
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def portal():
+    """在随机端口上提供 examples/ 目录"""
+    handler = functools.partial(_QuietHandler, directory=str(EXAMPLES))
+    server = HTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_url_then_not_modified(portal):
+    """第二次请求带上 If-Modified-Since，服务器返回 304 时跳过"""
+    state = SyncState()
+    job = SyncJob(f"{portal}/{SAMPLE}", state)
+    content, new_state = job.fetch()
+    assert content == (EXAMPLES / SAMPLE).read_text(encoding="utf-8")
+    assert new_state.last_modified
+
+    job._commit(new_state)
+    assert SyncJob(f"{portal}/{SAMPLE}", state).fetch() is None
+
+
+def test_fetch_url_error(portal):
+    """页面不存在时报错"""
+    with pytest.raises(ValueError):
+        SyncJob(f"{portal}/missing.html", SyncState()).fetch()
+
+
+def test_drop_folder_picks_latest(tmp_path):
+    """投放目录中取最新的页面，未变化时跳过"""
+    old = tmp_path / "old.html"
+    new = tmp_path / "new.htm"
+    old.write_text("<html>old</html>", encoding="utf-8")
+    new.write_text("<html>new</html>", encoding="utf-8")
+    os.utime(old, ns=(1_000_000_000, 1_000_000_000))
+    (tmp_path / "notes.txt").write_text("ignored", encoding="utf-8")
+
+    state = SyncState()
+    content, new_state = SyncJob(str(tmp_path), state).fetch()
+    assert content == "<html>new</html>"
+
+    SyncJob(str(tmp_path), state)._commit(new_state)
+    assert SyncJob(str(tmp_path), state).fetch() is None
+
+
+def test_same_content_skips_parse(tmp_path):
+    """页面重新保存但内容相同，不重新解析"""
+    page = tmp_path / "schedule.html"
+    page.write_text("<html>课表</html>", encoding="utf-8")
+    state = SyncState()
+    _, new_state = SyncJob(str(page), state).fetch()
+    new_state.digest = hashlib.sha256("<html>课表</html>".encode("utf-8")).hexdigest()
+    SyncJob(str(page), state)._commit(new_state)
+
+    page.write_text("<html>课表</html>", encoding="utf-8")
+    state.mtime_ns = 0
+    job = SyncJob(str(page), state)
+    assert job.run() == ([], [])
+    assert job.unchanged
+
+
+def test_sync_parses_sample_page(portal):
+    """完整同步：获取示例页面并解析，第二次同步时不再解析"""
+    pytest.importorskip("bs4")
+    state = SyncState()
+    bases, details = SyncJob(f"{portal}/{SAMPLE}", state).run()
+    assert bases and details and state.digest
+
+    job = SyncJob(f"{portal}/{SAMPLE}", state)
+    assert job.run() == ([], []) and job.unchanged
+
+
+def test_sync_state_round_trip(tmp_path):
+    """同步状态（含上次同步的课程块指纹）保存后重新读取；更换来源时从空状态开始"""
+    path = tmp_path / "sync_state.json"
+    state = SyncState(etag='"abc"', digest="d", source="http://portal/kb.html",
+                      fingerprints=[("高等数学", 1, 1, 2, 0b110, "A101", "张三")])
+    state.save(path)
+
+    loaded = SyncState.load("http://portal/kb.html", path)
+    assert loaded == state
+    assert SyncState.load("http://other/kb.html", path) == SyncState(source="http://other/kb.html")
+    assert SyncState.load("x", tmp_path / "missing.json") == SyncState(source="x")
@@ -0,0 +1,74 @@
+"""
+测试热点路径性能采样工具
+"""
+
+import sys
+from pathlib import Path
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from utils.profiler import Profiler, HotPathStats, profiler, timed
+
+
+def test_timed_disabled_records_nothing():
+    """关闭时装饰器不记录任何数据，返回值不变"""
+    profiler.configure(False)
+    profiler.reset()
+
+    @timed()
+    def add(a, b):
+        return a + b
+
+    assert add(1, 2) == 3
+    assert profiler.get_stats() == []
+
+
+def test_timed_enabled_counts_calls():
+    """开启后按限定名记录调用次数"""
+    profiler.configure(True)
+    profiler.reset()
+    try:
+        @timed("测试.加法")
+        def add(a, b):
+            return a + b
+
+        for i in range(5):
+            add(i, i)
+
+        stats = profiler.get_stats()
+        assert len(stats) == 1
+        assert stats[0].name == "测试.加法"
+        assert stats[0].count == 5
+    finally:
+        profiler.configure(False)
+        profiler.reset()
+
+
+def test_histogram_buckets():
+    """耗时按桶统计，超出最大上界的计入最后一个桶"""
+    stats = HotPathStats("render")
+    stats.add(0.5)
+    stats.add(4.0)
+    stats.add(4.5)
+    stats.add(3000.0)
+
+    assert stats.count == 4
+    assert stats.max_ms == 3000.0
+    assert stats.histogram() == {"<=1ms": 1, "<=5ms": 2, ">1000ms": 1}
+
+
+def test_section_context_manager():
+    """section 统计代码块耗时，异常时也会记录"""
+    p = Profiler()
+    p.enabled = True
+
+    with p.section("block"):
+        pass
+    try:
+        with p.section("block"):
+            raise ValueError("boom")
+    except ValueError:
+        pass
+
+    assert p.get_stats()[0].count == 2
@@ -0,0 +1,68 @@
+"""
+测试强智导入器的布局侦测不修改共享实例，可并发解析不同布局的页面
+"""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("bs4")
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from importers.qiangzhi_importer import QiangZhiImporter
+from importers.usc_importer import USCImporter
+
+EXAMPLES = Path(__file__).parent.parent / "examples"
+
+CELL = ('<td><div class="kbcontent">{name}<br><font title="老师">张三</font><br>'
+        '<font title="周次(节次)">1-16(周)[01-02节]</font><br><font title="教室">A101</font></div></td>')
+
+
+def _page(headers, courses):
+    """courses: 列下标 -> 课程名"""
+    header = "".join(f"<th>{h}</th>" for h in headers)
+    cells = "".join(CELL.format(name=courses[i]) if i in courses else "<td></td>" for i in range(len(headers)))
+    return f'<html><body><table id="kbtable"><tr>{header}</tr><tr>{cells}</tr></table></body></html>'
+
+
+# 通用布局：星期一开头，没有节次列
+GENERIC = _page(["星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日"],
+                {0: "高等数学", 6: "体育"})
+# 南华布局：节次列 + 星期日开头
+SUNDAY_FIRST = _page(["节次", "星期日", "星期一", "星期二", "星期三", "星期四", "星期五", "星期六"],
+                     {1: "体育", 2: "高等数学"})
+
+
+def _days(result):
+    bases, details = result
+    names = {b.course_id: b.name for b in bases}
+    return sorted((names[d.course_id], d.day_of_week) for d in details)
+
+
+def test_layout_does_not_leak_between_documents():
+    """先后解析不同布局的页面，结果互不影响，实例属性不变"""
+    importer = QiangZhiImporter()
+    assert _days(importer.parse(SUNDAY_FIRST)) == [("体育", 7), ("高等数学", 1)]
+    assert _days(importer.parse(GENERIC)) == [("体育", 7), ("高等数学", 1)]
+    assert importer.sunday_first is False and importer.first_col_is_header is False
+
+
+def test_concurrent_parse_on_shared_instance():
+    """同一个实例在线程池中并发解析南华和通用布局"""
+    importer = USCImporter()
+    usc_sample = (EXAMPLES / "test_usc_sample.html").read_text(encoding="utf-8")
+    expected_sample = _days(USCImporter().parse(usc_sample))
+
+    pages = [GENERIC, SUNDAY_FIRST, usc_sample] * 20
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(importer.parse, pages))
+
+    for page, result in zip(pages, results):
+        if page is usc_sample:
+            assert _days(result) == expected_sample
+        else:
+            assert _days(result) == [("体育", 7), ("高等数学", 1)]
@@ -0,0 +1,94 @@
+"""
+测试无界面提醒守护进程
+"""
+
+import sys
+from pathlib import Path
+from datetime import date, datetime, time, timedelta
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail
+from models.schedule import Schedule
+from models.time_slot import TimeSlot
+from models.week_type import WeekType
+from core.schedule_manager import ScheduleManager
+from core.reminder_daemon import ReminderDaemon, build_daily_agenda
+
+
+def _make_manager():
+    """构造一个学期从 2024-09-02（周一）开始的课表"""
+    schedule = Schedule(semester_start_date=date(2024, 9, 2))
+    math = CourseBase(course_id="math", name="高等数学", color="#FF8A80")
+    physics = CourseBase(course_id="physics", name="大学物理", color="#80D8FF")
+    schedule.course_bases.extend([math, physics])
+    schedule.course_details.extend([
+        CourseDetail(course_id="physics", teacher="李老师", location="B202",
+                     day_of_week=1, start_section=3, step=2,
+                     start_week=1, end_week=16, week_type=WeekType.EVERY_WEEK),
+        CourseDetail(course_id="math", teacher="张老师", location="A101",
+                     day_of_week=1, start_section=1, step=2,
+                     start_week=1, end_week=16, week_type=WeekType.ODD_WEEK),
+    ])
+    return ScheduleManager(schedule)
+
+
+def test_build_daily_agenda_sorted():
+    """测试日程按提醒时刻排序"""
+    manager = _make_manager()
+    slots = TimeSlot.generate_default_time_slots()
+
+    # 2024-09-02 是第1周周一（单周），两门课都有
+    agenda = build_daily_agenda(manager, slots, 15, date(2024, 9, 2))
+
+    assert [item.base.name for item in agenda] == ["高等数学", "大学物理"]
+    assert agenda[0].start_at == datetime(2024, 9, 2, 8, 0)
+    assert agenda[0].remind_at == datetime(2024, 9, 2, 7, 45)
+
+
+def test_build_daily_agenda_week_type():
+    """测试双周不包含单周课程"""
+    manager = _make_manager()
+    slots = TimeSlot.generate_default_time_slots()
+
+    # 2024-09-09 是第2周周一（双周）
+    agenda = build_daily_agenda(manager, slots, 15, date(2024, 9, 9))
+
+    assert [item.base.name for item in agenda] == ["大学物理"]
+
+
+def test_daemon_sleeps_until_each_reminder():
+    """测试守护进程只在提醒时刻醒来并发送通知"""
+    manager = _make_manager()
+    slots = TimeSlot.generate_default_time_slots()
+    clock = [datetime(2024, 9, 2, 7, 0)]
+    notifications = []
+
+    def fake_sleep(seconds):
+        clock[0] += timedelta(seconds=seconds)
+
+    daemon = ReminderDaemon(
+        manager, slots, remind_minutes=15,
+        notifier=lambda title, msg: notifications.append((clock[0].time(), title)),
+        now_func=lambda: clock[0],
+        sleep_func=fake_sleep
+    )
+    daemon.run(max_days=1)
+
+    assert notifications == [
+        (time(7, 45), "课程提醒: 高等数学"),
+        (time(9, 45), "课程提醒: 大学物理"),
+    ]
+
+
+def test_daemon_skips_started_courses():
+    """测试已开始的课程不再提醒"""
+    manager = _make_manager()
+    slots = TimeSlot.generate_default_time_slots()
+    daemon = ReminderDaemon(manager, slots, remind_minutes=15)
+
+    pending = daemon.pending_items(datetime(2024, 9, 2, 9, 0))
+
+    assert [item.base.name for item in pending] == ["大学物理"]
@@ -0,0 +1,84 @@
+"""
+测试课表离屏渲染
+"""
+
+import os
+import sys
+from datetime import date, time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from PyQt6.QtGui import QColor, QImage
+from PyQt6.QtWidgets import QApplication
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail, WeekType
+from models.time_slot import TimeSlot
+from core.semester_grid import SemesterGrid
+from src.ui.schedule_renderer import RenderOptions, ScheduleRenderer
+
+SLOTS = [TimeSlot(n, time(7 + n, 0), time(7 + n, 45)) for n in range(1, 13)]
+OPTIONS = RenderOptions(width=800, height=600, course_opacity=1.0)
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def _course(name, day, start, color, week_type=WeekType.EVERY_WEEK):
+    base = CourseBase(course_id=name, name=name, color=color)
+    detail = CourseDetail(course_id=name, teacher="李老师", location="A101", day_of_week=day,
+                          start_section=start, step=2, start_week=1, end_week=16, week_type=week_type)
+    return base, detail
+
+
+def _grid():
+    return SemesterGrid([_course("数学", 1, 1, "#FF8A80"),
+                         _course("物理", 3, 5, "#82B1FF", week_type=WeekType.ODD_WEEK)])
+
+
+def _card_pixel(image, day, section):
+    """课程卡片左上区域的一个像素（避开居中的文字）"""
+    col_width = (OPTIONS.width - OPTIONS.time_column_width) / 7
+    row_height = (OPTIONS.height - OPTIONS.title_height - OPTIONS.header_height) / len(SLOTS)
+    x = OPTIONS.time_column_width + (day - 1) * col_width + 8
+    y = OPTIONS.title_height + OPTIONS.header_height + (section - 1) * row_height + 8
+    return image.pixelColor(int(x), int(y))
+
+
+def test_render_weeks_in_parallel(app):
+    """多周并行渲染按顺序返回，尺寸正确且画出了课程卡片"""
+    renderer = ScheduleRenderer(SLOTS, date(2026, 9, 7), OPTIONS)
+    week1, week2 = renderer.render_weeks(_grid(), [1, 2], max_workers=2)
+
+    for image in (week1, week2):
+        assert (image.width(), image.height()) == (800, 600)
+        assert _card_pixel(image, 1, 1) == QColor("#FF8A80")
+    # 单周课程只出现在第 1 周
+    assert _card_pixel(week1, 3, 5) == QColor("#82B1FF")
+    assert _card_pixel(week2, 3, 5) == QColor("white")
+
+
+def test_export_pdf_and_image(app, tmp_path):
+    """导出 PDF 返回页数并写出文件，导出图片可重新读入"""
+    renderer = ScheduleRenderer(SLOTS, date(2026, 9, 7), OPTIONS)
+    grid = _grid()
+
+    pdf = tmp_path / "课表.pdf"
+    assert renderer.export_pdf(str(pdf), grid, [1, 2, 3]) == 3
+    assert pdf.read_bytes().startswith(b"%PDF")
+    assert renderer.export_pdf(str(tmp_path / "空.pdf"), grid, []) == 0
+
+    png = tmp_path / "第1周.png"
+    assert renderer.export_image(str(png), grid, 1)
+    image = QImage(str(png))
+    assert (image.width(), image.height()) == (800, 600)
+    assert _card_pixel(image, 1, 1) == QColor("#FF8A80")
@@ -0,0 +1,95 @@
+"""
+测试模型/委托课表视图的数据模型
+"""
+
+import os
+import sys
+from datetime import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail, WeekType
+from models.time_slot import TimeSlot
+from src.ui.schedule_table_view import CourseRole, ScheduleTableModel, ScheduleTableView
+
+SLOTS = [TimeSlot(n, time(7 + n, 0), time(7 + n, 45)) for n in range(1, 13)]
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def _course(name, day, start, step=2):
+    base = CourseBase(course_id=name, name=name, color="#FF8A80")
+    detail = CourseDetail(course_id=name, teacher="李老师", location="A101", day_of_week=day,
+                          start_section=start, step=step, start_week=1, end_week=16,
+                          week_type=WeekType.EVERY_WEEK)
+    return base, detail
+
+
+def test_model_exposes_cards_and_spans(app):
+    """卡片只在左上角格子返回数据，跨节格子可查到覆盖的卡片，视图设置了 span"""
+    view = ScheduleTableView(SLOTS)
+    view.update_courses([_course("数学", 2, 3, step=3)])
+    model = view.model()
+
+    assert model.rowCount() == 12 and model.columnCount() == 8
+    card = model.data(model.index(2, 2), CourseRole)
+    assert card.base.name == "数学"
+    assert model.data(model.index(3, 2), CourseRole) is None
+    assert model.card_at(4, 2) is card
+    assert view.rowSpan(2, 2) == 3
+    assert view.cell_courses == {(2, 2): (card.base, card.detail)}
+    assert model.data(model.index(0, 0)) == "1\n08:00\n08:45"
+
+
+def test_clicks_emit_course_or_empty_cell(app):
+    """点击卡片发出 course_clicked，点击空格子发出 empty_cell_clicked(星期, 节次)"""
+    view = ScheduleTableView(SLOTS)
+    view.update_courses([_course("英语", 1, 1)])
+    clicked, empty = [], []
+    view.course_clicked.connect(lambda base, detail: clicked.append(base.name))
+    view.empty_cell_clicked.connect(lambda day, section: empty.append((day, section)))
+
+    model = view.model()
+    view._on_index_clicked(model.index(1, 1))
+    view._on_index_clicked(model.index(5, 3))
+    view._on_index_clicked(model.index(5, 0))
+    assert clicked == ["英语"]
+    assert empty == [(3, 6)]
+
+
+def test_header_data(app):
+    """表头文字与今天所在列的字体"""
+    model = ScheduleTableModel(SLOTS)
+    model.set_header(["9\n月"] + [f"周{i}" for i in range(1, 8)], today_column=3)
+    assert model.headerData(1, Qt.Orientation.Horizontal) == "周1"
+    assert model.headerData(3, Qt.Orientation.Horizontal, Qt.ItemDataRole.FontRole).bold()
+    assert not model.headerData(4, Qt.Orientation.Horizontal, Qt.ItemDataRole.FontRole).bold()
+
+
+def test_grid_rebuilds_after_courses_changed(app):
+    """原地修改课程（数量不变）后标记变化，学期网格随之重建"""
+    view = ScheduleTableView(SLOTS)
+    courses = [_course("数学", 1, 1)]
+    view.update_courses(courses)
+    grid = view.get_semester_grid(courses)
+
+    courses[0] = _course("数学", 4, 5)
+    assert view.get_semester_grid(courses) is grid
+    view.mark_courses_changed()
+    view.update_courses(courses)
+    assert view.get_semester_grid(courses) is not grid
+    assert set(view.cell_courses) == {(4, 4)}
@@ -0,0 +1,88 @@
+"""
+测试课表视图的表头原地更新
+"""
+
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication, QTableWidget, QTableWidgetItem
+
+from core.week_layout import WeekHeaderLabels
+from src.ui.schedule_view import HeaderRenderer
+
+START = date(2026, 9, 7)  # 周一
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def _header_items(table):
+    return [table.horizontalHeaderItem(col) for col in range(8)]
+
+
+def _highlighted(items):
+    return [col for col in range(1, 8) if items[col].font().bold()]
+
+
+def test_switch_week_updates_items_in_place(app):
+    """切换周次时表头项不重建，只改文字并移动“今天”的高亮"""
+    table = QTableWidget(12, 8)
+    header = HeaderRenderer(table, START)
+    labels = WeekHeaderLabels(START)
+    wednesday = date(2026, 9, 9)
+
+    header.update(1, wednesday)
+    items = _header_items(table)
+    assert [item.text() for item in items[1:]] == list(labels.texts(1))
+    assert items[0].text() == "9\n月"
+    assert _highlighted(items) == [3]
+    assert items[3].foreground().color() == QColor("#2d8cf0")
+
+    # 第 2 周不包含今天：同一批表头项，文字更新，高亮取消
+    header.update(2, wednesday)
+    assert all(a is b for a, b in zip(_header_items(table), items))
+    assert [item.text() for item in items[1:]] == list(labels.texts(2))
+    assert _highlighted(items) == []
+    assert items[3].foreground().color() == QColor("#5f6368")
+
+    # 回到第 1 周，今天变为周五：高亮移到第 5 列
+    header.update(1, date(2026, 9, 11))
+    assert all(a is b for a, b in zip(_header_items(table), items))
+    assert [item.text() for item in items[1:]] == list(labels.texts(1))
+    assert _highlighted(items) == [5]
+
+
+def test_items_rewritten_or_recreated_after_external_changes(app):
+    """表头文字被 setHorizontalHeaderLabels 改写后重写；表头项被替换后重新创建"""
+    table = QTableWidget(12, 8)
+    header = HeaderRenderer(table, START)
+    texts = list(WeekHeaderLabels(START).texts(1))
+    header.update(1, date(2026, 9, 9))
+    old = _header_items(table)
+
+    table.setHorizontalHeaderLabels([""] * 8)
+    header.update(1, date(2026, 9, 9))
+    assert all(a is b for a, b in zip(_header_items(table), old))
+    assert [item.text() for item in old[1:]] == texts
+    assert old[0].text() == "9\n月"
+
+    table.setHorizontalHeaderItem(4, QTableWidgetItem("周四"))
+    header.update(1, date(2026, 9, 9))
+    items = _header_items(table)
+    assert not any(a is b for a, b in zip(items, old))
+    assert [item.text() for item in items[1:]] == texts
+    assert items[0].text() == "9\n月"
+    assert _highlighted(items) == [3]
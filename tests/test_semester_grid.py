@@ -0,0 +1,94 @@
+"""
+测试学期课表物化视图
+"""
+
+import sys
+import random
+from pathlib import Path
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail, WeekType
+from core.semester_grid import SemesterGrid, SemesterGridCache
+
+
+def _course(name, day, start, step=2, weeks=(1, 16), week_type=WeekType.EVERY_WEEK):
+    base = CourseBase(course_id=name, name=name, color="#FF8A80")
+    detail = CourseDetail(course_id=name, teacher="", location="", day_of_week=day,
+                          start_section=start, step=step, start_week=weeks[0],
+                          end_week=weeks[1], week_type=week_type)
+    return base, detail
+
+
+def _legacy_placements(courses, week):
+    """原 ScheduleView.update_courses 的逐门课程判断逻辑"""
+    course_grid = {}
+    for base, detail in courses:
+        if not detail.is_in_week(week):
+            continue
+        for section in range(detail.start_section, detail.end_section + 1):
+            course_grid.setdefault((detail.day_of_week, section), []).append((base, detail))
+    placed = []
+    for (day, section), course_list in course_grid.items():
+        base, detail = course_list[0]
+        if section == detail.start_section:
+            placed.append((base, detail))
+    return placed
+
+
+def test_placements_match_legacy_rendering():
+    """每周绘制的课程块与原逻辑一致（包括冲突时的取舍）"""
+    rng = random.Random(5)
+    courses = []
+    for i in range(120):
+        start_week = rng.randint(1, 8)
+        courses.append(_course(
+            f"课程{i}", day=rng.randint(1, 7), start=rng.randint(1, 11), step=rng.choice([1, 2, 3]),
+            weeks=(start_week, rng.randint(start_week, 18)), week_type=rng.choice(list(WeekType)),
+        ))
+    grid = SemesterGrid(courses)
+
+    key = lambda c: (c[1].day_of_week, c[1].start_section, c[0].name)
+    for week in range(0, 21):
+        assert sorted(grid.placements(week), key=key) == sorted(_legacy_placements(courses, week), key=key)
+
+
+def test_lookup_by_week_and_day():
+    """按周、按天查询，以及单双周"""
+    math = _course("高等数学", day=1, start=3)
+    physics = _course("大学物理", day=1, start=1, week_type=WeekType.ODD_WEEK)
+    english = _course("大学英语", day=2, start=1, weeks=(1, 8))
+    grid = SemesterGrid([math, physics, english])
+
+    assert grid.courses_for_day(1, 1) == [physics, math]
+    assert grid.courses_for_day(2, 1) == [math]
+    assert grid.courses_for_week(10) == [math]
+    assert grid.courses_for_week(17) == []
+    assert grid.occupant(3, 1, 2) == physics
+    assert grid.occupant(4, 1, 2) is None
+    assert grid.is_free(4, 1, 1, 2) and not grid.is_free(4, 1, 1, 3)
+
+
+def test_grid_size_is_fixed():
+    """网格大小只与周数和节数有关"""
+    courses = [_course(f"课程{i}", day=i % 7 + 1, start=1, weeks=(1, 20)) for i in range(500)]
+    grid = SemesterGrid(courses)
+    assert len(grid.cells) == 20 * 7 * 12
+
+
+def test_cache_rebuilds_on_version_change():
+    """课程列表替换或版本号变化后重建；原地修改课程（数量不变）也能发现"""
+    cache = SemesterGridCache()
+    courses = [_course("高等数学", day=1, start=1)]
+    first = cache.get(courses, 0)
+    assert cache.get(courses, 0) is first
+
+    courses[0] = _course("高等数学", day=3, start=5)
+    second = cache.get(courses, 1)
+    assert second is not first
+    assert [d.day_of_week for _, d in second.courses_for_week(1)] == [3]
+
+    courses.append(_course("大学物理", day=2, start=1))
+    assert len(cache.get(courses, 2).courses_for_week(1)) == 2
@@ -0,0 +1,79 @@
+"""
+测试表格 rowspan/colspan 展开
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from importers.table_grid import cell_span, normalize_grid
+
+
+def _cols(grid):
+    return [[(col, cell["text"]) for col, cell in placed] for placed in grid]
+
+
+def test_plain_table_keeps_indices():
+    rows = [[{"text": "a"}, {"text": "b"}], [{"text": "c"}, {"text": "d"}]]
+    assert _cols(normalize_grid(rows)) == [[(0, "a"), (1, "b")], [(0, "c"), (1, "d")]]
+
+
+def test_rowspan_shifts_following_rows():
+    """上方的 rowspan 覆盖的列被跳过，后面的单元格落在真实列上"""
+    rows = [
+        [{"text": "节次", "rowspan": "2"}, {"text": "一"}, {"text": "实验", "rowspan": "2"}, {"text": "三"}],
+        [{"text": "二"}, {"text": "四"}],
+        [{"text": "3"}, {"text": "一"}, {"text": "二"}, {"text": "三"}],
+    ]
+    assert _cols(normalize_grid(rows)) == [
+        [(0, "节次"), (1, "一"), (2, "实验"), (3, "三")],
+        [(1, "二"), (3, "四")],
+        [(0, "3"), (1, "一"), (2, "二"), (3, "三")],
+    ]
+
+
+def test_colspan_and_block_span():
+    """colspan 与同时跨行跨列的单元格"""
+    rows = [
+        [{"text": "表头", "colspan": "2"}, {"text": "周一"}],
+        [{"text": "大块", "colspan": "2", "rowspan": "2"}, {"text": "x"}],
+        [{"text": "y"}],
+    ]
+    assert _cols(normalize_grid(rows)) == [
+        [(0, "表头"), (2, "周一")],
+        [(0, "大块"), (2, "x")],
+        [(2, "y")],
+    ]
+
+
+def test_invalid_span_values():
+    assert cell_span({"rowspan": "abc"}, "rowspan") == 1
+    assert cell_span({"colspan": "0"}, "colspan") == 1
+    assert cell_span({"colspan": "100000"}, "colspan") == 64
+    assert cell_span({}, "rowspan") == 1
+
+
+def test_qiangzhi_rowspan_timetable():
+    """节次列合并、课程跨两行时星期按真实列计算"""
+    pytest.importorskip("bs4")
+    from importers.qiangzhi_importer import QiangZhiImporter
+
+    cell = ('<td{attrs}><div class="kbcontent">{name}<br><font title="老师">张三</font><br>'
+            '<font title="周次(节次)">1-16(周)[{sec}节]</font><br><font title="教室">A101</font></div></td>')
+    html = (
+        '<table id="kbtable">'
+        '<tr><th colspan="2">节次</th><th>星期一</th><th>星期二</th><th>星期三</th></tr>'
+        '<tr><td rowspan="2">上午</td><td>第一大节</td>'
+        + cell.format(attrs=' rowspan="2"', name="物理实验", sec="01-04")
+        + '<td></td>' + cell.format(attrs='', name="高等数学", sec="01-02") + '</tr>'
+        '<tr><td>第二大节</td>' + cell.format(attrs='', name="大学英语", sec="03-04") + '<td></td></tr>'
+        '</table>'
+    )
+    bases, details = QiangZhiImporter().parse(html)
+    names = {b.course_id: b.name for b in bases}
+    assert sorted((names[d.course_id], d.day_of_week) for d in details) == [
+        ("大学英语", 2), ("物理实验", 1), ("高等数学", 3)]
@@ -15,7 +15,8 @@ from utils.time_utils import (
     is_even_week,
     get_week_start_date,
     get_week_end_date,
-    get_current_week
+    get_current_week,
+    parse_semester_start_date
 )
 
 
@@ -215,3 +216,10 @@ if __name__ == "__main__":
     print("=" * 50)
     print("✓ 所有时间工具函数测试通过！")
     print("=" * 50)
+
+
+def test_parse_semester_start_date():
+    """解析学期开始日期，格式无效时回退为今天"""
+    assert parse_semester_start_date("2026-09-07") == date(2026, 9, 7)
+    assert parse_semester_start_date("2026/09/07") == date.today()
+    assert parse_semester_start_date("") == date.today()
@@ -0,0 +1,114 @@
+"""
+测试学期总览（多周连续滚动）视图
+"""
+
+import os
+import sys
+from datetime import date, time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PyQt6")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from PyQt6.QtCore import QPoint, Qt
+from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QApplication, QDialog
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail, WeekType
+from models.time_slot import TimeSlot
+from core.semester_grid import SemesterGrid
+from src.ui.timeline_view import PREFETCH_WEEKS, WEEK_GAP, TimelineDialog, TimelineView
+
+SLOTS = [TimeSlot(n, time(7 + n, 0), time(7 + n, 45)) for n in range(1, 13)]
+START = date(2026, 9, 7)
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def _grid():
+    base = CourseBase(course_id="数学", name="数学", color="#FF8A80")
+    detail = CourseDetail(course_id="数学", teacher="李老师", location="A101", day_of_week=1,
+                          start_section=1, step=2, start_week=1, end_week=16,
+                          week_type=WeekType.EVERY_WEEK)
+    return SemesterGrid([(base, detail)])
+
+
+def _view():
+    view = TimelineView(SLOTS, START)
+    view.resize(800, 600)
+    view.set_grid(_grid())
+    return view
+
+
+def _scroll_and_paint(app, view, week):
+    view.scroll_to_week(week)
+    view.viewport().repaint()
+    app.processEvents()
+
+
+def test_week_at_and_scroll_range(app):
+    """滚动范围覆盖全部周，week_at 按滚动位置换算周次，间距处为 None"""
+    view = _view()
+    stride = view.block_height + WEEK_GAP
+    assert view.weeks == 16
+    bar = view.verticalScrollBar()
+    assert bar.maximum() == 16 * stride - WEEK_GAP - view.viewport().height()
+
+    assert view.week_at(0) == 1
+    assert view.week_at(view.block_height) is None
+    assert view.week_at(stride) == 2
+    view.scroll_to_week(3)
+    assert bar.value() == 2 * stride
+    assert view.week_at(10) == 3
+
+
+def test_scroll_prefetches_neighbouring_weeks(app):
+    """滚动后可见周当场渲染，前后相邻的周在线程池中预渲染"""
+    view = _view()
+    view.show()
+    _scroll_and_paint(app, view, 6)
+    view._pool.waitForDone()
+    app.processEvents()
+
+    assert set(range(6 - PREFETCH_WEEKS, 6 + PREFETCH_WEEKS + 1)) <= set(view._images)
+    assert not view._pending and not view._tasks
+    view.hide()
+
+
+def test_stale_generation_renders_dropped(app):
+    """课程等变化后，旧版本的预渲染结果到达时被丢弃"""
+    view = _view()
+    view.show()
+    _scroll_and_paint(app, view, 6)
+    assert view._pending
+    # 隐藏后不再重绘，只观察旧任务的结果
+    view.hide()
+    view.set_course_opacity(0.5)
+    view._pool.waitForDone()
+    app.processEvents()
+
+    assert not view._images and not view._pending and not view._tasks
+
+
+def test_dialog_emits_selected_week(app):
+    """总览窗口打开时滚动到当前周，双击后发出所选周次并关闭"""
+    dialog = TimelineDialog(_grid(), SLOTS, START, current_week=3)
+    selected = []
+    dialog.week_selected.connect(selected.append)
+    dialog.show()
+    app.processEvents()
+
+    QTest.mouseDClick(dialog.timeline.viewport(), Qt.MouseButton.LeftButton, pos=QPoint(100, 100))
+    assert selected == [3]
+    assert dialog.result() == QDialog.DialogCode.Accepted
+    dialog.timeline._pool.waitForDone()
+    app.processEvents()
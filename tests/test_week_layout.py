@@ -0,0 +1,102 @@
+"""
+测试周课表卡片布局
+"""
+
+import sys
+from datetime import date, time, timedelta
+from pathlib import Path
+
+# 添加 src 目录到路径
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from models.course_base import CourseBase
+from models.course_detail import CourseDetail, WeekType
+from models.time_slot import TimeSlot
+from core.semester_grid import SemesterGrid
+from core.week_calculator import WeekCalculator
+from core.week_layout import WeekHeaderLabels, WeekLayout, section_rows, visible_weeks, week_cards
+
+
+def _course(name, day, start, step=2, weeks=(1, 16), week_type=WeekType.EVERY_WEEK):
+    base = CourseBase(course_id=name, name=name, color="#FF8A80")
+    detail = CourseDetail(course_id=name, teacher="", location="", day_of_week=day,
+                          start_section=start, step=step, start_week=weeks[0],
+                          end_week=weeks[1], week_type=week_type)
+    return base, detail
+
+
+def _slots(numbers):
+    return [TimeSlot(n, time(8, 0), time(8, 45)) for n in numbers]
+
+
+def test_cards_follow_grid_placements():
+    """卡片的行列与跨行数来自节次和星期"""
+    courses = [_course("数学", 1, 1), _course("英语", 3, 5, step=3),
+               _course("体育", 5, 3, week_type=WeekType.ODD_WEEK)]
+    layout = WeekLayout(SemesterGrid(courses), _slots(range(1, 13)))
+
+    cards = {c.base.name: c for c in layout.cards(1)}
+    assert (cards["数学"].row, cards["数学"].column, cards["数学"].row_span) == (0, 1, 2)
+    assert (cards["英语"].row, cards["英语"].column, cards["英语"].row_span) == (4, 3, 3)
+    assert "体育" in cards
+    assert "体育" not in {c.base.name for c in layout.cards(2)}
+
+
+def test_conflicting_course_is_not_drawn():
+    """冲突课程只画先出现的一门，与课表视图一致"""
+    courses = [_course("A", 2, 1, step=2), _course("B", 2, 2, step=2)]
+    cards = week_cards(SemesterGrid(courses), 1, section_rows(_slots(range(1, 13))))
+    assert [c.base.name for c in cards] == ["A"]
+
+
+def test_custom_time_slots_and_clipping():
+    """节次不连续的作息时间：按行号映射，缺失的节次不显示，跨行截断到表格底部"""
+    courses = [_course("早课", 1, 1), _course("晚课", 2, 5, step=3), _course("缺节", 3, 9)]
+    layout = WeekLayout(SemesterGrid(courses), _slots([1, 2, 5, 6]))
+    cards = {c.base.name: c for c in layout.cards(1)}
+    assert set(cards) == {"早课", "晚课"}
+    assert (cards["晚课"].row, cards["晚课"].row_span) == (2, 2)
+
+
+def test_occupancy_covers_spanned_cells_and_caches():
+    """占用表包含跨行覆盖的格子；同一周的布局只计算一次"""
+    layout = WeekLayout(SemesterGrid([_course("数学", 4, 3, step=3)]), _slots(range(1, 13)))
+    occupancy = layout.occupancy(1)
+    assert set(occupancy) == {(2, 4), (3, 4), (4, 4)}
+    assert layout.cards(1) is layout.cards(1)
+    assert layout.cards(30) == []
+
+
+def test_visible_weeks():
+    """只有与可见区域相交的周需要绘制"""
+    assert visible_weeks(0, 500, 600, 20) == range(1, 2)
+    assert visible_weeks(0, 1300, 600, 20, gap=20) == range(1, 4)
+    assert visible_weeks(610, 100, 600, 20, gap=20) == range(2, 3)  # 顶部在间距中
+    assert visible_weeks(600 * 19, 2000, 600, 20) == range(20, 21)
+    assert visible_weeks(0, 500, 600, 0) == range(0)
+
+
+def test_week_header_labels():
+    """整学期表头文字预先算好，今天所在列按日期差计算"""
+    labels = WeekHeaderLabels(date(2024, 9, 2), weeks=20)
+    assert labels.texts(1)[0] == "周一\n09/02"
+    assert labels.texts(2)[6] == "周日\n09/15"
+    assert labels.texts(1) is labels.texts(1)
+    assert labels.today_column(2, date(2024, 9, 11)) == 3
+    assert labels.today_column(1, date(2024, 9, 11)) == -1
+    # 超出预先计算的范围时按需补上
+    assert labels.dates(25)[0] == date(2024, 9, 2) + timedelta(weeks=24)
+
+
+def test_week_header_labels_match_real_weekdays():
+    """学期不从周一开始时，各列仍是真实的星期几，与导出使用的 WeekCalculator.date_of 一致"""
+    start = date(2024, 9, 4)  # 周三
+    labels = WeekHeaderLabels(start, weeks=3)
+    calculator = WeekCalculator(start)
+    for week in (1, 2, 5):
+        assert labels.dates(week) == tuple(calculator.date_of(week, day) for day in range(1, 8))
+        assert all(d.isoweekday() == i for i, d in enumerate(labels.dates(week), 1))
+    assert labels.texts(1)[0] == "周一\n09/09"
+    assert labels.texts(1)[2] == "周三\n09/04"
+    assert labels.today_column(1, date(2024, 9, 9)) == 1
+    assert labels.today_column(1, date(2024, 9, 2)) == -1